@@ -32,10 +32,13 @@ if config.config_file_name is not None:
 # Import Base and model modules so tables are registered in metadata
 from app.db.base import Base  # noqa: E402
 from app.core.auth.persistence.models import user as _user  # noqa: F401, E402
+from app.core.auth.persistence.models import refresh_token as _refresh_token  # noqa: F401, E402
+from app.core.auth.persistence.models import revoked_token as _revoked_token  # noqa: F401, E402
 from app.modules.finance.infrastructure.persistence.models import account as _fin_account  # noqa: F401, E402
 from app.modules.finance.infrastructure.persistence.models import category as _fin_category  # noqa: F401, E402
 from app.modules.finance.infrastructure.persistence.models import transaction as _fin_transaction  # noqa: F401, E402
 from app.modules.finance.infrastructure.persistence.models import transfer as _fin_transfer  # noqa: F401, E402
+from app.modules.finance.infrastructure.persistence.models import tombstone as _fin_tombstone  # noqa: F401, E402
 
 target_metadata: MetaData = Base.metadata
 
@@ -0,0 +1,214 @@
+"""partition transactions by month (PostgreSQL)
+
+Revision ID: a8b9c0d1e2f3
+Revises: f7a8b9c0d1e2
+Create Date: 2025-11-19 09:00:00.000000
+
+Online on PostgreSQL: the partitioned copy (`transactions_p`, range-partitioned
+on occurred_at with primary key (id, occurred_at)) is created next to the live
+table, a trigger mirrors writes made to `transactions` while rows are copied
+in id batches (one short transaction each, TRANSACTIONS_PARTITION_BATCH rows),
+then both tables are swapped by renames under a brief exclusive lock. The old
+heap is kept as `transactions_old`, without its foreign keys; drop it once
+the new layout is verified.
+Monthly partitions start at the 1st percentile of occurred_at, at most
+TRANSACTIONS_PARTITION_MONTHS_BACK (120) months back; older rows go to the
+default partition (the migration logs how many).
+
+Other dialects (SQLite in tests/dev) keep the plain table: no-op.
+"""
+import datetime as dt
+import logging
+import os
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.partitioning import (
+    add_months,
+    create_default_partition_sql,
+    create_partition_sql,
+    month_start,
+    months_between,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8b9c0d1e2f3'
+down_revision: Union[str, Sequence[str], None] = 'f7a8b9c0d1e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+logger = logging.getLogger('alembic.runtime.migration')
+
+_MONTHS_AHEAD = 3
+_INDEXES = {
+    'ix_transactions_user_occurred_at': '(user_id, occurred_at)',
+    'ix_transactions_user_account': '(user_id, account_id)',
+    'ix_transactions_user_category': '(user_id, category_id)',
+    'ix_transactions_user_updated_at': '(user_id, updated_at)',
+}
+_FOREIGN_KEYS = {
+    'transactions_user_id_fkey': 'FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE',
+    'transactions_account_id_fkey': 'FOREIGN KEY (account_id) REFERENCES accounts (id) ON DELETE RESTRICT',
+    'transactions_category_id_fkey': 'FOREIGN KEY (category_id) REFERENCES categories (id) ON DELETE SET NULL',
+    'fk_transactions_transfer': 'FOREIGN KEY (transfer_id) REFERENCES transfers (id) ON DELETE SET NULL',
+}
+
+# Keyed by (id, occurred_at) of the row version being replaced: the copy only
+# ever holds current versions (batches lock what they read, see _COPY_BATCH)
+_MIRROR_FUNCTION = """
+CREATE OR REPLACE FUNCTION transactions_partition_mirror() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        DELETE FROM transactions_p WHERE id = OLD.id AND occurred_at = OLD.occurred_at;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO transactions_p SELECT NEW.* ON CONFLICT DO NOTHING;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+# FOR SHARE: a concurrent update of a row in the batch either waits for the
+# batch to commit (and is then mirrored) or commits first and the batch copies
+# the new version; ON CONFLICT skips rows the trigger already mirrored
+_COPY_BATCH = """
+INSERT INTO transactions_p
+SELECT * FROM transactions WHERE id > :lo AND id <= :hi FOR SHARE
+ON CONFLICT DO NOTHING
+"""
+
+
+def _is_partitioned(bind: sa.engine.Connection) -> bool:
+    return bool(
+        bind.execute(
+            sa.text(
+                "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+                "WHERE c.relname = 'transactions' AND pg_table_is_visible(c.oid)"
+            )
+        ).scalar()
+    )
+
+
+def _batch_size() -> int:
+    try:
+        return max(1, int(os.getenv('TRANSACTIONS_PARTITION_BATCH', '10000')))
+    except ValueError:
+        return 10000
+
+
+def _months_back() -> int:
+    try:
+        return max(0, int(os.getenv('TRANSACTIONS_PARTITION_MONTHS_BACK', '120')))
+    except ValueError:
+        return 120
+
+
+def _first_month(bind: sa.engine.Connection, today: dt.date) -> dt.date:
+    """Oldest month that gets its own partition.
+
+    Starts at the 1st percentile of occurred_at (a few mistyped dates must not
+    create thousands of partitions), never more than TRANSACTIONS_PARTITION_MONTHS_BACK
+    months before today. Older rows stay in the default partition.
+    """
+    floor = add_months(today, -_months_back())
+    p01 = bind.execute(
+        sa.text("SELECT percentile_disc(0.01) WITHIN GROUP (ORDER BY occurred_at) FROM transactions")
+    ).scalar()
+    first = max(p01.astimezone(dt.timezone.utc).date(), floor) if p01 is not None else today
+    first = min(month_start(first), month_start(today))
+    cutoff = dt.datetime(first.year, first.month, 1, tzinfo=dt.timezone.utc)
+    older, oldest = bind.execute(
+        sa.text("SELECT count(*), min(occurred_at) FROM transactions WHERE occurred_at < :cutoff"),
+        {'cutoff': cutoff},
+    ).one()
+    if older:
+        logger.warning(
+            "transactions: no monthly partitions before %s; %s older rows (oldest %s) go to transactions_default",
+            first.isoformat(), older, oldest,
+        )
+    return first
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql' or _is_partitioned(bind):
+        return
+
+    # 1. Empty partitioned twin with the same columns/defaults (id keeps using
+    #    transactions_id_seq); the partition key must be part of the primary key
+    op.execute(
+        "CREATE TABLE transactions_p (LIKE transactions INCLUDING DEFAULTS) "
+        "PARTITION BY RANGE (occurred_at)"
+    )
+    op.execute("ALTER TABLE transactions_p ADD CONSTRAINT transactions_p_pkey PRIMARY KEY (id, occurred_at)")
+    for name, definition in _FOREIGN_KEYS.items():
+        op.execute(f"ALTER TABLE transactions_p ADD CONSTRAINT {name} {definition}")
+    for name, columns in _INDEXES.items():
+        op.execute(f"CREATE INDEX {name}_p ON transactions_p {columns}")
+
+    # 2. One partition per month from the oldest (capped, see _first_month) to a
+    #    few months ahead, plus a default partition for anything outside them
+    today = dt.datetime.now(dt.timezone.utc).date()
+    for month in months_between(_first_month(bind, today), add_months(today, _MONTHS_AHEAD)):
+        op.execute(create_partition_sql('transactions', month, parent='transactions_p'))
+    op.execute(create_default_partition_sql('transactions', parent='transactions_p'))
+
+    # 3. Mirror live writes, then copy existing rows in small committed batches
+    op.execute(_MIRROR_FUNCTION)
+    op.execute(
+        "CREATE TRIGGER transactions_partition_mirror AFTER INSERT OR UPDATE OR DELETE ON transactions "
+        "FOR EACH ROW EXECUTE FUNCTION transactions_partition_mirror()"
+    )
+    with op.get_context().autocommit_block():
+        lo, hi = bind.execute(sa.text("SELECT min(id), max(id) FROM transactions")).one()
+        if lo is not None:
+            size = _batch_size()
+            start = lo - 1
+            while start < hi:
+                bind.execute(sa.text(_COPY_BATCH), {'lo': start, 'hi': start + size})
+                start += size
+
+    # 4. Swap under a short exclusive lock (fails fast instead of queueing
+    #    behind long transactions; rerun the migration to retry)
+    op.execute("SET LOCAL lock_timeout = '10s'")
+    op.execute("LOCK TABLE transactions IN ACCESS EXCLUSIVE MODE")
+    op.execute("DROP TRIGGER transactions_partition_mirror ON transactions")
+    op.execute("DROP FUNCTION transactions_partition_mirror()")
+    op.execute("ALTER TABLE transactions RENAME TO transactions_old")
+    op.execute("ALTER TABLE transactions_old RENAME CONSTRAINT transactions_pkey TO transactions_old_pkey")
+    # The old heap is a backup only: its foreign keys would keep blocking
+    # account deletes (RESTRICT) and rewriting it on category/transfer deletes
+    for name in _FOREIGN_KEYS:
+        op.execute(f"ALTER TABLE transactions_old DROP CONSTRAINT IF EXISTS {name}")
+    for name in _INDEXES:
+        op.execute(f"ALTER INDEX {name} RENAME TO {name}_old")
+        op.execute(f"ALTER INDEX {name}_p RENAME TO {name}")
+    op.execute("ALTER TABLE transactions_p RENAME TO transactions")
+    op.execute("ALTER TABLE transactions RENAME CONSTRAINT transactions_p_pkey TO transactions_pkey")
+    # Dropping transactions_old later must not take the id sequence with it
+    op.execute("ALTER SEQUENCE transactions_id_seq OWNED BY transactions.id")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql' or not _is_partitioned(bind):
+        return
+
+    # Offline: rebuild the plain heap from the partitions under a lock
+    op.execute("DROP TABLE IF EXISTS transactions_old")
+    op.execute("LOCK TABLE transactions IN ACCESS EXCLUSIVE MODE")
+    op.execute("CREATE TABLE transactions_heap (LIKE transactions INCLUDING DEFAULTS)")
+    op.execute("INSERT INTO transactions_heap SELECT * FROM transactions")
+    op.execute("ALTER SEQUENCE transactions_id_seq OWNED BY transactions_heap.id")
+    op.execute("DROP TABLE transactions")
+    op.execute("ALTER TABLE transactions_heap RENAME TO transactions")
+    op.execute("ALTER TABLE transactions ADD CONSTRAINT transactions_pkey PRIMARY KEY (id)")
+    for name, definition in _FOREIGN_KEYS.items():
+        op.execute(f"ALTER TABLE transactions ADD CONSTRAINT {name} {definition}")
+    for name, columns in _INDEXES.items():
+        op.execute(f"CREATE INDEX {name} ON transactions {columns}")
@@ -0,0 +1,133 @@
+"""transactions covering/partial indexes for hot queries
+
+Revision ID: b9c0d1e2f3a4
+Revises: a8b9c0d1e2f3
+Create Date: 2025-11-20 09:00:00.000000
+
+- ix_transactions_user_occurred_active: (user_id, occurred_at) WHERE voided IS false,
+  INCLUDE (account_id, category_id, amount_cents) on PostgreSQL, so month
+  reports read transactions with an index-only scan. The predicate is spelled
+  the way the ORM renders `voided.is_(False)` so the planner matches it.
+- ix_transactions_transfer_id: transfer legs lookup (void_transfer).
+
+PostgreSQL builds them with CREATE INDEX CONCURRENTLY (no write lock). A
+partitioned table cannot be indexed concurrently as a whole: the parent index
+is created ON ONLY (invalid, no data), each partition is indexed concurrently
+and attached, and the parent becomes valid once all partitions are attached.
+Partitions created later inherit the index.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9c0d1e2f3a4'
+down_revision: Union[str, Sequence[str], None] = 'a8b9c0d1e2f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_PG_INDEXES = {
+    'ix_transactions_user_occurred_active': (
+        '(user_id, occurred_at) INCLUDE (account_id, category_id, amount_cents) WHERE voided IS false'
+    ),
+    'ix_transactions_transfer_id': '(transfer_id) WHERE transfer_id IS NOT NULL',
+}
+
+
+def _partitions(bind: sa.engine.Connection) -> list[str] | None:
+    """Partition names of transactions, or None when it is a plain table."""
+    partitioned = bind.execute(
+        sa.text(
+            "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+            "WHERE c.relname = 'transactions' AND pg_table_is_visible(c.oid)"
+        )
+    ).scalar()
+    if not partitioned:
+        return None
+    return list(
+        bind.execute(
+            sa.text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "JOIN pg_class p ON p.oid = i.inhparent "
+                "WHERE p.relname = 'transactions' ORDER BY c.relname"
+            )
+        ).scalars()
+    )
+
+
+def _create_concurrently(bind: sa.engine.Connection, name: str, table: str, definition: str) -> None:
+    # A previous interrupted run leaves an INVALID index behind: rebuild it
+    valid = bind.execute(
+        sa.text("SELECT i.indisvalid FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = :name"),
+        {'name': name},
+    ).scalar()
+    if valid is False:
+        bind.execute(sa.text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+    elif valid:
+        return
+    bind.execute(sa.text(f"CREATE INDEX CONCURRENTLY {name} ON {table} {definition}"))
+
+
+def _upgrade_postgresql(bind: sa.engine.Connection) -> None:
+    partitions = _partitions(bind)
+    for name, definition in _PG_INDEXES.items():
+        if partitions is None:
+            _create_concurrently(bind, name, 'transactions', definition)
+            continue
+        bind.execute(sa.text(f"CREATE INDEX IF NOT EXISTS {name} ON ONLY transactions {definition}"))
+        for partition in partitions:
+            child = f"{partition}_{name.removeprefix('ix_transactions_')}_idx"
+            _create_concurrently(bind, child, partition, definition)
+            attached = bind.execute(
+                sa.text(
+                    "SELECT 1 FROM pg_inherits i "
+                    "JOIN pg_class c ON c.oid = i.inhrelid JOIN pg_class p ON p.oid = i.inhparent "
+                    "WHERE c.relname = :child AND p.relname = :parent"
+                ),
+                {'child': child, 'parent': name},
+            ).scalar()
+            if not attached:
+                bind.execute(sa.text(f"ALTER INDEX {name} ATTACH PARTITION {child}"))
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            _upgrade_postgresql(bind)
+        return
+    op.create_index(
+        'ix_transactions_user_occurred_active',
+        'transactions',
+        ['user_id', 'occurred_at'],
+        unique=False,
+        sqlite_where=sa.text('voided IS 0'),
+    )
+    op.create_index(
+        'ix_transactions_transfer_id',
+        'transactions',
+        ['transfer_id'],
+        unique=False,
+        sqlite_where=sa.text('transfer_id IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        # Dropping the parent index of a partitioned table drops the attached
+        # partition indexes; CONCURRENTLY is not supported there
+        if _partitions(bind) is None:
+            with op.get_context().autocommit_block():
+                for name in _PG_INDEXES:
+                    op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+        else:
+            for name in _PG_INDEXES:
+                op.execute(f"DROP INDEX IF EXISTS {name}")
+        return
+    op.drop_index('ix_transactions_transfer_id', table_name='transactions')
+    op.drop_index('ix_transactions_user_occurred_active', table_name='transactions')
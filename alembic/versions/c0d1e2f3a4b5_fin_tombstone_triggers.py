@@ -0,0 +1,36 @@
+"""record finance tombstones with AFTER DELETE triggers
+
+Revision ID: c0d1e2f3a4b5
+Revises: b9c0d1e2f3a4
+Create Date: 2025-11-21 09:00:00.000000
+
+The ORM `after_delete` listener missed bulk `delete()` statements and
+foreign-key cascades; the triggers see every deleted row. On PostgreSQL the
+transactions trigger is declared on the partitioned parent, so existing and
+future partitions share it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.modules.finance.infrastructure.persistence.models.tombstone import (
+    drop_tombstone_triggers_sql,
+    tombstone_triggers_sql,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c0d1e2f3a4b5'
+down_revision: Union[str, Sequence[str], None] = 'b9c0d1e2f3a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    for statement in tombstone_triggers_sql(op.get_bind().dialect.name):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    for statement in drop_tombstone_triggers_sql(op.get_bind().dialect.name):
+        op.execute(statement)
@@ -0,0 +1,28 @@
+"""transfers (user_id, occurred_at) index
+
+Revision ID: c4d5e6f7a8b9
+Revises: ab12cd34ef56
+Create Date: 2025-11-10 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d5e6f7a8b9'
+down_revision: Union[str, Sequence[str], None] = 'ab12cd34ef56'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Backs the keyset-paginated GET /fin/transfers listing
+    op.create_index(
+        'ix_transfers_user_occurred_at', 'transfers', ['user_id', 'occurred_at'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_transfers_user_occurred_at', table_name='transfers')
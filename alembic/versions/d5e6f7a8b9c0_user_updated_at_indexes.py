@@ -0,0 +1,32 @@
+"""(user_id, updated_at) indexes for collection versions
+
+Revision ID: d5e6f7a8b9c0
+Revises: c4d5e6f7a8b9
+Create Date: 2025-11-14 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5e6f7a8b9c0'
+down_revision: Union[str, Sequence[str], None] = 'c4d5e6f7a8b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ('accounts', 'categories', 'transactions')
+
+
+def upgrade() -> None:
+    # Back count + max(updated_at) per user, used as the list ETag version
+    for table in _TABLES:
+        op.create_index(
+            f'ix_{table}_user_updated_at', table, ['user_id', 'updated_at'], unique=False
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(_TABLES):
+        op.drop_index(f'ix_{table}_user_updated_at', table_name=table)
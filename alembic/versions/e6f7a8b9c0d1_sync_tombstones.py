@@ -0,0 +1,45 @@
+"""sync tombstones and transfers (user_id, updated_at) index
+
+Revision ID: e6f7a8b9c0d1
+Revises: d5e6f7a8b9c0
+Create Date: 2025-11-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6f7a8b9c0d1'
+down_revision: Union[str, Sequence[str], None] = 'd5e6f7a8b9c0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Hard deletes of synced rows, read by GET /fin/sync
+    op.create_table(
+        'fin_tombstones',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('entity', sa.String(length=20), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_fin_tombstones_user_deleted_at', 'fin_tombstones', ['user_id', 'deleted_at'], unique=False
+    )
+    # accounts/categories/transactions got theirs in d5e6f7a8b9c0
+    op.create_index(
+        'ix_transfers_user_updated_at', 'transfers', ['user_id', 'updated_at'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_transfers_user_updated_at', table_name='transfers')
+    op.drop_index('ix_fin_tombstones_user_deleted_at', table_name='fin_tombstones')
+    op.drop_table('fin_tombstones')
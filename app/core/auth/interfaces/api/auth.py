@@ -1,20 +1,63 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import datetime as dt
+import time
+import uuid
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_session
 from app.core.auth.persistence.models.user import User
 from typing import Any
 from app.core.auth.schemas.user import UserCreate, UserOut
-from app.core.auth.schemas.token import Token
-from app.core.auth.security import verify_password, create_access_token, get_current_user
+from app.core.auth.schemas.token import RefreshRequest, Token
+from app.core.auth.security import (
+    Principal,
+    create_access_token,
+    get_current_principal,
+    get_current_user,
+    hash_password_async,
+    hash_refresh_token,
+    new_refresh_token,
+    password_needs_rehash,
+    verify_password_async,
+)
+from app.core.auth.revocation import revocation_store
+from app.core.rate_limit import rate_limit_by_ip
 from app.core.settings import get_settings, Settings
-from app.core.auth.persistence.user_repository import get_user_by_email, create_user
+from app.core.auth.persistence.user_repository import get_user_by_email, create_user, update_password_hash
+from app.core.auth.persistence.token_repository import (
+    add_refresh_token,
+    get_refresh_token,
+    purge_expired_tokens,
+    revoke_refresh_family,
+)
 
 
 router = APIRouter(prefix="/auth", tags=["auth"])
+# Argon2 makes these the most expensive requests to serve per call
+_limited = [Depends(rate_limit_by_ip("auth"))]
+
+
+# Monotonic time after which the next login may purge expired token rows
+_next_purge = 0.0
+
+
+async def _purge_expired_tokens_if_due(session: AsyncSession, interval: float) -> None:
+    """Purge at most once per `interval` seconds in this process, so a burst of
+    logins does not turn into a burst of DELETEs on the token tables."""
+    global _next_purge
+    now = time.monotonic()
+    if now < _next_purge:
+        return
+    _next_purge = now + interval  # claimed before awaiting: concurrent logins skip
+    await purge_expired_tokens(session)
 
 
-@router.post("/register", response_model=UserOut, status_code=status.HTTP_201_CREATED)
+def _as_utc(value: dt.datetime) -> dt.datetime:
+    return value.replace(tzinfo=dt.timezone.utc) if value.tzinfo is None else value
+
+
+@router.post("/register", response_model=UserOut, status_code=status.HTTP_201_CREATED, dependencies=_limited)
 async def register(user_in: UserCreate, session: AsyncSession = Depends(get_session)) -> UserOut:
     existing = await get_user_by_email(session, user_in.email)
     if existing:
@@ -23,19 +66,91 @@ async def register(user_in: UserCreate, session: AsyncSession = Depends(get_sess
     return UserOut.model_validate(user)
 
 
-@router.post("/login", response_model=Token)
+@router.post("/login", response_model=Token, dependencies=_limited)
 async def login(
     user_in: UserCreate,
     session: AsyncSession = Depends(get_session),
     settings: Settings = Depends(get_settings),
 ) -> Token:
     user = await get_user_by_email(session, user_in.email)
-    if not user or not verify_password(user_in.password, user.hashed_password):
+    if not user or not await verify_password_async(user_in.password, user.hashed_password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
-    token = create_access_token({"sub": user.email}, settings)
-    return Token(access_token=token)
+    if password_needs_rehash(user.hashed_password):
+        # Cost parameters changed since this hash was made: upgrade it transparently
+        await update_password_hash(session, user, await hash_password_async(user_in.password))
+    # Logins are rare next to refreshes: a good moment to drop expired token rows
+    await _purge_expired_tokens_if_due(session, settings.token_purge_interval_seconds)
+    refresh, refresh_hash = new_refresh_token()
+    await add_refresh_token(
+        session,
+        user_id=user.id,
+        family_id=uuid.uuid4().hex,
+        token_hash=refresh_hash,
+        expires_at=dt.datetime.now(dt.timezone.utc) + dt.timedelta(days=settings.refresh_token_expire_days),
+    )
+    token = create_access_token({"sub": user.email, "uid": user.id}, settings)
+    return Token(access_token=token, refresh_token=refresh)
+
+
+@router.post("/refresh", response_model=Token, dependencies=_limited)
+async def refresh(
+    body: RefreshRequest,
+    session: AsyncSession = Depends(get_session),
+    settings: Settings = Depends(get_settings),
+) -> Token:
+    """Exchange a refresh token for a new access token and a new refresh token.
+
+    Each refresh token works once. Presenting one that was already rotated
+    means it leaked (or a client raced itself): the whole family is revoked
+    and the user has to log in again.
+    """
+    current = await get_refresh_token(session, hash_refresh_token(body.refresh_token))
+    if current is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
+    family_id = current.family_id
+    if current.revoked_at is not None:
+        await revoke_refresh_family(session, family_id)
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token reused")
+    now = dt.datetime.now(dt.timezone.utc)
+    if _as_utc(current.expires_at) <= now:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token expired")
+    user = await session.get(User, current.user_id)
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+
+    new_refresh, new_hash = new_refresh_token()
+    rotated = await add_refresh_token(
+        session,
+        user_id=user.id,
+        family_id=family_id,
+        token_hash=new_hash,
+        expires_at=now + dt.timedelta(days=settings.refresh_token_expire_days),
+        replaces=current,
+    )
+    if not rotated:
+        # Lost a race with another refresh of the same token (the rollback expired `current`)
+        await revoke_refresh_family(session, family_id)
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token reused")
+    token = create_access_token({"sub": user.email, "uid": user.id}, settings)
+    return Token(access_token=token, refresh_token=new_refresh)
 
 
 @router.get("/me", response_model=UserOut)
 async def read_me(current_user: User = Depends(get_current_user)) -> UserOut:
     return UserOut.model_validate(current_user)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    body: RefreshRequest | None = None,
+    principal: Principal = Depends(get_current_principal),
+    session: AsyncSession = Depends(get_session),
+) -> Response:
+    """Revoke the presented access token and, when given, its refresh token family."""
+    if principal.jti and principal.expires_at:
+        await revocation_store.revoke(session, principal.jti, principal.expires_at)
+    if body is not None:
+        current = await get_refresh_token(session, hash_refresh_token(body.refresh_token))
+        if current is not None and current.user_id == principal.id:
+            await revoke_refresh_family(session, current.family_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,76 @@
+import datetime as dt
+from typing import Optional, Sequence
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.auth.persistence.models.refresh_token import RefreshToken
+from app.core.auth.persistence.models.revoked_token import RevokedToken
+
+
+def _now() -> dt.datetime:
+    return dt.datetime.now(dt.timezone.utc)
+
+
+async def get_refresh_token(session: AsyncSession, token_hash: str) -> Optional[RefreshToken]:
+    result = await session.execute(select(RefreshToken).where(RefreshToken.token_hash == token_hash))
+    return result.scalars().first()
+
+
+async def add_refresh_token(
+    session: AsyncSession,
+    *,
+    user_id: int,
+    family_id: str,
+    token_hash: str,
+    expires_at: dt.datetime,
+    replaces: RefreshToken | None = None,
+) -> bool:
+    """Store a refresh token. With `replaces`, retire that token in the same commit.
+
+    Returns False (and stores nothing) when `replaces` was already retired,
+    i.e. a concurrent request rotated it first.
+    """
+    if replaces is not None:
+        result = await session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.id == replaces.id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=_now())
+        )
+        if result.rowcount != 1:  # type: ignore[attr-defined]
+            await session.rollback()
+            return False
+    session.add(RefreshToken(user_id=user_id, family_id=family_id, token_hash=token_hash, expires_at=expires_at))
+    await session.commit()
+    return True
+
+
+async def revoke_refresh_family(session: AsyncSession, family_id: str) -> None:
+    await session.execute(
+        update(RefreshToken)
+        .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=_now())
+    )
+    await session.commit()
+
+
+async def revoke_access_token(session: AsyncSession, jti: str, expires_at: dt.datetime) -> None:
+    await session.merge(RevokedToken(jti=jti, expires_at=expires_at))
+    await session.commit()
+
+
+async def is_access_token_revoked(session: AsyncSession, jti: str) -> bool:
+    result = await session.execute(select(RevokedToken.jti).where(RevokedToken.jti == jti))
+    return result.first() is not None
+
+
+async def active_revoked_jtis(session: AsyncSession) -> Sequence[str]:
+    result = await session.execute(select(RevokedToken.jti).where(RevokedToken.expires_at > _now()))
+    return result.scalars().all()
+
+
+async def purge_expired_tokens(session: AsyncSession) -> None:
+    now = _now()
+    await session.execute(delete(RevokedToken).where(RevokedToken.expires_at <= now))
+    await session.execute(delete(RefreshToken).where(RefreshToken.expires_at <= now))
+    await session.commit()
@@ -13,9 +13,9 @@ async def get_user_by_email(session: AsyncSession, email: str) -> Optional[User]
 
 
 async def create_user(session: AsyncSession, email: str, password: str) -> User:
-    from app.core.auth.security import get_password_hash  # local import to avoid circular deps
+    from app.core.auth.security import hash_password_async  # local import to avoid circular deps
 
-    user = User(email=email, hashed_password=get_password_hash(password))
+    user = User(email=email, hashed_password=await hash_password_async(password))
     session.add(user)
     try:
         await session.commit()
@@ -24,3 +24,9 @@ async def create_user(session: AsyncSession, email: str, password: str) -> User:
         raise
     await session.refresh(user)
     return user
+
+
+async def update_password_hash(session: AsyncSession, user: User, hashed_password: str) -> None:
+    user.hashed_password = hashed_password
+    session.add(user)
+    await session.commit()
@@ -0,0 +1,131 @@
+"""Access-token revocation checked without a DB round-trip on the hot path.
+
+Revocations are written to `revoked_tokens`. Each process keeps the ones it
+recorded itself in an exact in-memory list, plus a Bloom filter snapshot of the
+whole table, reloaded at most every `max_age` seconds. A token missing from
+both is accepted right away; a Bloom hit is confirmed against the table, so
+false positives cost one query and never reject a valid token. Revocations made
+by another worker take effect there once its snapshot is reloaded.
+"""
+import datetime as dt
+import hashlib
+import math
+import time
+from collections.abc import Iterable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.auth.persistence.token_repository import (
+    active_revoked_jtis,
+    is_access_token_revoked,
+    revoke_access_token,
+)
+from app.core.singleflight import SingleFlight
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (double hashing on one blake2b digest)."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        capacity = max(capacity, 1)
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    @classmethod
+    def from_items(cls, items: Iterable[str], error_rate: float = 0.01) -> "BloomFilter":
+        items = list(items)
+        bloom = cls(len(items), error_rate)
+        for item in items:
+            bloom.add(item)
+        return bloom
+
+    def _positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class RevocationList:
+    """In-memory set of revoked token ids (`jti`), each kept until the token expires."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, float] = {}
+
+    def revoke(self, jti: str, expires_at: float) -> None:
+        self._entries[jti] = expires_at
+        self._purge()
+
+    def is_revoked(self, jti: str | None) -> bool:
+        if jti is None or not self._entries:
+            return False
+        expires_at = self._entries.get(jti)
+        if expires_at is None:
+            return False
+        if expires_at <= time.time():
+            del self._entries[jti]
+            return False
+        return True
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _purge(self) -> None:
+        now = time.time()
+        for jti in [j for j, exp in self._entries.items() if exp <= now]:
+            del self._entries[jti]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RevocationStore:
+    def __init__(self) -> None:
+        self.local = RevocationList()
+        self._snapshot: BloomFilter | None = None
+        self._loaded_at = 0.0
+        self._loads: SingleFlight[BloomFilter] = SingleFlight("revocation_snapshot")
+
+    async def revoke(self, session: AsyncSession, jti: str, expires_at: int) -> None:
+        await revoke_access_token(session, jti, dt.datetime.fromtimestamp(expires_at, dt.timezone.utc))
+        self.local.revoke(jti, expires_at)
+
+    async def is_revoked(self, session: AsyncSession, jti: str | None, *, max_age: float) -> bool:
+        if jti is None:
+            return False
+        if self.local.is_revoked(jti):
+            return True
+        now = time.monotonic()
+        snapshot = self._snapshot
+        if snapshot is None:
+            # Cold (startup or clear()): concurrent requests share one load
+            snapshot = await self._loads.do("snapshot", lambda: self._load(session))
+        elif now - self._loaded_at >= max_age:
+            # Stale: claimed before awaiting so concurrent requests keep the old snapshot
+            self._loaded_at = now
+            snapshot = await self._load(session)
+        if jti not in snapshot:
+            return False
+        return await is_access_token_revoked(session, jti)
+
+    async def _load(self, session: AsyncSession) -> BloomFilter:
+        started = time.monotonic()
+        snapshot = BloomFilter.from_items(await active_revoked_jtis(session))
+        self._snapshot, self._loaded_at = snapshot, started
+        return snapshot
+
+    def clear(self) -> None:
+        self.local.clear()
+        self._snapshot = None
+        self._loaded_at = 0.0
+
+
+revocation_store = RevocationStore()
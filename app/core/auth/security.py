@@ -1,62 +1,176 @@
+import asyncio
 import datetime as dt
-from typing import Any, Optional
+import hashlib
+import secrets
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
 
 from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import jwt
 from jwt import PyJWTError
-from starlette.requests import Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.settings import get_settings, Settings
 from app.core.auth.persistence.models.user import User
 from app.core.auth.persistence.user_repository import get_user_by_email
-from app.db.session import get_session
+from app.core.auth.revocation import revocation_store
+from app.db.session import get_session, tag_session_user
 
 
-_hasher = PasswordHasher()
 _http_bearer = HTTPBearer(auto_error=False)
+_executor: ThreadPoolExecutor | None = None
+
+
+@lru_cache(maxsize=4)
+def _hasher_for(time_cost: int, memory_cost: int, parallelism: int) -> PasswordHasher:
+    return PasswordHasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+
+
+def _hasher() -> PasswordHasher:
+    s = get_settings()
+    return _hasher_for(s.argon2_time_cost, s.argon2_memory_cost, s.argon2_parallelism)
+
+
+def _hash_executor() -> ThreadPoolExecutor:
+    # Bounded: a login storm queues here instead of starving the default executor
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=get_settings().password_hash_workers, thread_name_prefix="argon2"
+        )
+    return _executor
 
 
 def get_password_hash(password: str) -> str:
-    return _hasher.hash(password)
+    return _hasher().hash(password)
 
 
 def verify_password(password: str, hashed_password: str) -> bool:
     try:
-        return _hasher.verify(hashed_password, password)
-    except Exception:
+        return _hasher().verify(hashed_password, password)
+    except (VerificationError, InvalidHashError):
         return False
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """True when the hash was made with other cost parameters than the current ones."""
+    try:
+        return _hasher().check_needs_rehash(hashed_password)
+    except InvalidHashError:
+        return True
+
+
+async def hash_password_async(password: str) -> str:
+    """`get_password_hash` on the bounded hashing pool (never blocks the event loop)."""
+    hasher = _hasher()
+    return await asyncio.get_running_loop().run_in_executor(_hash_executor(), hasher.hash, password)
+
+
+async def verify_password_async(password: str, hashed_password: str) -> bool:
+    """`verify_password` on the bounded hashing pool."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _hash_executor(), verify_password, password, hashed_password
+    )
+
+
+def new_refresh_token() -> tuple[str, str]:
+    """A fresh opaque refresh token and the digest stored for it."""
+    token = secrets.token_urlsafe(32)
+    return token, hash_refresh_token(token)
+
+
+def hash_refresh_token(token: str) -> str:
+    # High-entropy random tokens need no salt or slow hash, unlike passwords
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
 def create_access_token(data: dict, settings: Settings) -> str:
     to_encode = data.copy()
-    expire = dt.datetime.now(dt.UTC) + dt.timedelta(minutes=settings.access_token_expire_minutes)
-    to_encode.update({"exp": expire})
+    now = dt.datetime.now(dt.UTC)
+    expire = now + dt.timedelta(minutes=settings.access_token_expire_minutes)
+    to_encode.update({"exp": expire, "iat": now, "jti": uuid.uuid4().hex})
     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
 
 
-async def get_current_user(
-    request: Request,
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """The authenticated caller as carried by the access token (no DB row)."""
+
+    id: int
+    email: str
+    jti: str | None = None
+    expires_at: int | None = None
+
+
+@lru_cache(maxsize=4)
+def _token_decoder(secret: str, algorithm: str, leeway: int) -> Callable[[str], dict[str, Any]]:
+    # The key object is prepared once per (secret, algorithm) instead of per request
+    key = jwt.get_algorithm_by_name(algorithm).prepare_key(secret)
+    decoder = jwt.PyJWT(options={"require": ["exp", "sub"]})
+
+    def decode(token: str) -> dict[str, Any]:
+        return decoder.decode(token, key, algorithms=[algorithm], leeway=leeway)
+
+    return decode
+
+
+def decode_access_token(token: str, settings: Settings) -> dict[str, Any]:
+    return _token_decoder(settings.secret_key, settings.algorithm, settings.jwt_leeway_seconds)(token)
+
+
+def _bearer_token(credentials: HTTPAuthorizationCredentials | None) -> str:
+    if not credentials or (credentials.scheme or "").lower() != "bearer":
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+    return credentials.credentials
+
+
+async def get_current_principal(
     credentials: HTTPAuthorizationCredentials | None = Depends(_http_bearer),
     session: AsyncSession = Depends(get_session),
     settings: Settings = Depends(get_settings),
-) -> User:
-    if not credentials or (credentials.scheme or "").lower() != "bearer":
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
-    token = credentials.credentials
+) -> Principal:
+    """Authenticate from the token alone; routes that only need the user id use this.
 
+    Tokens issued before the `uid` claim existed fall back to a lookup by email.
+    """
+    token = _bearer_token(credentials)
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        email: Optional[str] = payload.get("sub")
+        payload = decode_access_token(token, settings)
     except PyJWTError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
-    if not email:
+    email = payload.get("sub")
+    if not email or not isinstance(email, str):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
+    jti = payload.get("jti")
+    if await revocation_store.is_revoked(session, jti, max_age=settings.revocation_refresh_seconds):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revoked")
+
+    uid = payload.get("uid")
+    if uid is None:
+        user = await get_user_by_email(session, email)
+        if user is None:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+        uid = user.id
+    elif not isinstance(uid, int) or isinstance(uid, bool):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
+    # Writes committed on this request's session start the user's sticky-primary window
+    tag_session_user(session, uid)
+    return Principal(id=uid, email=email, jti=jti, expires_at=payload.get("exp"))
+
 
-    user = await get_user_by_email(session, email)
-    if user is None:
+async def get_current_user(
+    principal: Principal = Depends(get_current_principal),
+    session: AsyncSession = Depends(get_session),
+) -> User:
+    user = await session.get(User, principal.id)
+    if user is None or user.email != principal.email:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
     return user
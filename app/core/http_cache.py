@@ -0,0 +1,45 @@
+"""Weak ETags and conditional GET for per-user collections.
+
+The ETag is derived from a cheap collection version (row count plus the
+latest `updated_at`, see the finance persistence layer) instead of hashing the
+serialized body, so a matching `If-None-Match` is answered with 304 before the
+list is loaded or rendered.
+"""
+import hashlib
+
+from fastapi import Request, Response
+
+
+# Clients must revalidate on every use; responses are per user
+CACHE_CONTROL = "private, no-cache"
+
+
+def weak_etag(*parts: object) -> str:
+    digest = hashlib.blake2b(
+        "\x1f".join(str(p) for p in parts).encode(), digest_size=12
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison (RFC 9110 13.1.2) against an If-None-Match header value."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    wanted = _opaque(etag)
+    return any(_opaque(t) == wanted for t in if_none_match.split(","))
+
+
+def conditional(request: Request, response: Response, etag: str) -> Response | None:
+    """Set validators on `response`; return a 304 when the client copy is fresh."""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
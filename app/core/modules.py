@@ -1,14 +1,34 @@
+import importlib
+from dataclasses import dataclass
 from typing import Callable, Awaitable
-from fastapi import Depends, HTTPException, status
+
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, status
+from pydantic import ValidationError
 
 from app.core.settings import get_settings, Settings
-from app.core.auth.persistence.models.user import User
-from app.core.auth.security import get_current_user
+from app.core.auth.security import Principal, get_current_principal
+
+
+@dataclass(frozen=True)
+class ModuleSpec:
+    name: str
+    flag: str  # Settings attribute enabling the module
+    prefix: str
+    entrypoint: str  # "package.module:function(app, *, prefix, dependencies)"
+
+
+# Modules are imported by `register_modules` only when enabled at startup, so a
+# disabled module costs nothing to boot (no routers, schemas, models or use cases).
+# Flags are read per request by the guard, so disabling a module takes effect on
+# a settings reload (SIGHUP); enabling one that was off at startup needs a restart.
+MODULES: tuple[ModuleSpec, ...] = (
+    ModuleSpec("finance", "enable_finance", "/fin", "app.modules.finance.interfaces.api.routes:include_routers"),
+)
 
 
 def require_module(module: str) -> Callable[..., Awaitable[None]]:
     async def _dep(
-        current_user: User = Depends(get_current_user),
+        current_user: Principal = Depends(get_current_principal),
         settings: Settings = Depends(get_settings),
     ) -> None:
         # Global flags first (KISS). Future: check entitlements for the user here.
@@ -18,3 +38,38 @@ def require_module(module: str) -> Callable[..., Awaitable[None]]:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Module 'health' disabled")
 
     return _dep
+
+
+def _enabled(spec: ModuleSpec) -> bool:
+    try:
+        settings = get_settings()
+    except ValidationError:
+        # Incomplete environment (e.g. tooling importing app.main): use the declared default
+        return bool(Settings.model_fields[spec.flag].default)
+    return bool(getattr(settings, spec.flag))
+
+
+def _disabled_router(spec: ModuleSpec) -> APIRouter:
+    # Answers the module's paths with the same 403 the guard gives, instead of 404
+    router = APIRouter(prefix=spec.prefix, include_in_schema=False)
+
+    @router.api_route("/{path:path}", methods=["GET", "POST", "PUT", "PATCH", "DELETE"])
+    async def _module_disabled(path: str) -> None:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=f"Module '{spec.name}' disabled")
+
+    return router
+
+
+def register_modules(app: FastAPI) -> list[str]:
+    """Import and mount every enabled module; returns the names mounted."""
+    mounted = []
+    for spec in MODULES:
+        guard = [Depends(require_module(spec.name))]
+        if not _enabled(spec):
+            app.include_router(_disabled_router(spec), dependencies=guard)
+            continue
+        module_path, _, attr = spec.entrypoint.partition(":")
+        include = getattr(importlib.import_module(module_path), attr)
+        include(app, prefix=spec.prefix, dependencies=guard)
+        mounted.append(spec.name)
+    return mounted
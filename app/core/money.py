@@ -1,49 +1,122 @@
-from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP
-
-# Minimal ISO 4217 exponent mapping for common currencies.
-# Extend as needed; defaults to 2 when unknown (KISS/YAGNI).
-ISO_4217_EXPONENTS: dict[str, int] = {
-    "EUR": 2,
-    "USD": 2,
-    "GBP": 2,
-    "BRL": 2,
-    "JPY": 0,
-    "CLP": 0,
-    "KWD": 3,
-    "BHD": 3,
-}
+import sys
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+from types import MappingProxyType
+from typing import NamedTuple
+
+
+class CurrencyInfo(NamedTuple):
+    code: str
+    numeric: int
+    exponent: int  # minor unit digits
+
+
+# ISO 4217 active currencies with a defined minor unit (code, numeric, exponent).
+# Metals, testing and special drawing codes (XAU, XTS, XDR, ...) are excluded:
+# they have no minor unit and are not valid for accounts.
+_ISO_4217_TABLE = """
+AED 784 2|AFN 971 2|ALL 008 2|AMD 051 2|ANG 532 2|AOA 973 2|ARS 032 2|AUD 036 2
+AWG 533 2|AZN 944 2|BAM 977 2|BBD 052 2|BDT 050 2|BGN 975 2|BHD 048 3|BIF 108 0
+BMD 060 2|BND 096 2|BOB 068 2|BOV 984 2|BRL 986 2|BSD 044 2|BTN 064 2|BWP 072 2
+BYN 933 2|BZD 084 2|CAD 124 2|CDF 976 2|CHE 947 2|CHF 756 2|CHW 948 2|CLF 990 4
+CLP 152 0|CNY 156 2|COP 170 2|COU 970 2|CRC 188 2|CUP 192 2|CVE 132 2|CZK 203 2
+DJF 262 0|DKK 208 2|DOP 214 2|DZD 012 2|EGP 818 2|ERN 232 2|ETB 230 2|EUR 978 2
+FJD 242 2|FKP 238 2|GBP 826 2|GEL 981 2|GHS 936 2|GIP 292 2|GMD 270 2|GNF 324 0
+GTQ 320 2|GYD 328 2|HKD 344 2|HNL 340 2|HTG 332 2|HUF 348 2|IDR 360 2|ILS 376 2
+INR 356 2|IQD 368 3|IRR 364 2|ISK 352 0|JMD 388 2|JOD 400 3|JPY 392 0|KES 404 2
+KGS 417 2|KHR 116 2|KMF 174 0|KPW 408 2|KRW 410 0|KWD 414 3|KYD 136 2|KZT 398 2
+LAK 418 2|LBP 422 2|LKR 144 2|LRD 430 2|LSL 426 2|LYD 434 3|MAD 504 2|MDL 498 2
+MGA 969 2|MKD 807 2|MMK 104 2|MNT 496 2|MOP 446 2|MRU 929 2|MUR 480 2|MVR 462 2
+MWK 454 2|MXN 484 2|MXV 979 2|MYR 458 2|MZN 943 2|NAD 516 2|NGN 566 2|NIO 558 2
+NOK 578 2|NPR 524 2|NZD 554 2|OMR 512 3|PAB 590 2|PEN 604 2|PGK 598 2|PHP 608 2
+PKR 586 2|PLN 985 2|PYG 600 0|QAR 634 2|RON 946 2|RSD 941 2|RUB 643 2|RWF 646 0
+SAR 682 2|SBD 090 2|SCR 690 2|SDG 938 2|SEK 752 2|SGD 702 2|SHP 654 2|SLE 925 2
+SOS 706 2|SRD 968 2|SSP 728 2|STN 930 2|SVC 222 2|SYP 760 2|SZL 748 2|THB 764 2
+TJS 972 2|TMT 934 2|TND 788 3|TOP 776 2|TRY 949 2|TTD 780 2|TWD 901 2|TZS 834 2
+UAH 980 2|UGX 800 0|USD 840 2|USN 997 2|UYI 940 0|UYU 858 2|UYW 927 4|UZS 860 2
+VED 926 2|VES 928 2|VND 704 0|VUV 548 0|WST 882 2|XAF 950 0|XCD 951 2|XCG 532 2
+XOF 952 0|XPF 953 0|YER 886 2|ZAR 710 2|ZMW 967 2|ZWG 924 2
+"""
+
+
+def _load_registry() -> Mapping[str, CurrencyInfo]:
+    entries = {}
+    for item in _ISO_4217_TABLE.replace("\n", "|").split("|"):
+        if item.strip():
+            code, numeric, exponent = item.split()
+            entries[sys.intern(code)] = CurrencyInfo(code, int(numeric), int(exponent))
+    return MappingProxyType(entries)
+
+
+# Loaded once at import; read-only
+CURRENCIES: Mapping[str, CurrencyInfo] = _load_registry()
+ISO_4217_EXPONENTS: Mapping[str, int] = MappingProxyType({c: i.exponent for c, i in CURRENCIES.items()})
+# Exponent assumed for codes outside the registry (legacy rows)
+DEFAULT_EXPONENT = 2
+
+
+def currency_info(currency: str) -> CurrencyInfo | None:
+    return CURRENCIES.get((currency or "").upper())
+
+
+def is_valid_currency(currency: str) -> bool:
+    return (currency or "").upper() in CURRENCIES
+
+
+@dataclass(frozen=True, slots=True)
+class CurrencyContext:
+    """Precomputed conversion data for one currency.
+
+    Conversions shift the Decimal exponent with `scaleb`, which is exact for
+    integers within the context precision: no division, no rounding step.
+    """
+
+    code: str
+    exponent: int
+    scale: int  # 10 ** exponent
+    quantum: Decimal  # e.g., Decimal("0.01")
+
+    def to_amount(self, cents: int) -> Decimal:
+        return Decimal(cents).scaleb(-self.exponent)
+
+    def to_cents(self, amount: Decimal) -> int:
+        scaled = amount.scaleb(self.exponent)
+        if scaled != scaled.to_integral_value():
+            raise ValueError(f"amount has more than {self.exponent} decimal places for {self.code}")
+        return int(scaled)
+
+    def quantize(self, amount: Decimal) -> Decimal:
+        return amount.quantize(self.quantum, rounding=ROUND_HALF_UP)
+
+
+@lru_cache(maxsize=256)
+def currency_context(currency: str) -> CurrencyContext:
+    cur = (currency or "").upper()
+    exp = ISO_4217_EXPONENTS.get(cur, DEFAULT_EXPONENT)
+    return CurrencyContext(code=cur, exponent=exp, scale=10**exp, quantum=Decimal(1).scaleb(-exp))
 
 
 def currency_exponent(currency: str) -> int:
     """Return the number of decimal places for a currency (ISO 4217).
 
-    Defaults to 2 when currency code is unknown.
+    Defaults to 2 when currency code is unknown; use `is_valid_currency` to reject those.
     """
-    cur = (currency or "").upper()
-    return ISO_4217_EXPONENTS.get(cur, 2)
+    return currency_context(currency).exponent
 
 
 def validate_amount_for_currency(amount: Decimal, currency: str) -> Decimal:
-    exp = currency_exponent(currency)
-    quant = Decimal(1).scaleb(-exp)  # e.g., 0.01
-    q = amount.quantize(quant, rounding=ROUND_DOWN)
-    if q != amount:
-        raise ValueError(f"amount has more than {exp} decimal places for {currency}")
+    currency_context(currency).to_cents(amount)
     return amount
 
 
 def amount_to_cents(amount: Decimal, currency: str) -> int:
-    exp = currency_exponent(currency)
-    validate_amount_for_currency(amount, currency)
-    cents = (amount * (Decimal(10) ** exp)).to_integral_value()
-    return int(cents)
+    return currency_context(currency).to_cents(amount)
 
 
 def cents_to_amount(cents: int, currency: str) -> Decimal:
-    exp = currency_exponent(currency)
-    return (Decimal(cents) / (Decimal(10) ** exp)).quantize(
-        Decimal(1).scaleb(-exp), rounding=ROUND_HALF_UP
-    )
+    return currency_context(currency).to_amount(cents)
 
 
 def quantize_amount(amount: Decimal, currency: str) -> Decimal:
@@ -52,5 +125,60 @@ def quantize_amount(amount: Decimal, currency: str) -> Decimal:
     Useful when apresentation must enforce the number of decimal places for
     report_currency regardless of intermediate precision.
     """
-    exp = currency_exponent(currency)
-    return amount.quantize(Decimal(1).scaleb(-exp), rounding=ROUND_HALF_UP)
+    return currency_context(currency).quantize(amount)
+
+
+def cents_to_amounts(cents: Iterable[int], currency: str) -> list[Decimal]:
+    """Batch `cents_to_amount` for a single currency (one context lookup)."""
+    shift = -currency_context(currency).exponent
+    return [Decimal(c).scaleb(shift) for c in cents]
+
+
+def amounts_to_cents(amounts: Iterable[Decimal], currency: str) -> list[int]:
+    """Batch `amount_to_cents` for a single currency; raises on excess precision."""
+    to_cents = currency_context(currency).to_cents
+    return [to_cents(a) for a in amounts]
+
+
+# FX rates are stored as Numeric(18, 10): as integers they are exact at 10**10
+RATE_DIGITS = 10
+RATE_SCALE = 10**RATE_DIGITS
+
+
+def scaled_rate(rate: Decimal) -> int:
+    """Rate as a fixed-point integer (rate * 10**10), rounding half up beyond 10 places."""
+    return int(rate.scaleb(RATE_DIGITS).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def _div_round_half_up(num: int, den: int) -> int:
+    q, r = divmod(abs(num), den)
+    if 2 * r >= den:
+        q += 1
+    return q if num >= 0 else -q
+
+
+class MinorUnitConverter:
+    """Exact integer conversion of minor units into a target currency.
+
+    Each source amount is multiplied by an integer factor (scaled rate aligned to
+    a common denominator), so a whole report cell is summed as one big integer
+    and rounded once (half up, like `quantize_amount`) when presented.
+    """
+
+    def __init__(self, target: str) -> None:
+        self.target = currency_context(target)
+        # Common denominator for every source exponent in the registry
+        self._max_exp = max(max(ISO_4217_EXPONENTS.values()), DEFAULT_EXPONENT)
+        self.denominator = RATE_SCALE * int(10**self._max_exp)
+
+    def factor(self, source: str, rate_scaled: int) -> int:
+        """Multiplier turning source minor units into numerator units of `denominator`."""
+        src_exp = currency_context(source).exponent
+        # Exponent is never negative: target exponent >= 0 and _max_exp >= src_exp
+        return rate_scaled * int(10 ** (self.target.exponent + self._max_exp - src_exp))
+
+    def to_minor(self, numerator: int) -> int:
+        return _div_round_half_up(numerator, self.denominator)
+
+    def to_amount(self, numerator: int) -> Decimal:
+        return self.target.to_amount(self.to_minor(numerator))
@@ -0,0 +1,202 @@
+"""Token-bucket rate limiting for expensive routes, applied as a dependency.
+
+Each route class (`auth`, `reports`, `default`) has its own limit such as
+`30/minute`: a bucket holds up to that many tokens and refills at the same
+rate, so short bursts pass and sustained abuse gets 429 with Retry-After.
+Authenticated classes are keyed by user id, `auth` by client IP.
+
+Buckets live in process memory unless `RATE_LIMIT_REDIS_URL` points at a
+shared Redis (needs the optional `redis` package). If Redis is unreachable,
+requests are let through: the limiter must not become an outage of its own.
+"""
+import logging
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from typing import Any, Protocol
+
+from fastapi import Depends, HTTPException, Request, status
+
+from app.core import metrics
+from app.core.auth.security import Principal, get_current_principal
+from app.core.settings import Settings, get_settings
+
+
+logger = logging.getLogger("uvicorn")
+
+RATE_LIMITED = metrics.counter(
+    "rate_limited_total", "Requests rejected by the rate limiter", labelnames=("route_class",)
+)
+
+_PERIODS = {
+    "s": 1.0, "sec": 1.0, "second": 1.0,
+    "m": 60.0, "min": 60.0, "minute": 60.0,
+    "h": 3600.0, "hour": 3600.0,
+}
+
+
+@lru_cache(maxsize=32)
+def parse_rate(value: str) -> tuple[float, int]:
+    """`"30/minute"` -> (refill rate in tokens per second, bucket capacity)."""
+    count, _, period = value.strip().partition("/")
+    seconds = _PERIODS.get(period.strip().lower())
+    burst = int(count)
+    if seconds is None or burst < 1:
+        raise ValueError(f"invalid rate limit: {value!r}")
+    return burst / seconds, burst
+
+
+class Backend(Protocol):
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        """Take one token; return 0 if allowed, else the seconds until one is available."""
+        ...
+
+
+class MemoryBackend:
+    """Per-process buckets: key -> (tokens, updated, full_at), in LRU order.
+
+    `full_at` is when the bucket will have refilled completely under its own
+    rate: from then on it carries no state and is dropped. Past `max_keys`,
+    refilled buckets are swept (at most once per `sweep_interval` seconds, so
+    the scan is amortized), then least recently used buckets are evicted to
+    keep memory bounded.
+    """
+
+    def __init__(self, max_keys: int = 100_000, sweep_interval: float = 1.0) -> None:
+        self.max_keys = max_keys
+        self.sweep_interval = sweep_interval
+        self._buckets: OrderedDict[str, tuple[float, float, float]] = OrderedDict()
+        self._next_sweep = 0.0
+
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            tokens = float(burst)
+        else:
+            self._buckets.move_to_end(key)
+            tokens = min(float(burst), bucket[0] + (now - bucket[1]) * rate)
+        wait = 0.0
+        if tokens >= 1.0:
+            tokens -= 1.0
+        else:
+            wait = (1.0 - tokens) / rate
+        self._buckets[key] = (tokens, now, now + (burst - tokens) / rate)
+        if len(self._buckets) > self.max_keys:
+            self._evict(now)
+        return wait
+
+    def _evict(self, now: float) -> None:
+        if now >= self._next_sweep:
+            self._next_sweep = now + self.sweep_interval
+            for key in [k for k, (_, _, full_at) in self._buckets.items() if full_at <= now]:
+                del self._buckets[key]
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+
+    def clear(self) -> None:
+        self._buckets.clear()
+        self._next_sweep = 0.0
+
+
+# Atomic refill-and-take; returns the wait in seconds as a string (Lua numbers
+# would be truncated to integers on the way back)
+_TAKE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= 1 then tokens = tokens - 1 else wait = (1 - tokens) / rate end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return tostring(wait)
+"""
+
+
+class RedisBackend:
+    def __init__(self, url: str, prefix: str = "ratelimit:") -> None:
+        import redis.asyncio
+
+        self._client: Any = redis.asyncio.Redis.from_url(url)
+        self._script: Any = self._client.register_script(_TAKE_SCRIPT)
+        self.prefix = prefix
+
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        try:
+            wait = await self._script(keys=[self.prefix + key], args=[rate, burst, time.time()])
+        except Exception as exc:  # connection/timeouts: fail open
+            logger.warning("rate limit backend unavailable: %s", exc)
+            return 0.0
+        return float(wait)
+
+
+_backend: Backend | None = None
+_backend_url: str | None = None
+
+
+def get_backend(settings: Settings) -> Backend:
+    global _backend, _backend_url
+    url = settings.rate_limit_redis_url
+    if _backend is None or url != _backend_url:
+        _backend = RedisBackend(url) if url else MemoryBackend()
+        _backend_url = url
+    return _backend
+
+
+def reset_rate_limits() -> None:
+    """Forget every in-memory bucket (tests)."""
+    global _backend, _backend_url
+    _backend, _backend_url = None, None
+
+
+def _limit_for(route_class: str, settings: Settings) -> str:
+    return {
+        "auth": settings.rate_limit_auth,
+        "reports": settings.rate_limit_reports,
+    }.get(route_class, settings.rate_limit_default)
+
+
+async def _enforce(route_class: str, identity: str, settings: Settings) -> None:
+    rate, burst = parse_rate(_limit_for(route_class, settings))
+    wait = await get_backend(settings).take(f"{route_class}:{identity}", rate, burst)
+    if wait > 0:
+        RATE_LIMITED.labels(route_class).inc()
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests",
+            headers={"Retry-After": str(math.ceil(wait))},
+        )
+
+
+def rate_limit(route_class: str = "default") -> Callable[..., Awaitable[None]]:
+    """Dependency limiting the current user (by id) within `route_class`."""
+
+    async def _dep(
+        principal: Principal = Depends(get_current_principal),
+        settings: Settings = Depends(get_settings),
+    ) -> None:
+        if settings.rate_limit_enabled:
+            await _enforce(route_class, f"user:{principal.id}", settings)
+
+    return _dep
+
+
+def rate_limit_by_ip(route_class: str = "auth") -> Callable[..., Awaitable[None]]:
+    """Dependency limiting unauthenticated routes by client address.
+
+    Uses the socket peer; behind a proxy, run uvicorn with `--proxy-headers`
+    (and `--forwarded-allow-ips`) so this is the real client.
+    """
+
+    async def _dep(request: Request, settings: Settings = Depends(get_settings)) -> None:
+        if settings.rate_limit_enabled:
+            host = request.client.host if request.client else "unknown"
+            await _enforce(route_class, f"ip:{host}", settings)
+
+    return _dep
@@ -0,0 +1,22 @@
+"""`get_read_session`: the session for read-heavy routes (lists, reports).
+
+Served by the read replica when READ_DATABASE_URL is set. A user who wrote
+within READ_AFTER_WRITE_SECONDS keeps reading from the primary so they see
+their own changes; this is tracked per process, so with several workers keep
+the window comfortably above the replica lag.
+"""
+from typing import AsyncIterator
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.auth.security import Principal, get_current_principal
+from app.db.session import get_session, read_session
+
+
+async def get_read_session(
+    principal: Principal = Depends(get_current_principal),
+    session: AsyncSession = Depends(get_session),
+) -> AsyncIterator[AsyncSession]:
+    async for read in read_session(session, principal.id):
+        yield read
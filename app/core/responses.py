@@ -0,0 +1,51 @@
+"""JSON responses rendered straight from validated Pydantic models.
+
+Returning models through `response_model` makes FastAPI validate them again
+and walk them into plain Python (`jsonable_encoder`-style) before `json.dumps`.
+Routes that already build their output models can opt out by returning a
+`ModelResponse`: pydantic-core serializes the models (Decimal, datetime
+included) directly to JSON bytes in one pass. Keep `response_model` on the
+route for the OpenAPI schema.
+"""
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+
+# Keyed by the types routes actually return, so the cache stays small
+_ADAPTERS: dict[Any, TypeAdapter[Any]] = {}
+
+
+def type_adapter(tp: Any) -> TypeAdapter[Any]:
+    adapter = _ADAPTERS.get(tp)
+    if adapter is None:
+        adapter = _ADAPTERS.setdefault(tp, TypeAdapter(tp))
+    return adapter
+
+
+def dump_json(content: Any) -> bytes:
+    if isinstance(content, BaseModel):
+        return content.model_dump_json().encode()
+    if isinstance(content, Sequence) and not isinstance(content, (str, bytes)):
+        if not content:
+            return b"[]"
+        # Homogeneous model lists (the common case) reuse one cached adapter
+        return type_adapter(list[type(content[0])]).dump_json(list(content))  # type: ignore[misc]
+    return type_adapter(type(content)).dump_json(content)
+
+
+class ModelResponse(Response):
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        super().__init__(content, status_code=status_code, headers=headers)
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
@@ -1,6 +1,14 @@
+import asyncio
+import logging
+import os
+import signal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
-from dotenv import load_dotenv
+from dotenv import dotenv_values, load_dotenv
+
+# Variables set by the real environment always win over .env, also on reload
+_PROCESS_ENV_KEYS = frozenset(os.environ)
 
 # Ensure .env is loaded at import time (works for app/tests/cli)
 load_dotenv()
@@ -11,11 +19,88 @@ class Settings(BaseSettings):
     secret_key: str = Field(...)
     algorithm: str = Field(default="HS256")
     access_token_expire_minutes: int = Field(default=60)
+    # Clock skew tolerated on exp/iat when verifying access tokens
+    jwt_leeway_seconds: int = Field(default=0, ge=0)
+    refresh_token_expire_days: int = Field(default=30, ge=1)
+    # How stale each process's snapshot of revoked access tokens may get
+    revocation_refresh_seconds: float = Field(default=30.0, ge=0)
+    # Minimum spacing, per process, between purges of expired token rows
+    token_purge_interval_seconds: float = Field(default=600.0, ge=0)
+    # Token-bucket limits per route class ("<count>/<second|minute|hour>")
+    rate_limit_enabled: bool = Field(default=False)
+    rate_limit_auth: str = Field(default="10/minute")
+    rate_limit_reports: str = Field(default="30/minute")
+    rate_limit_default: str = Field(default="300/minute")
+    # Shared buckets across workers (requires `redis`); in-memory when unset
+    rate_limit_redis_url: str | None = Field(default=None)
     enable_finance: bool = Field(default=True)
     enable_health: bool = Field(default=False)
+    # Argon2id cost (argon2-cffi defaults); changing them rehashes on next login
+    argon2_time_cost: int = Field(default=3, ge=1)
+    argon2_memory_cost: int = Field(default=65536, ge=8)  # KiB
+    argon2_parallelism: int = Field(default=4, ge=1)
+    # Threads hashing passwords off the event loop (argon2 releases the GIL)
+    password_hash_workers: int = Field(default=2, ge=1)
+    # Bearer token required by /metrics; the endpoint answers 404 while unset
+    metrics_token: str | None = Field(default=None)
 
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 
+_settings: Settings | None = None
+
+
 def get_settings() -> Settings:
-    return Settings()  # type: ignore[call-arg]
+    """Process-wide settings, parsed once (env + .env) and reused by every request.
+
+    Call `reload_settings()` (or send SIGHUP to a running server) to re-read them.
+    Tests can override the `get_settings` dependency or call `clear_settings_cache()`.
+    """
+    global _settings
+    if _settings is None:
+        _settings = Settings()  # type: ignore[call-arg]
+    return _settings
+
+
+def clear_settings_cache() -> None:
+    """Parse settings again on next use (e.g. after changing env vars in tests)."""
+    global _settings
+    _settings = None
+
+
+def reload_settings() -> Settings:
+    """Re-read .env and the environment; on validation errors the old settings stay."""
+    global _settings
+    for key, value in dotenv_values().items():
+        if key not in _PROCESS_ENV_KEYS and value is not None:
+            os.environ[key] = value
+    fresh = Settings()  # type: ignore[call-arg]
+    _settings = fresh
+    return fresh
+
+
+def install_reload_signal(loop: asyncio.AbstractEventLoop | None = None) -> bool:
+    """Reload settings on SIGHUP; returns False where signals are unavailable."""
+    logger = logging.getLogger("uvicorn")
+
+    def _reload() -> None:
+        try:
+            reload_settings()
+            logger.info("Settings reloaded (SIGHUP)")
+        except Exception:
+            # Keep serving with the previous settings
+            logger.exception("Settings reload failed; keeping previous settings")
+
+    try:
+        (loop or asyncio.get_running_loop()).add_signal_handler(signal.SIGHUP, _reload)
+    except (AttributeError, NotImplementedError, RuntimeError, ValueError):
+        # Windows (no SIGHUP) or not on the main thread
+        return False
+    return True
+
+
+def remove_reload_signal(loop: asyncio.AbstractEventLoop | None = None) -> None:
+    try:
+        (loop or asyncio.get_running_loop()).remove_signal_handler(signal.SIGHUP)
+    except (AttributeError, NotImplementedError, RuntimeError, ValueError):
+        pass
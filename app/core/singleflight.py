@@ -0,0 +1,56 @@
+"""Coalesce identical concurrent calls into one in-flight computation.
+
+The first caller for a key runs the work; callers arriving while it runs await
+the same result (or exception) instead of repeating it. Nothing is kept once
+the call completes, so there is no staleness: a request that starts after the
+computation finished runs it again. State is per process.
+"""
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+from app.core import metrics
+
+
+T = TypeVar("T")
+
+COALESCED = metrics.counter(
+    "singleflight_coalesced_total", "Calls served by another caller's in-flight computation", ("name",)
+)
+
+
+class SingleFlight(Generic[T]):
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._calls: dict[Hashable, asyncio.Future[T]] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        while (pending := self._calls.get(key)) is not None:
+            COALESCED.labels(self.name).inc()
+            try:
+                # Shielded: a follower going away must not cancel the leader's result
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise  # this caller was cancelled
+                # The leader was cancelled (client disconnected): run it ourselves
+
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # retrieved: no "never retrieved" warning without followers
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
@@ -0,0 +1,109 @@
+"""Opt-in per-request SQL instrumentation (query count and DB time).
+
+`install()` hooks the engine's cursor events; `AccessLogMiddleware` opens a
+`QueryStats` per request through a contextvar and reports it in the access log
+and in a `Server-Timing` header. Enabled with `DB_INSTRUMENTATION=1`;
+`DB_SLOW_QUERY_MS` logs individual statements above the threshold.
+"""
+import logging
+import os
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from collections.abc import MutableMapping
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+logger = logging.getLogger("uvicorn")
+
+_STATEMENT_LOG_LIMIT = 500
+
+
+@dataclass
+class QueryStats:
+    queries: int = 0
+    db_ms: float = 0.0
+    # ASGI scope of the request; the matched route is only known after routing
+    scope: MutableMapping[str, Any] = field(default_factory=dict, repr=False)
+
+    @property
+    def route(self) -> str:
+        route = self.scope.get("route")
+        return str(getattr(route, "path", None) or self.scope.get("path", "-"))
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("db_query_stats", default=None)
+# Slow-query threshold per instrumented engine
+_slow_ms: "WeakKeyDictionary[Engine, float | None]" = WeakKeyDictionary()
+
+
+def enabled() -> bool:
+    return os.getenv("DB_INSTRUMENTATION", "").lower() in ("1", "true", "yes")
+
+
+def slow_query_ms() -> float | None:
+    raw = os.getenv("DB_SLOW_QUERY_MS")
+    if not raw:
+        return None
+    try:
+        return float(raw)
+    except ValueError:
+        return None
+
+
+def begin(scope: MutableMapping[str, Any]) -> tuple[QueryStats, Token[QueryStats | None]]:
+    stats = QueryStats(scope=scope)
+    return stats, _current.set(stats)
+
+
+def end(token: Token[QueryStats | None]) -> None:
+    _current.reset(token)
+
+
+def current() -> QueryStats | None:
+    return _current.get()
+
+
+def install(engine: AsyncEngine | Engine, slow_ms: float | None = None) -> None:
+    """Attach cursor timing listeners to `engine` (idempotent)."""
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    _slow_ms[sync_engine] = slow_ms
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:  # type: ignore[no-untyped-def]
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:  # type: ignore[no-untyped-def]
+    starts = conn.info.get("query_start")
+    if not starts:
+        return
+    elapsed_ms = (time.perf_counter() - starts.pop()) * 1000
+    stats = _current.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_ms += elapsed_ms
+    slow_ms = _slow_ms.get(conn.engine)
+    if slow_ms is not None and elapsed_ms >= slow_ms:
+        logger.warning(
+            "slow query: duration_ms=%.2f route=%s statement=%s",
+            elapsed_ms,
+            stats.route if stats is not None else "-",
+            " ".join(statement.split())[:_STATEMENT_LOG_LIMIT],
+        )
+
+
+def _handle_error(exception_context) -> None:  # type: ignore[no-untyped-def]
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start"):
+        conn.info["query_start"].pop()
@@ -0,0 +1,191 @@
+"""Monthly range partitioning (PostgreSQL).
+
+Models opt in declaratively through the table `info`:
+
+    __table_args__ = (..., {"info": {"partitioning": MonthlyRangePartitioning("occurred_at")}})
+
+The partitioned layout itself is created by an Alembic migration (see
+`a8b9c0d1e2f3_partition_transactions_by_month`); this module holds the naming
+and DDL helpers shared by that migration and the periodic maintenance task that
+keeps a few future months of partitions ahead of the clock. Rows outside every monthly
+partition land in the `<table>_default` partition, so a missed month never
+fails inserts; the maintenance moves them into the month's partition once it
+is created. Other dialects (SQLite in tests) keep a plain table.
+"""
+import datetime as dt
+import logging
+from dataclasses import dataclass
+
+from sqlalchemy import MetaData, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+
+logger = logging.getLogger("uvicorn")
+
+
+@dataclass(frozen=True)
+class MonthlyRangePartitioning:
+    column: str
+
+
+def month_start(value: dt.date) -> dt.date:
+    return value.replace(day=1)
+
+
+def add_months(value: dt.date, months: int) -> dt.date:
+    index = value.year * 12 + value.month - 1 + months
+    return dt.date(index // 12, index % 12 + 1, 1)
+
+
+def month_bounds(year: int, month: int) -> tuple[dt.datetime, dt.datetime]:
+    """[start, end) of a calendar month in UTC."""
+    start = dt.date(year, month, 1)
+    end = add_months(start, 1)
+    return (
+        dt.datetime(start.year, start.month, 1, tzinfo=dt.timezone.utc),
+        dt.datetime(end.year, end.month, 1, tzinfo=dt.timezone.utc),
+    )
+
+
+def partition_name(table: str, month: dt.date) -> str:
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def months_between(first: dt.date, last: dt.date) -> list[dt.date]:
+    """Month starts from `first` to `last`, inclusive."""
+    out: list[dt.date] = []
+    current = month_start(first)
+    while current <= last:
+        out.append(current)
+        current = add_months(current, 1)
+    return out
+
+
+def create_partition_sql(table: str, month: dt.date, *, parent: str | None = None) -> str:
+    start = month_start(month)
+    end = add_months(start, 1)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(table, start)} "
+        f"PARTITION OF {parent or table} "
+        f"FOR VALUES FROM ('{start.isoformat()} 00:00:00+00') TO ('{end.isoformat()} 00:00:00+00')"
+    )
+
+
+def create_default_partition_sql(table: str, *, parent: str | None = None) -> str:
+    return f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {parent or table} DEFAULT"
+
+
+def partitioned_tables(metadata: MetaData) -> dict[str, MonthlyRangePartitioning]:
+    return {
+        name: spec
+        for name, table in metadata.tables.items()
+        if isinstance(spec := table.info.get("partitioning"), MonthlyRangePartitioning)
+    }
+
+
+async def _create_month(
+    conn: AsyncConnection, table: str, column: str, month: dt.date, *, default: str | None
+) -> None:
+    start, end = month_bounds(month.year, month.month)
+    bounds = {"start": start, "end": end}
+    in_default = default is not None and await conn.scalar(
+        text(f"SELECT 1 FROM {default} WHERE {column} >= :start AND {column} < :end LIMIT 1"), bounds
+    )
+    if not in_default:
+        await conn.execute(text(create_partition_sql(table, month)))
+        return
+    # The new bound would overlap rows already in the default partition: take
+    # the default out, create the month, move those rows in, put the default
+    # back. Writers wait on the parent's lock until the transaction ends.
+    await conn.execute(text("SET LOCAL lock_timeout = '10s'"))
+    await conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {default}"))
+    await conn.execute(text(create_partition_sql(table, month)))
+    moved = await conn.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {default} WHERE {column} >= :start AND {column} < :end RETURNING *) "
+            f"INSERT INTO {table} SELECT * FROM moved"
+        ),
+        bounds,
+    )
+    await conn.execute(text(f"ALTER TABLE {table} ATTACH PARTITION {default} DEFAULT"))
+    logger.info("Moved %s rows from %s into %s", moved.rowcount, default, partition_name(table, month))
+
+
+async def ensure_future_partitions(
+    conn: AsyncConnection,
+    table: str,
+    *,
+    column: str,
+    months_ahead: int = 3,
+    today: dt.date | None = None,
+) -> list[str]:
+    """Create the partitions for the current month and `months_ahead` following
+    months if missing, moving rows of those months out of the default partition.
+    No-op unless `table` is a partitioned PostgreSQL table. Each month is created
+    under its own savepoint, so one failing month (logged) does not undo the
+    others. Returns the names of the partitions that were created."""
+    if conn.dialect.name != "postgresql":
+        return []
+    is_partitioned = await conn.scalar(
+        text(
+            "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+            "WHERE c.relname = :table AND pg_table_is_visible(c.oid)"
+        ),
+        {"table": table},
+    )
+    if not is_partitioned:
+        return []
+    # One process at a time (workers share the schedule): the others skip, the
+    # holder's partitions are visible to them on their next run
+    got_lock = await conn.scalar(
+        text("SELECT pg_try_advisory_xact_lock(hashtext(:key))"), {"key": f"partitions:{table}"}
+    )
+    if not got_lock:
+        return []
+    current = month_start(today or dt.datetime.now(dt.timezone.utc).date())
+    wanted = months_between(current, add_months(current, max(0, months_ahead)))
+    existing = set(
+        (
+            await conn.execute(
+                text(
+                    "SELECT c.relname FROM pg_inherits i "
+                    "JOIN pg_class c ON c.oid = i.inhrelid "
+                    "JOIN pg_class p ON p.oid = i.inhparent "
+                    "WHERE p.relname = :table"
+                ),
+                {"table": table},
+            )
+        ).scalars()
+    )
+    default = f"{table}_default" if f"{table}_default" in existing else None
+    created: list[str] = []
+    for month in wanted:
+        name = partition_name(table, month)
+        if name in existing:
+            continue
+        try:
+            async with conn.begin_nested():
+                await _create_month(conn, table, column, month, default=default)
+        except Exception as exc:
+            logger.warning("Could not create partition %s: %s", name, exc)
+            continue
+        created.append(name)
+    return created
+
+
+async def maintain_partitions(engine: AsyncEngine, metadata: MetaData, *, months_ahead: int) -> list[str]:
+    """Run `ensure_future_partitions` for every partitioned table in `metadata`,
+    each in its own transaction. Failures are logged, never raised: serving must
+    not depend on DDL succeeding."""
+    created: list[str] = []
+    if engine.dialect.name != "postgresql":
+        return created
+    for table, spec in partitioned_tables(metadata).items():
+        try:
+            async with engine.begin() as conn:
+                created += await ensure_future_partitions(
+                    conn, table, column=spec.column, months_ahead=months_ahead
+                )
+        except Exception as exc:
+            logger.warning("Could not create future partitions for %s: %s", table, exc)
+    return created
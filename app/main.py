@@ -1,25 +1,27 @@
-from typing import Any, Dict
+from typing import Dict
 from collections.abc import AsyncIterator
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, HTTPException, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 import os
 import logging
 from sqlalchemy.engine import make_url
 from dotenv import load_dotenv
+import asyncio
+import contextlib
+import hmac
 from contextlib import asynccontextmanager
 from app.core.auth.interfaces.api.auth import router as auth_router
-from app.modules.finance.interfaces.api.accounts import router as accounts_router
-from app.modules.finance.interfaces.api.categories import router as categories_router
-from app.modules.finance.interfaces.api.transactions import router as transactions_router
-from app.modules.finance.interfaces.api.transfers import router as transfers_router
-from app.modules.finance.interfaces.api.reports import router as reports_router
-from app.modules.finance.interfaces.api.fx_rates import router as fx_rates_router
-from app.core.modules import require_module
+from app.core.modules import register_modules
 from app.core.auth.security import get_current_user
 from app.core.auth.persistence.models.user import User
 from app.core.auth.schemas.user import UserOut
-from app.core.settings import get_settings
-from app.middleware.access_log import AccessLogMiddleware
+from app.core.settings import get_settings, install_reload_signal, remove_reload_signal
+from app.core import metrics
+from app.db import instrumentation as db_instrumentation
+from app.db.session import partition_maintenance, warm_pool
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.access_log import AccessLogMiddleware, start_queue_logging, stop_queue_logging
 
 
 def create_app() -> FastAPI:
@@ -54,10 +56,77 @@ def create_app() -> FastAPI:
             except Exception:
                 logger.warning("DATABASE_URL has an invalid format; check configuration.")
 
-        yield
+        # Optional: emit logs from a background thread (ACCESS_LOG_QUEUE=1)
+        listener = None
+        if os.getenv("ACCESS_LOG_QUEUE", "").lower() in ("1", "true", "yes"):
+            listener = start_queue_logging(logger)
+        # Optional: open pooled DB connections before serving (set by app.serve)
+        try:
+            warmup = int(os.getenv("DB_POOL_WARMUP", "0"))
+        except ValueError:
+            warmup = 0
+        if warmup > 0:
+            opened = await warm_pool(warmup)
+            if opened < warmup:
+                logger.warning("DB pool warm-up opened %d of %d connections", opened, warmup)
+        # Optional: keep monthly partitions ahead of the clock (set by app.serve),
+        # checked at startup and then every PARTITION_MAINTENANCE_SECONDS
+        try:
+            months_ahead = int(os.getenv("PARTITION_MONTHS_AHEAD", "0"))
+            maintenance_interval = float(os.getenv("PARTITION_MAINTENANCE_SECONDS", "86400"))
+        except ValueError:
+            months_ahead, maintenance_interval = 0, 86400.0
+        maintenance = None
+        if months_ahead > 0:
+            maintenance = asyncio.create_task(partition_maintenance(months_ahead, maintenance_interval))
+        # SIGHUP re-reads .env/environment into the cached settings
+        reload_signal = install_reload_signal()
+        try:
+            yield
+        finally:
+            if maintenance is not None:
+                maintenance.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await maintenance
+            if reload_signal:
+                remove_reload_signal()
+            if listener is not None:
+                stop_queue_logging(logger, listener)
 
     app = FastAPI(title="epic-grp", lifespan=lifespan)
-    app.add_middleware(AccessLogMiddleware)
+    # Response compression (disable with COMPRESSION_ENABLED=0); innermost, so
+    # the access log and metrics measure the compressed response
+    if os.getenv("COMPRESSION_ENABLED", "1").lower() not in ("0", "false", "no"):
+        try:
+            min_size = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+            thread_size = int(os.getenv("COMPRESSION_THREAD_SIZE", str(256 * 1024)))
+            level = int(os.getenv("COMPRESSION_LEVEL", "6"))
+        except ValueError:
+            min_size, thread_size, level = 1024, 256 * 1024, 6
+        encodings = [
+            e.strip().lower()
+            for e in os.getenv("COMPRESSION_ENCODINGS", "br,zstd,gzip").split(",")
+            if e.strip()
+        ]
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=min_size,
+            thread_size=thread_size,
+            level=level,
+            encodings=encodings,
+        )
+
+    # Access log sampling for successful responses (errors are always logged)
+    try:
+        sample_rate = float(os.getenv("ACCESS_LOG_SAMPLE_RATE", "1.0"))
+    except ValueError:
+        sample_rate = 1.0
+    app.add_middleware(AccessLogMiddleware, sample_rate=sample_rate, db_stats=db_instrumentation.enabled())
+
+    # Prometheus-style metrics (disable with METRICS_ENABLED=0)
+    metrics_enabled = os.getenv("METRICS_ENABLED", "1").lower() not in ("0", "false", "no")
+    if metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
 
     # CORS (dev-friendly by default; configurable via CORS_ORIGINS)
     origins_env = os.getenv("CORS_ORIGINS", "")
@@ -81,13 +150,26 @@ def create_app() -> FastAPI:
     async def health() -> Dict[str, str]:
         return {"status": "ok"}
 
+    if metrics_enabled:
+        @app.get("/metrics", include_in_schema=False)
+        async def metrics_endpoint(request: Request) -> Response:
+            # Off unless METRICS_TOKEN is set; read per request so a settings
+            # reload can rotate it
+            token = get_settings().metrics_token
+            if not token:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+            supplied = request.headers.get("authorization", "")
+            if not hmac.compare_digest(supplied.encode(), f"Bearer {token}".encode()):
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Invalid metrics token",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            return Response(metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
+
     app.include_router(auth_router)
-    app.include_router(accounts_router, prefix="/fin", tags=["finances"], dependencies=[Depends(require_module("finance"))])
-    app.include_router(categories_router, prefix="/fin", tags=["finances"], dependencies=[Depends(require_module("finance"))])
-    app.include_router(transactions_router, prefix="/fin", tags=["finances"], dependencies=[Depends(require_module("finance"))])
-    app.include_router(transfers_router, prefix="/fin", tags=["finances"], dependencies=[Depends(require_module("finance"))])
-    app.include_router(reports_router, prefix="/fin", tags=["finances"], dependencies=[Depends(require_module("finance"))])
-    app.include_router(fx_rates_router, prefix="/fin", tags=["finances"], dependencies=[Depends(require_module("finance"))])
+    # Enabled modules only; a disabled module is never imported
+    register_modules(app)
 
     @app.get("/me", response_model=UserOut)
     async def me(current_user: User = Depends(get_current_user)) -> UserOut:
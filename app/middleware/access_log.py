@@ -1,36 +1,125 @@
 import time
 import logging
+import random
 import uuid
-from typing import Callable, Awaitable
-from starlette.types import ASGIApp
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from app.db import instrumentation
 
 
-class AccessLogMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app: ASGIApp) -> None:
-        super().__init__(app)
-        self.logger = logging.getLogger("uvicorn")
+class AccessLogMiddleware:
+    """Pure ASGI access log: no per-request task or body wrapping, streaming passes through.
+
+    `sample_rate` applies to successful responses only; 4xx/5xx and requests that
+    raise before sending a response are always logged.
+    With `db_stats`, per-request SQL count/time (see `app.db.instrumentation`) is
+    appended to the log line and sent as a `Server-Timing` header.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = 1.0,
+        logger: logging.Logger | None = None,
+        db_stats: bool = False,
+    ) -> None:
+        self.app = app
+        self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        self.logger = logger or logging.getLogger("uvicorn")
+        self.db_stats = db_stats
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
         start = time.perf_counter()
-        req_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
+        req_id = None
+        for key, value in scope["headers"]:
+            if key == b"x-request-id":
+                req_id = value.decode("latin-1")
+                break
+        if not req_id:
+            req_id = str(uuid.uuid4())
+        status: int | None = None
+        stats = token = None
+        if self.db_stats:
+            stats, token = instrumentation.begin(scope)
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message.setdefault("headers", [])
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = req_id
+                if stats is not None:
+                    # Queries issued while streaming the body land in the log only
+                    headers.append("Server-Timing", f'db;dur={stats.db_ms:.2f};desc="{stats.queries} queries"')
+            await send(message)
 
-        response: Response
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_with_request_id)
         finally:
-            duration_ms = (time.perf_counter() - start) * 1000
-            self.logger.info(
-                "access: method=%s path=%s status=%s duration_ms=%.2f request_id=%s",
-                request.method,
-                request.url.path,
-                getattr(locals().get("response"), "status_code", "-"),
-                duration_ms,
-                req_id,
-            )
-
-        response.headers["X-Request-ID"] = req_id
-        return response
+            if token is not None:
+                instrumentation.end(token)
+            if self._should_log(status):
+                duration_ms = (time.perf_counter() - start) * 1000
+                shown_status = status if status is not None else "-"
+                if stats is None:
+                    self.logger.info(
+                        "access: method=%s path=%s status=%s duration_ms=%.2f request_id=%s",
+                        scope["method"],
+                        scope["path"],
+                        shown_status,
+                        duration_ms,
+                        req_id,
+                    )
+                else:
+                    self.logger.info(
+                        "access: method=%s path=%s status=%s duration_ms=%.2f request_id=%s db_queries=%d db_ms=%.2f",
+                        scope["method"],
+                        scope["path"],
+                        shown_status,
+                        duration_ms,
+                        req_id,
+                        stats.queries,
+                        stats.db_ms,
+                    )
+
+    def _should_log(self, status: int | None) -> bool:
+        if status is None or status >= 400:
+            return True
+        if self.sample_rate >= 1.0:
+            return self.logger.isEnabledFor(logging.INFO)
+        return random.random() < self.sample_rate and self.logger.isEnabledFor(logging.INFO)
+
+
+def start_queue_logging(logger: logging.Logger) -> QueueListener | None:
+    """Move `logger`'s handlers behind a QueueListener so request tasks never block on I/O.
+
+    Returns None when the logger has no handlers of its own (records propagate instead).
+    Pair with `stop_queue_logging` on shutdown to flush and restore the handlers.
+    """
+    handlers = list(logger.handlers)
+    if not handlers:
+        return None
+    queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+    listener = QueueListener(queue, *handlers, respect_handler_level=True)
+    for h in handlers:
+        logger.removeHandler(h)
+    logger.addHandler(QueueHandler(queue))
+    listener.start()
+    return listener
+
+
+def stop_queue_logging(logger: logging.Logger, listener: QueueListener) -> None:
+    listener.stop()
+    for h in list(logger.handlers):
+        if isinstance(h, QueueHandler):
+            logger.removeHandler(h)
+    for h in listener.handlers:
+        logger.addHandler(h)
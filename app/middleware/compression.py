@@ -0,0 +1,223 @@
+import zlib
+from collections.abc import Callable, Sequence
+from typing import Any, Protocol
+
+import anyio.to_thread
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class _Encoder(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+class _GzipEncoder:
+    def __init__(self, level: int) -> None:
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+
+class _BrotliEncoder:
+    def __init__(self, level: int) -> None:
+        import brotli
+
+        # Brotli quality runs 0-11; high qualities are far too slow for responses
+        self._obj = brotli.Compressor(quality=min(level, 5))
+
+    def compress(self, data: bytes) -> bytes:
+        return bytes(self._obj.process(data))
+
+    def flush(self) -> bytes:
+        return bytes(self._obj.finish())
+
+
+class _ZstdEncoder:
+    def __init__(self, level: int) -> None:
+        try:
+            from compression import zstd  # Python 3.14+
+
+            self._obj: Any = zstd.ZstdCompressor(level=level)
+        except ImportError:
+            import zstandard
+
+            self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return bytes(self._obj.compress(data))
+
+    def flush(self) -> bytes:
+        return bytes(self._obj.flush())
+
+
+def _available(encoding: str) -> bool:
+    try:
+        if encoding == "br":
+            import brotli  # noqa: F401
+        elif encoding == "zstd":
+            try:
+                from compression import zstd  # noqa: F401
+            except ImportError:
+                import zstandard  # noqa: F401
+        elif encoding != "gzip":
+            return False
+    except ImportError:
+        return False
+    return True
+
+
+_ENCODERS: dict[str, Callable[[int], _Encoder]] = {
+    "gzip": _GzipEncoder,
+    "br": _BrotliEncoder,
+    "zstd": _ZstdEncoder,
+}
+
+_COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "application/xml")
+
+
+def _compressible(content_type: str) -> bool:
+    ct = content_type.split(";", 1)[0].strip().lower()
+    return ct.startswith(_COMPRESSIBLE_TYPES) or ct.endswith("+json") or ct.endswith("+xml")
+
+
+def _negotiate(accept_encoding: str, supported: Sequence[str]) -> str | None:
+    """Pick the encoding with the highest client q-value; ties go to server order."""
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if name:
+            weights[name.strip().lower()] = q
+    best: str | None = None
+    best_q = 0.0
+    for enc in supported:
+        q = weights.get(enc, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = enc, q
+    return best
+
+
+class CompressionMiddleware:
+    """Pure ASGI response compression (gzip; br/zstd when their modules are installed).
+
+    Bodies smaller than `minimum_size` are sent as-is. Streamed responses are
+    buffered until they reach `minimum_size`, so a short stream goes out
+    uncompressed. Chunks of `thread_size` bytes or more are compressed in a
+    worker thread so large payloads do not block the event loop.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        thread_size: int = 256 * 1024,
+        level: int = 6,
+        encodings: Sequence[str] = ("br", "zstd", "gzip"),
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.thread_size = thread_size
+        self.level = level
+        self.encodings = tuple(e for e in encodings if _available(e))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD" or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+        encoding = _negotiate(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await _CompressedResponder(self, encoding, send)(scope, receive)
+
+
+class _CompressedResponder:
+    def __init__(self, mw: CompressionMiddleware, encoding: str, send: Send) -> None:
+        self.mw = mw
+        self.encoding = encoding
+        self.send = send
+        self.start: Message | None = None
+        self.buffer: list[bytes] = []
+        self.buffered = 0
+        self.encoder: _Encoder | None = None
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive) -> None:
+        await self.mw.app(scope, receive, self.on_send)
+
+    async def _run(self, fn: Callable[[bytes], bytes], data: bytes) -> bytes:
+        if len(data) >= self.mw.thread_size:
+            return await anyio.to_thread.run_sync(fn, data)
+        return fn(data)
+
+    async def on_send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message.get("headers", []))
+            if (
+                "content-encoding" in headers
+                or message["status"] in (204, 304)
+                or not _compressible(headers.get("content-type", ""))
+            ):
+                self.passthrough = True
+                await self.send(message)
+            else:
+                # Held until the first body chunk decides whether to compress
+                self.start = message
+            return
+        if self.passthrough or message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+
+        if self.encoder is None:
+            self.buffer.append(body)
+            self.buffered += len(body)
+            if self.buffered < self.mw.minimum_size:
+                if more_body:
+                    return
+                # Ended below the threshold: send the original bytes
+                await self._send_start(compressed=False)
+                await self.send({"type": "http.response.body", "body": b"".join(self.buffer)})
+                return
+            body = b"".join(self.buffer)
+            self.buffer = []
+            self.encoder = _ENCODERS[self.encoding](self.mw.level)
+            if not more_body:
+                encoder = self.encoder
+                payload = await self._run(lambda d: encoder.compress(d) + encoder.flush(), body)
+                await self._send_start(compressed=True, length=len(payload))
+                await self.send({"type": "http.response.body", "body": payload})
+                return
+            await self._send_start(compressed=True)
+
+        chunk = await self._run(self.encoder.compress, body) if body else b""
+        if not more_body:
+            chunk += self.encoder.flush()
+        if chunk or not more_body:
+            await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    async def _send_start(self, *, compressed: bool, length: int | None = None) -> None:
+        assert self.start is not None
+        headers = MutableHeaders(scope=self.start)
+        headers.add_vary_header("Accept-Encoding")
+        if compressed:
+            headers["Content-Encoding"] = self.encoding
+            if length is None:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(length)
+        await self.send(self.start)
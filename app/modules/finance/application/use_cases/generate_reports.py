@@ -1,13 +1,27 @@
 from dataclasses import dataclass
 from decimal import Decimal
 import datetime as dt
-from typing import List
+from typing import TYPE_CHECKING, Any, List
 
-from app.core.money import cents_to_amount, quantize_amount
+from app.core import metrics
+from app.core.money import MinorUnitConverter, RATE_SCALE, cents_to_amount, scaled_rate
+from app.core.singleflight import SingleFlight
+from app.db.partitioning import month_bounds
+from app.db.session import last_write_at
 from app.modules.finance.infrastructure.external.fx_rate_service import get_rate, RateNotFound
 
+if TYPE_CHECKING:
+    from sqlalchemy import Select
 
-@dataclass
+
+REPORT_SECONDS = metrics.histogram(
+    "report_generation_seconds", "Report generation duration", ("report",)
+)
+FX_CACHE_HITS = metrics.counter("fx_rate_cache_hits_total", "FX rate lookups served from the per-report cache")
+FX_CACHE_MISSES = metrics.counter("fx_rate_cache_misses_total", "FX rate lookups that went to the database")
+
+
+@dataclass(frozen=True)
 class GenerateBalanceByAccountRequest:
     user_id: int
     year: int
@@ -17,7 +31,7 @@ class GenerateBalanceByAccountRequest:
     report_currency: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class GenerateMonthlyByCategoryRequest:
     user_id: int
     year: int
@@ -40,6 +54,42 @@ class MonthlyByCategoryItem:
     category_name: str
     type: str
     total: Decimal
+    currency: str
+
+
+# Identical concurrent requests (same user, report and parameters; the frozen
+# request is the key) share one computation. Results are shared: treat as read-only.
+# The session's engine is part of the key so a primary read (right after a
+# write) never waits on a replica computation, and so is the user's last write:
+# a request made after a write never joins a flight that started before it.
+_BALANCE_FLIGHTS: SingleFlight[List[BalanceByAccountItem]] = SingleFlight("balance_by_account")
+_MONTHLY_FLIGHTS: SingleFlight[List[MonthlyByCategoryItem]] = SingleFlight("monthly_by_category")
+
+
+def _month_transactions_query(user_id: int, year: int, month: int) -> "Select[Any]":
+    """Non-voided transactions of one UTC month with their category and account.
+
+    Only the transaction columns the reports use are selected, all carried by
+    ix_transactions_user_occurred_active (partial on non-voided rows, INCLUDE
+    account_id/category_id/amount_cents): PostgreSQL reads the transactions
+    side with an index-only scan, and the month range prunes partitions.
+    """
+    from app.modules.finance.infrastructure.persistence.models.account import Account
+    from app.modules.finance.infrastructure.persistence.models.category import Category
+    from app.modules.finance.infrastructure.persistence.models.transaction import Transaction
+    from sqlalchemy import select
+    from sqlalchemy.orm import Bundle
+
+    start, end = month_bounds(year, month)
+    tx: Bundle[Any] = Bundle("tx", Transaction.occurred_at, Transaction.amount_cents, Transaction.account_id)
+    return (
+        select(tx, Category, Account)
+        .join(Account, Transaction.account_id == Account.id)
+        .join(Category, Transaction.category_id == Category.id, isouter=True)
+        .where(Transaction.user_id == user_id)
+        .where(Transaction.voided.is_(False))
+        .where(Transaction.occurred_at >= start, Transaction.occurred_at < end)
+    )
 
 
 class GenerateReportsUseCase:
@@ -47,14 +97,31 @@ class GenerateReportsUseCase:
 
     def __init__(self, session) -> None:  # type: ignore
         self.session = session
+        # Rates are immutable per (date, base, quote): memoize the derived integer
+        # conversion factors for the lifetime of the use case
+        self._factors: dict[tuple[dt.date, str, str], int] = {}
+
+    def _flight_key(
+        self, request: GenerateBalanceByAccountRequest | GenerateMonthlyByCategoryRequest
+    ) -> tuple[object, ...]:
+        return request, getattr(self.session, "bind", None), last_write_at(request.user_id)
 
     async def generate_balance_by_account(
         self, request: GenerateBalanceByAccountRequest
     ) -> List[BalanceByAccountItem]:
         """Generate balance by account report."""
+        return await _BALANCE_FLIGHTS.do(self._flight_key(request), lambda: self._timed_balance_by_account(request))
+
+    async def _timed_balance_by_account(
+        self, request: GenerateBalanceByAccountRequest
+    ) -> List[BalanceByAccountItem]:
+        with REPORT_SECONDS.labels("balance_by_account").time():
+            return await self._balance_by_account(request)
+
+    async def _balance_by_account(
+        self, request: GenerateBalanceByAccountRequest
+    ) -> List[BalanceByAccountItem]:
         from app.modules.finance.infrastructure.persistence.models.account import Account
-        from app.modules.finance.infrastructure.persistence.models.category import Category
-        from app.modules.finance.infrastructure.persistence.models.transaction import Transaction
         from sqlalchemy import select
 
         # Fetch accounts for user
@@ -70,22 +137,14 @@ class GenerateReportsUseCase:
         if not request.include_closed:
             acc_rows = [a for a in acc_rows if getattr(a, "status", "ACTIVE") != "CLOSED"]
 
-        # Initialize totals
+        # Initialize totals (integer minor units; converted totals are scaled numerators)
         totals_cents: dict[int, int] = {a.id: 0 for a in acc_rows}
-        totals_report: dict[int, Decimal] | None = None
         target = (request.report_currency or "").upper() or None
-        if target:
-            totals_report = {a.id: Decimal("0") for a in acc_rows}
+        converter = MinorUnitConverter(target) if target else None
 
         # Fetch and process transactions
         tx_rows = (
-            await self.session.execute(
-                select(Transaction, Category, Account)
-                .join(Account, Transaction.account_id == Account.id)
-                .join(Category, Transaction.category_id == Category.id, isouter=True)
-                .where(Transaction.user_id == request.user_id)
-                .where(Transaction.voided.is_(False))
-            )
+            await self.session.execute(_month_transactions_query(request.user_id, request.year, request.month))
         ).all()
 
         for tx, cat, acc in tx_rows:
@@ -103,25 +162,18 @@ class GenerateReportsUseCase:
             if cat is not None and cat.type.upper() == "EXPENSE":
                 sign = -1
 
-            if target and acc:
-                val = await self._convert_amount(tx, acc, target, sign)
-                assert totals_report is not None
-                totals_report[tx.account_id] = (
-                    totals_report.get(tx.account_id, Decimal("0")) + val
-                )
-            else:
-                totals_cents[tx.account_id] = totals_cents.get(tx.account_id, 0) + (
-                    sign * tx.amount_cents
-                )
+            amount = sign * tx.amount_cents
+            if converter is not None and acc:
+                amount *= await self._conversion_factor(converter, tx.occurred_at.date(), acc.currency)
+            totals_cents[tx.account_id] = totals_cents.get(tx.account_id, 0) + amount
 
         # Build response
         result = []
         for a in acc_rows:
-            if target and totals_report is not None:
-                cur = target
-                bal = totals_report.get(a.id, Decimal("0"))
+            if converter is not None:
+                # Single rounding per output cell
                 result.append(BalanceByAccountItem(
-                    account_id=a.id, currency=cur, balance=quantize_amount(bal, cur)
+                    account_id=a.id, currency=converter.target.code, balance=converter.to_amount(totals_cents.get(a.id, 0))
                 ))
             else:
                 result.append(BalanceByAccountItem(
@@ -135,28 +187,27 @@ class GenerateReportsUseCase:
         self, request: GenerateMonthlyByCategoryRequest
     ) -> List[MonthlyByCategoryItem]:
         """Generate monthly by category report."""
-        from app.modules.finance.infrastructure.persistence.models.account import Account
-        from app.modules.finance.infrastructure.persistence.models.category import Category
-        from app.modules.finance.infrastructure.persistence.models.transaction import Transaction
-        from sqlalchemy import select
+        return await _MONTHLY_FLIGHTS.do(self._flight_key(request), lambda: self._timed_monthly_by_category(request))
+
+    async def _timed_monthly_by_category(
+        self, request: GenerateMonthlyByCategoryRequest
+    ) -> List[MonthlyByCategoryItem]:
+        with REPORT_SECONDS.labels("monthly_by_category").time():
+            return await self._monthly_by_category(request)
 
+    async def _monthly_by_category(
+        self, request: GenerateMonthlyByCategoryRequest
+    ) -> List[MonthlyByCategoryItem]:
         # Fetch transactions
         rows = (
-            await self.session.execute(
-                select(Transaction, Category, Account)
-                .join(Account, Transaction.account_id == Account.id)
-                .join(Category, Transaction.category_id == Category.id, isouter=True)
-                .where(Transaction.user_id == request.user_id)
-                .where(Transaction.voided.is_(False))
-            )
+            await self.session.execute(_month_transactions_query(request.user_id, request.year, request.month))
         ).all()
 
-        # Initialize aggregations
-        agg_cents: dict[tuple[int, str, str], int] = {}
-        agg_report: dict[tuple[int, str, str], Decimal] | None = None
+        # Initialize aggregations; without a report currency, totals stay per account currency
+        agg_cents: dict[tuple[int, str, str, str], int] = {}
+        agg_report: dict[tuple[int, str, str], int] = {}
         target = (request.report_currency or "").upper() or None
-        if target:
-            agg_report = {}
+        converter = MinorUnitConverter(target) if target else None
 
         for tx, cat, acc in rows:
             occ = tx.occurred_at
@@ -174,42 +225,51 @@ class GenerateReportsUseCase:
             if not request.include_inactive and not bool(getattr(cat, "active", True)):
                 continue
 
-            key = (cat.id, cat.type.upper(), cat.name)
-            sign = -1 if cat.type.upper() == "EXPENSE" else 1
+            typ = cat.type.upper()
+            sign = -1 if typ == "EXPENSE" else 1
 
-            if target and acc:
-                val = await self._convert_amount(tx, acc, target, sign)
-                assert agg_report is not None
-                agg_report[key] = agg_report.get(key, Decimal("0")) + val
+            if converter is not None and acc:
+                factor = await self._conversion_factor(converter, tx.occurred_at.date(), acc.currency)
+                key = (cat.id, typ, cat.name)
+                agg_report[key] = agg_report.get(key, 0) + sign * tx.amount_cents * factor
             else:
-                agg_cents[key] = agg_cents.get(key, 0) + sign * tx.amount_cents
+                key_cur = (cat.id, typ, cat.name, acc.currency.upper())
+                agg_cents[key_cur] = agg_cents.get(key_cur, 0) + sign * tx.amount_cents
 
         # Build response
         result = []
-        if target and agg_report is not None:
-            for (cat_id, typ, name), dec_total in agg_report.items():
+        if converter is not None:
+            for (cat_id, typ, name), numerator in agg_report.items():
                 result.append(MonthlyByCategoryItem(
                     category_id=cat_id,
                     category_name=name,
                     type=typ,
-                    total=quantize_amount(dec_total, target),
+                    total=converter.to_amount(numerator),
+                    currency=converter.target.code,
                 ))
         else:
-            for (cat_id, typ, name), cents in agg_cents.items():
+            for (cat_id, typ, name, cur), cents in agg_cents.items():
                 result.append(MonthlyByCategoryItem(
                     category_id=cat_id,
                     category_name=name,
                     type=typ,
-                    total=cents_to_amount(cents, "EUR"),
+                    total=cents_to_amount(cents, cur),
+                    currency=cur,
                 ))
         return result
 
-    async def _convert_amount(self, tx, acc, target_currency: str, sign: int) -> Decimal:  # type: ignore
-        """Convert transaction amount to target currency."""
-        src_cur = acc.currency
-        amt_dec = cents_to_amount(tx.amount_cents, src_cur)
-        if src_cur.upper() == target_currency:
-            return amt_dec * sign
-        else:
-            rate = await get_rate(self.session, date=tx.occurred_at.date(), base=src_cur, quote=target_currency)
-            return (amt_dec * rate) * sign
\ No newline at end of file
+    async def _conversion_factor(self, converter: MinorUnitConverter, date: dt.date, src_currency: str) -> int:
+        """Integer multiplier converting source minor units on `date` into the report currency."""
+        src = src_currency.upper()
+        quote = converter.target.code
+        if src == quote:
+            return converter.factor(src, RATE_SCALE)
+        key = (date, src, quote)
+        factor = self._factors.get(key)
+        if factor is not None:
+            FX_CACHE_HITS.inc()
+            return factor
+        FX_CACHE_MISSES.inc()
+        rate = await get_rate(self.session, date=date, base=src, quote=quote)
+        factor = self._factors[key] = converter.factor(src, scaled_rate(rate))
+        return factor
@@ -3,6 +3,7 @@ from .category import Category
 from .fx_rate import FxRate
 from .transaction import Transaction
 from .transfer import Transfer
+from .tombstone import Tombstone
 
-__all__: list[str] = ["Account", "Category", "FxRate", "Transaction", "Transfer"]
+__all__: list[str] = ["Account", "Category", "FxRate", "Tombstone", "Transaction", "Transfer"]
 
@@ -1,4 +1,4 @@
-from sqlalchemy import String, UniqueConstraint, ForeignKey
+from sqlalchemy import String, UniqueConstraint, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base, TimestampMixin
@@ -15,4 +15,5 @@ class Account(TimestampMixin, Base):
 
     __table_args__ = (
         UniqueConstraint("user_id", "name", name="uq_accounts_user_name"),
+        Index("ix_accounts_user_updated_at", "user_id", "updated_at"),
     )
@@ -1,4 +1,4 @@
-from sqlalchemy import String, UniqueConstraint, ForeignKey, Boolean
+from sqlalchemy import String, UniqueConstraint, ForeignKey, Boolean, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base, TimestampMixin
@@ -15,4 +15,5 @@ class Category(TimestampMixin, Base):
 
     __table_args__ = (
         UniqueConstraint("user_id", "name", "type", name="uq_categories_user_name_type"),
+        Index("ix_categories_user_updated_at", "user_id", "updated_at"),
     )
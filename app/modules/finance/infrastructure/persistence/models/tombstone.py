@@ -0,0 +1,106 @@
+from typing import Any
+
+from sqlalchemy import DateTime, ForeignKey, Index, MetaData, String, event
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Mapped, mapped_column
+import datetime as dt
+
+from app.db.base import Base
+from .account import Account
+from .category import Category
+from .transaction import Transaction
+from .transfer import Transfer
+
+
+class Tombstone(Base):
+    """Hard deletes of synced finance rows, read by `GET /fin/sync`."""
+
+    __tablename__ = "fin_tombstones"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
+    entity: Mapped[str] = mapped_column(String(20))
+    entity_id: Mapped[int]
+    deleted_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: dt.datetime.now(dt.timezone.utc)
+    )
+
+    __table_args__ = (
+        Index("ix_fin_tombstones_user_deleted_at", "user_id", "deleted_at"),
+    )
+
+
+# Entity names as exposed by the sync payload
+SYNCED_ENTITIES: dict[type[Base], str] = {
+    Account: "accounts",
+    Category: "categories",
+    Transaction: "transactions",
+    Transfer: "transfers",
+}
+
+
+_PG_FUNCTION = """
+CREATE OR REPLACE FUNCTION fin_record_tombstone() RETURNS trigger AS $$
+BEGIN
+    -- Skipped when the owner itself is being deleted (users ON DELETE CASCADE)
+    INSERT INTO fin_tombstones (user_id, entity, entity_id, deleted_at)
+    SELECT OLD.user_id, TG_ARGV[0], OLD.id, now()
+    WHERE EXISTS (SELECT 1 FROM users WHERE id = OLD.user_id);
+    RETURN OLD;
+END
+$$ LANGUAGE plpgsql
+"""
+
+# deleted_at in the text format SQLAlchemy stores (and compares) on SQLite
+_SQLITE_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS {table}_tombstone AFTER DELETE ON {table}
+FOR EACH ROW WHEN EXISTS (SELECT 1 FROM users WHERE id = OLD.user_id)
+BEGIN
+    INSERT INTO fin_tombstones (user_id, entity, entity_id, deleted_at)
+    VALUES (OLD.user_id, '{entity}', OLD.id, strftime('%Y-%m-%d %H:%M:%f', 'now') || '000');
+END
+"""
+
+
+def tombstone_triggers_sql(dialect: str) -> list[str]:
+    """DDL for the AFTER DELETE triggers that record tombstones.
+
+    Triggers rather than ORM events, so bulk `delete()` statements, raw SQL and
+    foreign-key cascades are recorded too; the tombstone commits (or rolls back)
+    with the delete.
+    """
+    tables = {model.__tablename__: entity for model, entity in SYNCED_ENTITIES.items()}
+    if dialect == "postgresql":
+        statements = [_PG_FUNCTION]
+        for table, entity in tables.items():
+            statements += [
+                f"DROP TRIGGER IF EXISTS {table}_tombstone ON {table}",
+                f"CREATE TRIGGER {table}_tombstone AFTER DELETE ON {table} "
+                f"FOR EACH ROW EXECUTE FUNCTION fin_record_tombstone('{entity}')",
+            ]
+        return statements
+    if dialect == "sqlite":
+        return [_SQLITE_TRIGGER.format(table=table, entity=entity) for table, entity in tables.items()]
+    return []
+
+
+def drop_tombstone_triggers_sql(dialect: str) -> list[str]:
+    tables = [model.__tablename__ for model in SYNCED_ENTITIES]
+    if dialect == "postgresql":
+        return [f"DROP TRIGGER IF EXISTS {t}_tombstone ON {t}" for t in tables] + [
+            "DROP FUNCTION IF EXISTS fin_record_tombstone()"
+        ]
+    if dialect == "sqlite":
+        return [f"DROP TRIGGER IF EXISTS {t}_tombstone" for t in tables]
+    return []
+
+
+def _create_triggers(target: MetaData, connection: Connection, **kw: Any) -> None:
+    # `create_all` (tests, scratch databases); migrations install them explicitly
+    models: list[type[Base]] = [Tombstone, *SYNCED_ENTITIES]
+    if all(model.__tablename__ in target.tables for model in models):
+        for statement in tombstone_triggers_sql(connection.dialect.name):
+            connection.exec_driver_sql(statement)
+
+
+event.listen(Base.metadata, "after_create", _create_triggers)
@@ -1,8 +1,9 @@
-from sqlalchemy import BigInteger, ForeignKey, Text, Index, DateTime, Boolean
+from sqlalchemy import BigInteger, ForeignKey, Text, Index, DateTime, Boolean, text
 import datetime as dt
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base, TimestampMixin
+from app.db.partitioning import MonthlyRangePartitioning
 
 
 class Transaction(TimestampMixin, Base):
@@ -22,4 +23,24 @@ class Transaction(TimestampMixin, Base):
         Index("ix_transactions_user_occurred_at", "user_id", "occurred_at"),
         Index("ix_transactions_user_account", "user_id", "account_id"),
         Index("ix_transactions_user_category", "user_id", "category_id"),
+        Index("ix_transactions_user_updated_at", "user_id", "updated_at"),
+        # Hot path (reports, listings): live rows only, covering the report columns
+        Index(
+            "ix_transactions_user_occurred_active",
+            "user_id",
+            "occurred_at",
+            postgresql_where=text("voided IS false"),
+            postgresql_include=["account_id", "category_id", "amount_cents"],
+            sqlite_where=text("voided IS 0"),
+        ),
+        Index(
+            "ix_transactions_transfer_id",
+            "transfer_id",
+            postgresql_where=text("transfer_id IS NOT NULL"),
+            sqlite_where=text("transfer_id IS NOT NULL"),
+        ),
+        # On PostgreSQL the table is range-partitioned by month (migration
+        # a8b9c0d1e2f3) with primary key (id, occurred_at); ids stay unique
+        # through the shared sequence, so the ORM keeps identifying rows by id
+        {"info": {"partitioning": MonthlyRangePartitioning("occurred_at")}},
     )
@@ -1,4 +1,4 @@
-from sqlalchemy import String, ForeignKey, BigInteger, Numeric, Boolean, DateTime, Date
+from sqlalchemy import String, ForeignKey, BigInteger, Numeric, Boolean, DateTime, Date, Index
 from sqlalchemy.orm import Mapped, mapped_column
 import datetime as dt
 
@@ -29,3 +29,8 @@ class Transfer(TimestampMixin, Base):
     ref_rate_value: Mapped[float | None] = mapped_column(Numeric(18, 10), nullable=True)
     ref_rate_date: Mapped[dt.date | None] = mapped_column(Date, nullable=True)
     ref_rate_source: Mapped[str | None] = mapped_column(String(32), nullable=True)
+
+    __table_args__ = (
+        Index("ix_transfers_user_occurred_at", "user_id", "occurred_at"),
+        Index("ix_transfers_user_updated_at", "user_id", "updated_at"),
+    )
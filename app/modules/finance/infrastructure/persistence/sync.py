@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import datetime as dt
+from typing import Any, Sequence
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.finance.infrastructure.persistence.models.account import Account
+from app.modules.finance.infrastructure.persistence.models.tombstone import SYNCED_ENTITIES, Tombstone
+from app.modules.finance.infrastructure.persistence.models.transaction import Transaction
+
+
+Cursor = tuple[dt.datetime, int]
+
+
+def _after(column: Any, id_column: Any, after: Cursor | None) -> Any:
+    if after is None:
+        return None
+    ts, last_id = after
+    return or_(column > ts, and_(column == ts, id_column > last_id))
+
+
+async def changed_rows(
+    session: AsyncSession,
+    *,
+    model: Any,
+    user_id: int,
+    after: Cursor | None,
+    limit: int,
+) -> Sequence[Any]:
+    """Rows of `model` touched after `after`, oldest first, keyset-paginated on (updated_at, id).
+
+    Voided/closed/inactive rows are included: the caller exposes the flags.
+    """
+    q = select(model).where(model.user_id == user_id)
+    cond = _after(model.updated_at, model.id, after)
+    if cond is not None:
+        q = q.where(cond)
+    q = q.order_by(model.updated_at, model.id).limit(limit)
+    return (await session.execute(q)).scalars().all()
+
+
+async def changed_transactions(
+    session: AsyncSession,
+    *,
+    user_id: int,
+    after: Cursor | None,
+    limit: int,
+) -> Sequence[tuple[Transaction, str]]:
+    """Like `changed_rows` for transactions, with the account currency for presentation."""
+    q = (
+        select(Transaction, Account.currency)
+        .join(Account, Transaction.account_id == Account.id)
+        .where(Transaction.user_id == user_id)
+    )
+    cond = _after(Transaction.updated_at, Transaction.id, after)
+    if cond is not None:
+        q = q.where(cond)
+    q = q.order_by(Transaction.updated_at, Transaction.id).limit(limit)
+    return [(tx, currency) for tx, currency in (await session.execute(q)).all()]
+
+
+async def tombstones_since(
+    session: AsyncSession,
+    *,
+    user_id: int,
+    after: Cursor | None,
+    limit: int,
+) -> Sequence[Tombstone]:
+    q = select(Tombstone).where(Tombstone.user_id == user_id)
+    cond = _after(Tombstone.deleted_at, Tombstone.id, after)
+    if cond is not None:
+        q = q.where(cond)
+    q = q.order_by(Tombstone.deleted_at, Tombstone.id).limit(limit)
+    return (await session.execute(q)).scalars().all()
+
+
+async def live_tombstones(session: AsyncSession, tombstones: Sequence[Tombstone]) -> list[Tombstone]:
+    """Drop tombstones whose id is in use again (sqlite may reuse rowids).
+
+    The re-created row is already part of the delta, so the delete must not win.
+    """
+    models: dict[str, Any] = {name: model for model, name in SYNCED_ENTITIES.items()}
+    by_entity: dict[str, set[int]] = {}
+    for t in tombstones:
+        by_entity.setdefault(t.entity, set()).add(t.entity_id)
+    reused: set[tuple[str, int]] = set()
+    for entity, ids in by_entity.items():
+        model = models[entity]
+        rows = await session.execute(select(model.id).where(model.id.in_(ids)))
+        reused.update((entity, i) for i in rows.scalars())
+    return [t for t in tombstones if (t.entity, t.entity_id) not in reused]
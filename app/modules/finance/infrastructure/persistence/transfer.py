@@ -1,7 +1,7 @@
 from decimal import Decimal, ROUND_HALF_UP
 import datetime as dt
 
-from sqlalchemy import select
+from sqlalchemy import select, or_, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.finance.infrastructure.persistence.models.account import Account
@@ -179,3 +179,45 @@ async def void_transfer(session: AsyncSession, *, user_id: int, transfer_id: int
     await session.commit()
     await session.refresh(tr)
     return tr
+
+
+async def list_transfers(
+    session: AsyncSession,
+    *,
+    user_id: int,
+    limit: int = 50,
+    after: tuple[dt.datetime, int] | None = None,
+    from_date: dt.datetime | None = None,
+    to_date: dt.datetime | None = None,
+    account_id: int | None = None,
+    src_account_id: int | None = None,
+    dst_account_id: int | None = None,
+    include_voided: bool = False,
+) -> list[Transfer]:
+    """List transfers newest first using keyset pagination on (occurred_at, id).
+
+    `after` is the (occurred_at, id) of the last item of the previous page.
+    """
+    q = select(Transfer).where(Transfer.user_id == user_id)
+    if after is not None:
+        occ, last_id = after
+        q = q.where(
+            or_(
+                Transfer.occurred_at < occ,
+                and_(Transfer.occurred_at == occ, Transfer.id < last_id),
+            )
+        )
+    if from_date is not None:
+        q = q.where(Transfer.occurred_at >= from_date)
+    if to_date is not None:
+        q = q.where(Transfer.occurred_at <= to_date)
+    if account_id is not None:
+        q = q.where(or_(Transfer.src_account_id == account_id, Transfer.dst_account_id == account_id))
+    if src_account_id is not None:
+        q = q.where(Transfer.src_account_id == src_account_id)
+    if dst_account_id is not None:
+        q = q.where(Transfer.dst_account_id == dst_account_id)
+    if not include_voided:
+        q = q.where(Transfer.voided.is_(False))
+    q = q.order_by(Transfer.occurred_at.desc(), Transfer.id.desc()).limit(limit)
+    return list((await session.execute(q)).scalars().all())
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import datetime as dt
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.finance.infrastructure.persistence.models.account import Account
+from app.modules.finance.infrastructure.persistence.models.category import Category
+from app.modules.finance.infrastructure.persistence.models.transaction import Transaction
+
+
+def _version_columns(model: Any, user_id: int) -> tuple[Any, Any]:
+    # Served from the (user_id, updated_at) index without touching the rows
+    count = (
+        select(func.count()).select_from(model).where(model.user_id == user_id).scalar_subquery()
+    )
+    latest = select(func.max(model.updated_at)).where(model.user_id == user_id).scalar_subquery()
+    return count, latest
+
+
+def _as_text(value: dt.datetime | str | None) -> str:
+    if isinstance(value, dt.datetime):
+        return value.isoformat()
+    return "" if value is None else str(value)
+
+
+async def collection_version(session: AsyncSession, *, user_id: int, models: tuple[Any, ...]) -> str:
+    """Cheap per-user version of one or more collections (count + max(updated_at) each).
+
+    Any insert, update or delete changes it: inserts and updates move the latest
+    `updated_at`, deletes lower the count. Computed in a single round trip.
+    """
+    columns: list[Any] = []
+    for model in models:
+        columns.extend(_version_columns(model, user_id))
+    row = (await session.execute(select(*columns))).one()
+    return ";".join(_as_text(v) for v in row)
+
+
+async def accounts_version(session: AsyncSession, *, user_id: int) -> str:
+    return await collection_version(session, user_id=user_id, models=(Account,))
+
+
+async def categories_version(session: AsyncSession, *, user_id: int) -> str:
+    return await collection_version(session, user_id=user_id, models=(Category,))
+
+
+async def transactions_version(session: AsyncSession, *, user_id: int) -> str:
+    # Listed transactions render account currency and filter on category type
+    return await collection_version(
+        session, user_id=user_id, models=(Transaction, Account, Category)
+    )
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 from typing import Iterable
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth.security import get_current_user
+from app.core.auth.security import Principal, get_current_principal
+from app.core.http_cache import conditional, weak_etag
+from app.core.responses import ModelResponse
 from app.db.session import get_session
-from app.core.auth.persistence.models.user import User
+from app.core.read_session import get_read_session
 from app.modules.finance.application.use_cases.accounts import (
     CloseAccountCommand,
     CloseAccountUseCase,
@@ -23,6 +25,7 @@ from app.modules.finance.application.use_cases.accounts import (
     UpdateAccountUseCase,
 )
 from app.modules.finance.domain.entities.account import Account
+from app.modules.finance.infrastructure.persistence.versions import accounts_version
 from app.modules.finance.infrastructure.persistence.repositories.accounts import (
     SQLAlchemyAccountRepository,
 )
@@ -49,13 +52,19 @@ def _account_repository(session: AsyncSession) -> SQLAlchemyAccountRepository:
     return SQLAlchemyAccountRepository(session)
 
 
-@router.get("", response_model=list[AccountOut])
+@router.get("", response_model=list[AccountOut], response_class=ModelResponse)
 async def list_accounts(
+    request: Request,
+    response: Response,
     include_closed: bool = False,
     name: str | None = None,
-    session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
-) -> list[AccountOut]:
+    session: AsyncSession = Depends(get_read_session),
+    current_user: Principal = Depends(get_current_principal),
+) -> Response:
+    version = await accounts_version(session, user_id=current_user.id)
+    not_modified = conditional(request, response, weak_etag("accounts", version, request.url.query))
+    if not_modified is not None:
+        return not_modified
     repository = _account_repository(session)
     use_case = ListAccountsUseCase(repository)
     accounts = await use_case.execute(
@@ -65,14 +74,14 @@ async def list_accounts(
             name=name,
         )
     )
-    return _present_many(accounts)
+    return ModelResponse(_present_many(accounts), headers=response.headers)
 
 
 @router.post("", response_model=AccountOut, status_code=status.HTTP_201_CREATED)
 async def create_account(
     data: AccountCreate,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> AccountOut:
     repository = _account_repository(session)
     use_case = CreateAccountUseCase(repository)
@@ -93,7 +102,7 @@ async def create_account(
 async def close_account(
     account_id: int,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> AccountOut:
     repository = _account_repository(session)
     use_case = CloseAccountUseCase(repository)
@@ -110,7 +119,7 @@ async def update_account(
     account_id: int,
     data: AccountUpdate,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> AccountOut:
     repository = _account_repository(session)
     use_case = UpdateAccountUseCase(repository)
@@ -131,7 +140,7 @@ async def update_account(
 async def get_account(
     account_id: int,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> AccountOut:
     repository = _account_repository(session)
     use_case = GetAccountUseCase(repository)
@@ -147,7 +156,7 @@ async def get_account(
 async def delete_account(
     account_id: int,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> None:
     repository = _account_repository(session)
     use_case = DeleteAccountUseCase(repository)
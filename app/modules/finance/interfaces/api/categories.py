@@ -1,11 +1,14 @@
 from typing import List, Any
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth.security import get_current_user
+from app.core.auth.security import Principal, get_current_principal
+from app.core.http_cache import conditional, weak_etag
+from app.core.responses import ModelResponse
 from app.db.session import get_session
-from app.core.auth.persistence.models.user import User
+from app.core.read_session import get_read_session
 from app.modules.finance.interfaces.api.schemas.category import CategoryCreate, CategoryOut, CategoryUpdate
+from app.modules.finance.infrastructure.persistence.versions import categories_version
 from app.modules.finance.infrastructure.persistence.category import (
     create_category as _create_category,
     list_categories as _list_categories,
@@ -28,30 +31,36 @@ def _category_to_out(category: Any) -> CategoryOut:
     )
 
 
-@router.get("", response_model=List[CategoryOut])
+@router.get("", response_model=List[CategoryOut], response_class=ModelResponse)
 async def list_categories(
+    request: Request,
+    response: Response,
     include_inactive: bool = False,
     type: str | None = None,
-    session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
-) -> List[CategoryOut]:
+    session: AsyncSession = Depends(get_read_session),
+    current_user: Principal = Depends(get_current_principal),
+) -> Response:
     type_filter: str | None = None
     if type is not None:
         typ = type.upper()
         if typ not in {"INCOME", "EXPENSE"}:
             raise HTTPException(status_code=422, detail="invalid type")
         type_filter = typ
+    version = await categories_version(session, user_id=current_user.id)
+    not_modified = conditional(request, response, weak_etag("categories", version, request.url.query))
+    if not_modified is not None:
+        return not_modified
     items = await _list_categories(session, user_id=current_user.id, type=type_filter)
     if not include_inactive:
         items = [c for c in items if bool(getattr(c, "active", True))]
-    return [_category_to_out(item) for item in items]
+    return ModelResponse([_category_to_out(item) for item in items], headers=response.headers)
 
 
 @router.post("", response_model=CategoryOut, status_code=status.HTTP_201_CREATED)
 async def create_category(
     data: CategoryCreate,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> CategoryOut:
     category = await _create_category(session, user_id=current_user.id, data=data)
     return _category_to_out(category)
@@ -61,7 +70,7 @@ async def create_category(
 async def deactivate_category(
     category_id: int,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> CategoryOut:
     try:
         cat = await _deactivate_category(
@@ -78,7 +87,7 @@ async def deactivate_category(
 async def merge_categories(
     payload: dict,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> dict:
     src_val = payload.get("src_category_id")
     dst_val = payload.get("dst_category_id")
@@ -103,7 +112,7 @@ async def update_category(
     category_id: int,
     data: CategoryUpdate,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> CategoryOut:
     cat = await _update_category(
         session, user_id=current_user.id, category_id=category_id, data=data
@@ -117,7 +126,7 @@ async def update_category(
 async def get_category(
     category_id: int,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> CategoryOut:
     cat = await _get_category(session, user_id=current_user.id, category_id=category_id)
     if not cat:
@@ -129,7 +138,7 @@ async def get_category(
 async def delete_category(
     category_id: int,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> None:
     try:
         ok = await _delete_category(
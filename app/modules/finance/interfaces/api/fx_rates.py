@@ -1,5 +1,5 @@
 import datetime as dt
-from typing import List, Any
+from typing import List
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from decimal import Decimal
@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy import select
 
 from app.db.session import get_session
+from app.core.read_session import get_read_session
 from app.modules.finance.infrastructure.persistence.models.fx_rate import FxRate
 from app.modules.finance.interfaces.api.schemas.fx_rate_api import FxRateUpsert, FxRateOut
 
@@ -47,7 +48,7 @@ async def list_fx_rates(
     quote: str,
     from_: str = Query(alias="from"),
     to: str = Query(alias="to"),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ) -> List[FxRateOut]:
     b = (base or "").upper()
     q = (quote or "").upper()
@@ -0,0 +1,51 @@
+"""Response presenters shared by the finance routers."""
+from decimal import Decimal, ROUND_HALF_UP
+import datetime as dt
+from typing import Iterable
+
+from app.core.money import cents_to_amount
+from app.modules.finance.infrastructure.persistence.models.transfer import Transfer
+from app.modules.finance.interfaces.api.schemas.transfer import TransferOut
+
+
+_Q2 = Decimal("0.01")
+_ONE = Decimal("1")
+
+
+def _q2(v: Decimal | None) -> Decimal | None:
+    if v is None:
+        return None
+    return v.quantize(_Q2, rounding=ROUND_HALF_UP)
+
+
+def present_transfer(tr: Transfer) -> TransferOut:
+    rate = Decimal(str(tr.rate_value))
+    out = TransferOut(
+        id=tr.id,
+        src_account_id=tr.src_account_id,
+        dst_account_id=tr.dst_account_id,
+        src_amount=cents_to_amount(tr.src_amount_cents, tr.rate_base),
+        dst_amount=cents_to_amount(tr.dst_amount_cents, tr.rate_quote),
+        rate_value=rate,
+        rate_base=tr.rate_base,
+        rate_quote=tr.rate_quote,
+        occurred_at=tr.occurred_at
+        if tr.occurred_at.tzinfo
+        else tr.occurred_at.replace(tzinfo=dt.timezone.utc),
+        fx_rate_2dp=_q2(rate),
+        vet_2dp=_q2(Decimal(str(tr.vet_value)) if tr.vet_value is not None else None),
+        ref_rate_2dp=_q2(
+            Decimal(str(tr.ref_rate_value)) if tr.ref_rate_value is not None else None
+        ),
+    )
+    base_fx = out.ref_rate_2dp or out.fx_rate_2dp
+    if base_fx is not None and out.vet_2dp is not None and base_fx != 0:
+        out.fees_per_unit_2dp = (out.vet_2dp - base_fx).quantize(_Q2, rounding=ROUND_HALF_UP)
+        out.fees_pct = ((out.vet_2dp / base_fx) - _ONE).quantize(_Q2, rounding=ROUND_HALF_UP)
+    return out
+
+
+def present_transfers(transfers: Iterable[Transfer]) -> list[TransferOut]:
+    # Fees are derived from the row itself, so a page is presented in one pass
+    # without extra queries (no per-item lookups of transactions or rates).
+    return [present_transfer(tr) for tr in transfers]
@@ -0,0 +1,21 @@
+"""Query-string parsing shared by the finance routers."""
+import datetime as dt
+
+from fastapi import HTTPException
+
+
+def parse_query_dt(value: str | None) -> dt.datetime | None:
+    """ISO 8601 query value -> aware UTC datetime (naive values are taken as UTC).
+
+    A literal "+" in the offset arrives as a space when not URL-encoded.
+    """
+    if value is None:
+        return None
+    v = value.replace("Z", "+00:00").replace(" ", "+")
+    try:
+        dtv = dt.datetime.fromisoformat(v)
+    except Exception:
+        raise HTTPException(status_code=422, detail="invalid datetime format")
+    if dtv.tzinfo is not None:
+        return dtv.astimezone(dt.timezone.utc)
+    return dtv.replace(tzinfo=dt.timezone.utc)
@@ -1,20 +1,14 @@
-from decimal import Decimal
 import datetime as dt
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
-from app.core.auth.security import get_current_user
-from app.db.session import get_session
-from app.core.auth.persistence.models.user import User
-from app.modules.finance.infrastructure.persistence.models.account import Account
-from app.modules.finance.infrastructure.persistence.models.category import Category
-from app.modules.finance.infrastructure.persistence.models.transaction import Transaction
-from app.modules.finance.interfaces.api.schemas.reports import BalanceByAccountItem, MonthlyByCategoryItem
-from app.modules.finance.infrastructure.external.fx_rate_service import get_rate, RateNotFound
-from app.core.money import cents_to_amount, quantize_amount
+from app.core.auth.security import Principal, get_current_principal
+from app.core.read_session import get_read_session
+from app.modules.finance.infrastructure.external.fx_rate_service import RateNotFound
+from app.core.money import is_valid_currency
+from app.core.responses import ModelResponse
 from app.modules.finance.application.use_cases.generate_reports import (
     GenerateReportsUseCase,
     GenerateBalanceByAccountRequest,
@@ -25,21 +19,27 @@ from app.modules.finance.interfaces.api.schemas.reports import BalanceByAccountI
 router = APIRouter(prefix="/reports")
 
 
-@router.get("/balance-by-account", response_model=List[BalanceByAccountItem])
+def _check_report_currency(report_currency: str | None) -> None:
+    if report_currency and not is_valid_currency(report_currency):
+        raise HTTPException(status_code=422, detail="invalid report_currency")
+
+
+@router.get("/balance-by-account", response_model=List[BalanceByAccountItem], response_class=ModelResponse)
 async def balance_by_account(
     year: int | None = None,
     month: int | None = None,
     include_closed: bool = False,
     include_inactive: bool = False,
     report_currency: str | None = None,
-    session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
-) -> List[BalanceByAccountItem]:
+    session: AsyncSession = Depends(get_read_session),
+    current_user: Principal = Depends(get_current_principal),
+) -> Response:
     # Default to current UTC month when not provided
     now = dt.datetime.now(dt.timezone.utc)
     year = year or now.year
     month = month or now.month
 
+    _check_report_currency(report_currency)
     # Use hexagonal use case
     use_case = GenerateReportsUseCase(session)
     request = GenerateBalanceByAccountRequest(
@@ -53,30 +53,31 @@ async def balance_by_account(
     try:
         result = await use_case.generate_balance_by_account(request)
         # Convert to schema types
-        return [
+        return ModelResponse([
             BalanceByAccountItem(
                 account_id=item.account_id,
                 currency=item.currency,
                 balance=item.balance
             )
             for item in result
-        ]
+        ])
     except RateNotFound:
         raise HTTPException(
             status_code=422, detail="missing fx rate for conversion"
         )
 
 
-@router.get("/monthly-by-category", response_model=List[MonthlyByCategoryItem])
+@router.get("/monthly-by-category", response_model=List[MonthlyByCategoryItem], response_class=ModelResponse)
 async def monthly_by_category(
     year: int,
     month: int,
     include_closed: bool = False,
     include_inactive: bool = False,
     report_currency: str | None = None,
-    session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
-) -> List[MonthlyByCategoryItem]:
+    session: AsyncSession = Depends(get_read_session),
+    current_user: Principal = Depends(get_current_principal),
+) -> Response:
+    _check_report_currency(report_currency)
     # Use hexagonal use case
     use_case = GenerateReportsUseCase(session)
     request = GenerateMonthlyByCategoryRequest(
@@ -90,15 +91,16 @@ async def monthly_by_category(
     try:
         result = await use_case.generate_monthly_by_category(request)
         # Convert to schema types
-        return [
+        return ModelResponse([
             MonthlyByCategoryItem(
                 category_id=item.category_id,
                 category_name=item.category_name,
                 type=item.type,
-                total=item.total
+                total=item.total,
+                currency=item.currency,
             )
             for item in result
-        ]
+        ])
     except RateNotFound:
         raise HTTPException(
             status_code=422, detail="missing fx rate for conversion"
@@ -0,0 +1,33 @@
+"""Finance HTTP entrypoint, imported by `app.core.modules` only when the module is enabled."""
+from collections.abc import Sequence
+from typing import Any
+
+from fastapi import Depends, FastAPI
+
+from app.core.rate_limit import rate_limit
+from app.modules.finance.interfaces.api.accounts import router as accounts_router
+from app.modules.finance.interfaces.api.categories import router as categories_router
+from app.modules.finance.interfaces.api.fx_rates import router as fx_rates_router
+from app.modules.finance.interfaces.api.reports import router as reports_router
+from app.modules.finance.interfaces.api.sync import router as sync_router
+from app.modules.finance.interfaces.api.transactions import router as transactions_router
+from app.modules.finance.interfaces.api.transfers import router as transfers_router
+
+
+# (router, rate-limit class), in registration order
+_ROUTERS = (
+    (accounts_router, "default"),
+    (categories_router, "default"),
+    (transactions_router, "default"),
+    (transfers_router, "default"),
+    (reports_router, "reports"),
+    (fx_rates_router, "default"),
+    (sync_router, "default"),
+)
+
+
+def include_routers(app: FastAPI, *, prefix: str, dependencies: Sequence[Any]) -> None:
+    for router, limit_class in _ROUTERS:
+        app.include_router(
+            router, prefix=prefix, tags=["finances"], dependencies=[*dependencies, Depends(rate_limit(limit_class))]
+        )
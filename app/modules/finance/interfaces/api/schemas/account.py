@@ -1,5 +1,7 @@
 from pydantic import BaseModel, Field, ConfigDict, field_validator
 
+from app.core.money import is_valid_currency
+
 
 class AccountBase(BaseModel):
     name: str = Field(min_length=1, max_length=200)
@@ -15,7 +17,13 @@ class AccountBase(BaseModel):
 
 
 class AccountCreate(AccountBase):
-    pass
+    # Only new input is checked against the registry; AccountOut must still render legacy rows
+    @field_validator("currency")
+    @classmethod
+    def _known_currency(cls, v: str) -> str:
+        if not is_valid_currency(v):
+            raise ValueError("currency must be an ISO 4217 code")
+        return v
 
 
 class AccountUpdate(BaseModel):
@@ -30,6 +38,8 @@ class AccountUpdate(BaseModel):
         v = v.upper()
         if len(v) != 3:
             raise ValueError("currency must be a 3-letter code")
+        if not is_valid_currency(v):
+            raise ValueError("currency must be an ISO 4217 code")
         return v
 
 
@@ -3,6 +3,8 @@ from decimal import Decimal
 from pydantic import BaseModel, Field, field_validator
 from pydantic import ValidationInfo
 
+from app.core.money import is_valid_currency
+
 
 class FxRateUpsert(BaseModel):
     base: str
@@ -13,7 +15,10 @@ class FxRateUpsert(BaseModel):
     @field_validator("base", "quote")
     @classmethod
     def _upper(cls, v: str) -> str:
-        return (v or "").upper()
+        v = (v or "").upper()
+        if not is_valid_currency(v):
+            raise ValueError("currency must be an ISO 4217 code")
+        return v
 
     @field_validator("quote")
     @classmethod
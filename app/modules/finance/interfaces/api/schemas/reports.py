@@ -13,4 +13,6 @@ class MonthlyByCategoryItem(BaseModel):
     category_name: str
     type: str
     total: Decimal
+    # Currency of `total`: the account currency, or report_currency when converting
+    currency: str
 
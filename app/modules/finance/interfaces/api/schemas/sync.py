@@ -0,0 +1,39 @@
+from pydantic import BaseModel
+
+from app.modules.finance.interfaces.api.schemas.account import AccountOut
+from app.modules.finance.interfaces.api.schemas.category import CategoryOut
+from app.modules.finance.interfaces.api.schemas.transaction import TransactionOut
+from app.modules.finance.interfaces.api.schemas.transfer import TransferOut
+
+
+# Sync items carry the lifecycle flags so clients can drop closed/inactive/voided rows
+class SyncAccount(AccountOut):
+    status: str
+
+
+class SyncCategory(CategoryOut):
+    active: bool
+
+
+class SyncTransaction(TransactionOut):
+    voided: bool
+
+
+class SyncTransfer(TransferOut):
+    voided: bool
+
+
+class SyncDeleted(BaseModel):
+    entity: str  # accounts | categories | transactions | transfers
+    id: int
+
+
+class SyncPage(BaseModel):
+    accounts: list[SyncAccount]
+    categories: list[SyncCategory]
+    transactions: list[SyncTransaction]
+    transfers: list[SyncTransfer]
+    deleted: list[SyncDeleted]
+    # Opaque watermark for the next call; keep calling while has_more is true
+    next: str
+    has_more: bool
@@ -53,3 +53,9 @@ class TransferResponse(BaseModel):
     transfer: TransferOut
     src_transaction_id: int
     dst_transaction_id: int
+
+
+class TransferPage(BaseModel):
+    items: list[TransferOut]
+    # Opaque keyset cursor for the next page; None when there are no more items
+    next_cursor: str | None = None
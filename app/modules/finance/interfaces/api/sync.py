@@ -0,0 +1,182 @@
+from decimal import Decimal
+import base64
+import binascii
+import datetime as dt
+import json
+from typing import Any, Sequence
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.auth.security import Principal, get_current_principal
+from app.db.session import get_session
+from app.core.money import cents_to_amount
+from app.core.responses import ModelResponse
+from app.modules.finance.infrastructure.persistence.models.account import Account
+from app.modules.finance.infrastructure.persistence.models.category import Category
+from app.modules.finance.infrastructure.persistence.models.transfer import Transfer
+from app.modules.finance.infrastructure.persistence.sync import (
+    Cursor,
+    changed_rows as _changed_rows,
+    changed_transactions as _changed_transactions,
+    live_tombstones as _live_tombstones,
+    tombstones_since as _tombstones_since,
+)
+from app.modules.finance.interfaces.api.presenters import present_transfer
+from app.modules.finance.interfaces.api.schemas.sync import (
+    SyncAccount,
+    SyncCategory,
+    SyncDeleted,
+    SyncPage,
+    SyncTransaction,
+    SyncTransfer,
+)
+
+router = APIRouter(prefix="/sync")
+
+_TOKEN_VERSION = 1
+# Rows are stamped at flush time and become visible at commit: a caught-up
+# watermark is held this far behind "now" so slow transactions are not skipped.
+# Rows inside the window may be sent twice; clients upsert by id.
+_SETTLE_WINDOW = dt.timedelta(seconds=5)
+
+
+def _as_utc(value: dt.datetime) -> dt.datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=dt.timezone.utc)
+    return value.astimezone(dt.timezone.utc)
+
+
+def _encode_token(cursors: dict[str, Cursor]) -> str:
+    payload = {
+        "v": _TOKEN_VERSION,
+        "c": {name: [ts.isoformat(), last_id] for name, (ts, last_id) in cursors.items()},
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_token(token: str) -> dict[str, Cursor]:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        if payload.get("v") != _TOKEN_VERSION:
+            raise ValueError("unsupported token version")
+        return {
+            str(name): (_as_utc(dt.datetime.fromisoformat(ts)), int(last_id))
+            for name, (ts, last_id) in payload["c"].items()
+        }
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, KeyError, AttributeError):
+        raise HTTPException(status_code=422, detail="invalid sync token")
+
+
+def _next_cursor(
+    rows: Sequence[Any], key: Any, after: Cursor | None, truncated: bool, settled: Cursor
+) -> Cursor:
+    last = key(rows[-1]) if rows else after
+    if truncated and last is not None:
+        return last
+    # Caught up: never move the watermark past the settle window
+    return settled if last is None else min(last, settled)
+
+
+def _present_account(acc: Account) -> SyncAccount:
+    return SyncAccount(id=acc.id, name=acc.name, currency=acc.currency, status=acc.status)
+
+
+def _present_category(cat: Category) -> SyncCategory:
+    return SyncCategory(id=cat.id, name=cat.name, type=cat.type, active=bool(cat.active))
+
+
+def _present_tx(tx: Any, currency: str) -> SyncTransaction:
+    amount: Decimal = cents_to_amount(tx.amount_cents, currency)
+    return SyncTransaction(
+        id=tx.id,
+        account_id=tx.account_id,
+        category_id=tx.category_id,
+        amount=amount,
+        occurred_at=_as_utc(tx.occurred_at),
+        description=tx.description,
+        from_transfer=bool(tx.transfer_id),
+        transfer_id=tx.transfer_id,
+        voided=bool(tx.voided),
+    )
+
+
+def _present_transfer_item(tr: Transfer) -> SyncTransfer:
+    return SyncTransfer(**present_transfer(tr).model_dump(), voided=bool(tr.voided))
+
+
+@router.get("", response_model=SyncPage, response_class=ModelResponse)
+async def sync(
+    since: str | None = None,
+    limit: int = Query(default=500, ge=1, le=2000),
+    session: AsyncSession = Depends(get_session),
+    current_user: Principal = Depends(get_current_principal),
+) -> Response:
+    """Entities created, updated, voided or deleted after the `since` watermark.
+
+    Without `since` this is a full snapshot (no tombstones). Each collection is
+    keyset-paginated on (updated_at, id) with up to `limit` rows per call.
+    """
+    cursors = _decode_token(since) if since else {}
+    settled: Cursor = (dt.datetime.now(dt.timezone.utc) - _SETTLE_WINDOW, 0)
+    next_cursors: dict[str, Cursor] = {}
+    has_more = False
+
+    def _updated_key(row: Any) -> Cursor:
+        return (_as_utc(row.updated_at), row.id)
+
+    async def _page(name: str, fetch: Any, key: Any) -> Sequence[Any]:
+        nonlocal has_more
+        after = cursors.get(name)
+        # One extra row tells whether this collection has more changes
+        rows: Sequence[Any] = await fetch(after, limit + 1)
+        truncated = len(rows) > limit
+        rows = rows[:limit]
+        has_more = has_more or truncated
+        next_cursors[name] = _next_cursor(rows, key, after, truncated, settled)
+        return rows
+
+    uid = current_user.id
+    accounts = await _page(
+        "accounts",
+        lambda after, n: _changed_rows(session, model=Account, user_id=uid, after=after, limit=n),
+        _updated_key,
+    )
+    categories = await _page(
+        "categories",
+        lambda after, n: _changed_rows(session, model=Category, user_id=uid, after=after, limit=n),
+        _updated_key,
+    )
+    transactions = await _page(
+        "transactions",
+        lambda after, n: _changed_transactions(session, user_id=uid, after=after, limit=n),
+        lambda row: _updated_key(row[0]),
+    )
+    transfers = await _page(
+        "transfers",
+        lambda after, n: _changed_rows(session, model=Transfer, user_id=uid, after=after, limit=n),
+        _updated_key,
+    )
+    if since:
+        deleted = await _page(
+            "deleted",
+            lambda after, n: _tombstones_since(session, user_id=uid, after=after, limit=n),
+            lambda row: (_as_utc(row.deleted_at), row.id),
+        )
+        deleted = await _live_tombstones(session, deleted)
+    else:
+        # A snapshot has nothing to delete; start tombstones from now
+        deleted = []
+        next_cursors["deleted"] = settled
+
+    return ModelResponse(SyncPage(
+        accounts=[_present_account(a) for a in accounts],
+        categories=[_present_category(c) for c in categories],
+        transactions=[_present_tx(tx, currency) for tx, currency in transactions],
+        transfers=[_present_transfer_item(tr) for tr in transfers],
+        deleted=[SyncDeleted(entity=t.entity, id=t.entity_id) for t in deleted],
+        next=_encode_token(next_cursors),
+        has_more=has_more,
+    ))
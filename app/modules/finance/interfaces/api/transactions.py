@@ -1,24 +1,28 @@
 from decimal import Decimal
 import datetime as dt
-from typing import List, Any
+from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Select, select
 
-from app.core.auth.security import get_current_user
+from app.core.auth.security import Principal, get_current_principal
+from app.core.http_cache import conditional, weak_etag
+from app.core.responses import ModelResponse
 from app.db.session import get_session
-from app.core.auth.persistence.models.user import User
+from app.core.read_session import get_read_session
 from app.modules.finance.domain.entities.transaction import Transaction as TransactionEntity
 from app.modules.finance.infrastructure.persistence.models.account import Account
 from app.modules.finance.infrastructure.persistence.models.category import Category
 from app.modules.finance.infrastructure.persistence.models.transaction import Transaction
+from app.modules.finance.interfaces.api.query_params import parse_query_dt
 from app.modules.finance.interfaces.api.schemas.transaction import (
     TransactionCreate,
     TransactionOut,
     TransactionUpdate,
 )
-from app.core.money import currency_exponent
+from app.core.money import cents_to_amount
+from app.modules.finance.infrastructure.persistence.versions import transactions_version
 from app.modules.finance.infrastructure.persistence.transaction import (
     create_transaction as _create_transaction,
     update_transaction_amount as _update_transaction_amount,
@@ -35,10 +39,7 @@ router = APIRouter(prefix="/transactions")
 def _present_tx(tx: TransactionEntity, currency: str) -> TransactionOut:
     if tx.id is None:
         raise ValueError("Transaction ID cannot be None")
-    exp = currency_exponent(currency)
-    amount = (Decimal(tx.amount_cents) / (Decimal(10) ** exp)).quantize(
-        Decimal(1).scaleb(-exp)
-    )
+    amount = cents_to_amount(tx.amount_cents, currency)
     occ = tx.occurred_at
     if occ.tzinfo is None:
         occ = occ.replace(tzinfo=dt.timezone.utc)
@@ -56,56 +57,76 @@ def _present_tx(tx: TransactionEntity, currency: str) -> TransactionOut:
     )
 
 
-def _parse_query_dt(value: str | None) -> dt.datetime | None:
-    if value is None:
-        return None
-    v = value.replace("Z", "+00:00").replace(" ", "+")
-    try:
-        dtv = dt.datetime.fromisoformat(v)
-    except Exception:
-        raise HTTPException(status_code=422, detail="invalid datetime format")
-    if dtv.tzinfo is not None:
-        return dtv.astimezone(dt.timezone.utc)
-    return dtv.replace(tzinfo=dt.timezone.utc)
-
-
-@router.get("", response_model=List[TransactionOut])
-async def list_transactions(
-    from_date: str | None = None,
-    to_date: str | None = None,
+def list_transactions_query(
+    user_id: int,
+    *,
+    from_dt: dt.datetime | None = None,
+    to_dt: dt.datetime | None = None,
     account_id: int | None = None,
     category_id: int | None = None,
     type: str | None = None,
     include_voided: bool = False,
-    session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
-) -> List[TransactionOut]:
+) -> Select[tuple[Transaction, Account, Category]]:
+    """Statement behind GET /transactions (newest first), with its account and category.
+
+    Live rows only unless `include_voided`: served by the partial
+    ix_transactions_user_occurred_active index on PostgreSQL.
+    """
     q = (
         select(Transaction, Account, Category)
         .join(Account, Transaction.account_id == Account.id)
         .join(Category, Transaction.category_id == Category.id, isouter=True)
-        .where(Transaction.user_id == current_user.id)
+        .where(Transaction.user_id == user_id)
         .order_by(Transaction.occurred_at.desc())
     )
-
-    if from_date is not None:
-        fd = _parse_query_dt(from_date)
-        q = q.where(Transaction.occurred_at >= fd)
-    if to_date is not None:
-        td = _parse_query_dt(to_date)
-        q = q.where(Transaction.occurred_at <= td)
+    if from_dt is not None:
+        q = q.where(Transaction.occurred_at >= from_dt)
+    if to_dt is not None:
+        q = q.where(Transaction.occurred_at <= to_dt)
     if account_id is not None:
         q = q.where(Transaction.account_id == account_id)
     if category_id is not None:
         q = q.where(Transaction.category_id == category_id)
     if type is not None:
-        typ = type.upper()
-        if typ not in {"INCOME", "EXPENSE"}:
-            raise HTTPException(status_code=422, detail="invalid type")
-        q = q.where(Category.type == typ)
-
+        q = q.where(Category.type == type)
     if not include_voided:
         q = q.where(Transaction.voided.is_(False))
+    return q
+
+
+@router.get("", response_model=List[TransactionOut], response_class=ModelResponse)
+async def list_transactions(
+    request: Request,
+    response: Response,
+    from_date: str | None = None,
+    to_date: str | None = None,
+    account_id: int | None = None,
+    category_id: int | None = None,
+    type: str | None = None,
+    include_voided: bool = False,
+    session: AsyncSession = Depends(get_read_session),
+    current_user: Principal = Depends(get_current_principal),
+) -> Response:
+    fd = parse_query_dt(from_date)
+    td = parse_query_dt(to_date)
+    typ = type.upper() if type is not None else None
+    if typ is not None and typ not in {"INCOME", "EXPENSE"}:
+        raise HTTPException(status_code=422, detail="invalid type")
+    q = list_transactions_query(
+        current_user.id,
+        from_dt=fd,
+        to_dt=td,
+        account_id=account_id,
+        category_id=category_id,
+        type=typ,
+        include_voided=include_voided,
+    )
+
+    # Parameters are validated above; polls with a fresh copy stop here
+    version = await transactions_version(session, user_id=current_user.id)
+    not_modified = conditional(request, response, weak_etag("transactions", version, request.url.query))
+    if not_modified is not None:
+        return not_modified
     rows = (await session.execute(q)).all()
 
     result: list[TransactionOut] = []
@@ -127,14 +148,14 @@ async def list_transactions(
             updated_at=tx.updated_at,
         )
         result.append(_present_tx(tx_entity, currency))
-    return result
+    return ModelResponse(result, headers=response.headers)
 
 
 @router.post("", response_model=TransactionOut, status_code=status.HTTP_201_CREATED)
 async def create_transaction(
     data: TransactionCreate,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> TransactionOut:
     try:
         tx = await _create_transaction(session, user_id=current_user.id, data=data)
@@ -155,7 +176,7 @@ async def create_transaction(
 async def get_transaction(
     transaction_id: int,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> TransactionOut:
     tx = await _get_transaction(
         session, user_id=current_user.id, transaction_id=transaction_id
@@ -177,7 +198,7 @@ async def patch_transaction(
     transaction_id: int,
     data: TransactionUpdate,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> TransactionOut:
     try:
         tx = await _update_transaction(
@@ -206,7 +227,7 @@ async def patch_transaction(
 async def delete_transaction(
     transaction_id: int,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> None:
     try:
         ok = await _delete_transaction(
@@ -224,7 +245,7 @@ async def update_transaction_amount(
     transaction_id: int,
     data: dict,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> TransactionOut:
     if "amount" not in data:
         raise HTTPException(status_code=422, detail="amount required")
@@ -255,7 +276,7 @@ async def update_transaction_amount(
 async def void_transaction(
     transaction_id: int,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> TransactionOut:
     try:
         tx = await _void_transaction(
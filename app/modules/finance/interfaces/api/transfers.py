@@ -1,18 +1,25 @@
-from decimal import Decimal, ROUND_HALF_UP
+import base64
+import binascii
 import datetime as dt
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
-from app.core.auth.security import get_current_user
+from app.core.auth.security import Principal, get_current_principal
 from app.db.session import get_session
-from app.core.auth.persistence.models.user import User
 from app.modules.finance.infrastructure.persistence.models.transfer import Transfer
-from app.modules.finance.interfaces.api.schemas.transfer import TransferCreate, TransferResponse, TransferOut
-from app.core.money import cents_to_amount
-from app.modules.finance.infrastructure.persistence.transfer import create_transfer as _create_transfer
+from app.modules.finance.interfaces.api.presenters import present_transfer, present_transfers
+from app.modules.finance.interfaces.api.query_params import parse_query_dt
+from app.modules.finance.interfaces.api.schemas.transfer import (
+    TransferCreate,
+    TransferOut,
+    TransferPage,
+    TransferResponse,
+)
+from app.core.responses import ModelResponse
 from app.modules.finance.infrastructure.persistence.transfer import void_transfer as _void_transfer
+from app.modules.finance.infrastructure.persistence.transfer import list_transfers as _list_transfers
 from app.modules.finance.application.use_cases.create_transfer import (
     CreateTransferUseCase,
     CreateTransferRequest,
@@ -21,17 +28,62 @@ from app.modules.finance.application.use_cases.create_transfer import (
 router = APIRouter(prefix="/transfers")
 
 
-def _q2(v: Decimal | None) -> Decimal | None:
-    if v is None:
-        return None
-    return v.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+def _as_utc(value: dt.datetime) -> dt.datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=dt.timezone.utc)
+    return value.astimezone(dt.timezone.utc)
+
+
+def _encode_cursor(tr: Transfer) -> str:
+    raw = f"{_as_utc(tr.occurred_at).isoformat()}|{tr.id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[dt.datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        occ_raw, id_raw = base64.urlsafe_b64decode(padded).decode().split("|", 1)
+        return _as_utc(dt.datetime.fromisoformat(occ_raw)), int(id_raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=422, detail="invalid cursor")
+
+
+@router.get("", response_model=TransferPage, response_class=ModelResponse)
+async def list_transfers(
+    cursor: str | None = None,
+    limit: int = Query(default=50, ge=1, le=200),
+    from_date: str | None = None,
+    to_date: str | None = None,
+    account_id: int | None = None,
+    src_account_id: int | None = None,
+    dst_account_id: int | None = None,
+    include_voided: bool = False,
+    session: AsyncSession = Depends(get_session),
+    current_user: Principal = Depends(get_current_principal),
+) -> Response:
+    rows = await _list_transfers(
+        session,
+        user_id=current_user.id,
+        # one extra row tells whether there is a next page
+        limit=limit + 1,
+        after=_decode_cursor(cursor) if cursor else None,
+        from_date=parse_query_dt(from_date),
+        to_date=parse_query_dt(to_date),
+        account_id=account_id,
+        src_account_id=src_account_id,
+        dst_account_id=dst_account_id,
+        include_voided=include_voided,
+    )
+    page = rows[:limit]
+    next_cursor = _encode_cursor(page[-1]) if len(rows) > limit else None
+    return ModelResponse(TransferPage(items=present_transfers(page), next_cursor=next_cursor))
 
 
 @router.post("", response_model=TransferResponse, status_code=status.HTTP_201_CREATED)
 async def create_transfer(
     data: TransferCreate,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> TransferResponse:
     try:
         # Use the hexagonal use case
@@ -57,47 +109,19 @@ async def create_transfer(
 async def void_transfer(
     transfer_id: int,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> TransferOut:
     tr = await _void_transfer(session, user_id=current_user.id, transfer_id=transfer_id)
     if not tr:
         raise HTTPException(status_code=404, detail="Transfer not found")
-    src_amount = cents_to_amount(tr.src_amount_cents, tr.rate_base)
-    dst_amount = cents_to_amount(tr.dst_amount_cents, tr.rate_quote)
-    out = TransferOut(
-        id=tr.id,
-        src_account_id=tr.src_account_id,
-        dst_account_id=tr.dst_account_id,
-        src_amount=src_amount,
-        dst_amount=dst_amount,
-        rate_value=Decimal(str(tr.rate_value)),
-        rate_base=tr.rate_base,
-        rate_quote=tr.rate_quote,
-        occurred_at=tr.occurred_at
-        if tr.occurred_at.tzinfo
-        else tr.occurred_at.replace(tzinfo=dt.timezone.utc),
-        fx_rate_2dp=_q2(Decimal(str(tr.rate_value))),
-        vet_2dp=_q2(Decimal(str(tr.vet_value)) if tr.vet_value is not None else None),
-        ref_rate_2dp=_q2(
-            Decimal(str(tr.ref_rate_value)) if tr.ref_rate_value is not None else None
-        ),
-    )
-    base_fx = out.ref_rate_2dp or out.fx_rate_2dp
-    if base_fx is not None and out.vet_2dp is not None and base_fx != 0:
-        out.fees_per_unit_2dp = (out.vet_2dp - base_fx).quantize(
-            Decimal("0.01"), rounding=ROUND_HALF_UP
-        )
-        out.fees_pct = ((out.vet_2dp / base_fx) - Decimal("1")).quantize(
-            Decimal("0.01"), rounding=ROUND_HALF_UP
-        )
-    return out
+    return present_transfer(tr)
 
 
 @router.delete("/{transfer_id}")
 async def delete_transfer(
     transfer_id: int,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> None:
     # Hard delete is disabled to preserve audit trail
     raise HTTPException(
@@ -110,7 +134,7 @@ async def delete_transfer(
 async def get_transfer(
     transfer_id: int,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> TransferOut:
     tr = (
         (
@@ -125,32 +149,4 @@ async def get_transfer(
     )
     if not tr:
         raise HTTPException(status_code=404, detail="Transfer not found")
-    src_amount = cents_to_amount(tr.src_amount_cents, tr.rate_base)
-    dst_amount = cents_to_amount(tr.dst_amount_cents, tr.rate_quote)
-    out = TransferOut(
-        id=tr.id,
-        src_account_id=tr.src_account_id,
-        dst_account_id=tr.dst_account_id,
-        src_amount=src_amount,
-        dst_amount=dst_amount,
-        rate_value=Decimal(str(tr.rate_value)),
-        rate_base=tr.rate_base,
-        rate_quote=tr.rate_quote,
-        occurred_at=tr.occurred_at
-        if tr.occurred_at.tzinfo
-        else tr.occurred_at.replace(tzinfo=dt.timezone.utc),
-        fx_rate_2dp=_q2(Decimal(str(tr.rate_value))),
-        vet_2dp=_q2(Decimal(str(tr.vet_value)) if tr.vet_value is not None else None),
-        ref_rate_2dp=_q2(
-            Decimal(str(tr.ref_rate_value)) if tr.ref_rate_value is not None else None
-        ),
-    )
-    base_fx = out.ref_rate_2dp or out.fx_rate_2dp
-    if base_fx is not None and out.vet_2dp is not None and base_fx != 0:
-        out.fees_per_unit_2dp = (out.vet_2dp - base_fx).quantize(
-            Decimal("0.01"), rounding=ROUND_HALF_UP
-        )
-        out.fees_pct = ((out.vet_2dp / base_fx) - Decimal("1")).quantize(
-            Decimal("0.01"), rounding=ROUND_HALF_UP
-        )
-    return out
+    return present_transfer(tr)
@@ -0,0 +1,99 @@
+"""Production entry point: `python -m app.serve`.
+
+Runs uvicorn with one worker process per available CPU (override with
+`--workers`/WEB_CONCURRENCY), uvloop and httptools when installed, tuned
+keep-alive and listen backlog, and graceful shutdown: on SIGTERM/SIGINT the
+workers stop accepting connections and drain in-flight requests for up to
+`--graceful-timeout` seconds.
+
+The app is imported once in the supervisor before any worker starts, so a
+broken configuration fails immediately instead of in a worker crash loop.
+Each worker then runs the lifespan, including the DB pool warm-up
+(DB_POOL_WARMUP), before it accepts traffic, and starts the periodic
+creation of missing monthly partitions (PARTITION_MONTHS_AHEAD).
+"""
+import argparse
+import importlib
+import importlib.util
+import os
+from collections.abc import Sequence
+from typing import Any
+
+import uvicorn
+
+from app.core.settings import get_settings
+
+
+APP = "app.main:app"
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ[name])
+    except (KeyError, ValueError):
+        return default
+
+
+def default_workers() -> int:
+    cpus = getattr(os, "process_cpu_count", os.cpu_count)() or 1
+    return max(1, cpus)
+
+
+def _has(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(prog="python -m app.serve", description="Run the API with production settings")
+    p.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"))
+    p.add_argument("--port", type=int, default=_env_int("PORT", 8000))
+    p.add_argument("--workers", type=int, default=_env_int("WEB_CONCURRENCY", default_workers()))
+    p.add_argument("--keep-alive", type=int, default=_env_int("KEEPALIVE_TIMEOUT", 75),
+                   help="Idle keep-alive timeout in seconds; keep above the load balancer's")
+    p.add_argument("--backlog", type=int, default=_env_int("BACKLOG", 2048))
+    p.add_argument("--graceful-timeout", type=int, default=_env_int("GRACEFUL_TIMEOUT", 30),
+                   help="Seconds to drain in-flight requests on shutdown")
+    p.add_argument("--db-warmup", type=int, default=_env_int("DB_POOL_WARMUP", 2),
+                   help="DB connections each worker opens before accepting traffic (0 disables)")
+    p.add_argument("--partition-months", type=int, default=_env_int("PARTITION_MONTHS_AHEAD", 3),
+                   help="Monthly partitions to keep created ahead of the current month (0 disables)")
+    p.add_argument("--limit-concurrency", type=int, default=_env_int("LIMIT_CONCURRENCY", 0) or None,
+                   help="Per-worker cap on concurrent connections; excess gets 503")
+    p.add_argument("--forwarded-allow-ips", default=os.getenv("FORWARDED_ALLOW_IPS", "127.0.0.1"))
+    p.add_argument("--log-level", default=os.getenv("LOG_LEVEL", "info"))
+    return p.parse_args(argv)
+
+
+def build_config(args: argparse.Namespace) -> dict[str, Any]:
+    """Keyword arguments for `uvicorn.run`."""
+    return {
+        "host": args.host,
+        "port": args.port,
+        "workers": max(1, args.workers),
+        "loop": "uvloop" if _has("uvloop") else "asyncio",
+        "http": "httptools" if _has("httptools") else "h11",
+        "timeout_keep_alive": args.keep_alive,
+        "backlog": args.backlog,
+        "timeout_graceful_shutdown": args.graceful_timeout,
+        "limit_concurrency": args.limit_concurrency,
+        "proxy_headers": True,
+        "forwarded_allow_ips": args.forwarded_allow_ips,
+        "log_level": args.log_level,
+        "server_header": False,
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = parse_args(argv)
+    # Workers inherit the environment: each warms its own pool during startup
+    os.environ["DB_POOL_WARMUP"] = str(max(0, args.db_warmup))
+    os.environ["PARTITION_MONTHS_AHEAD"] = str(max(0, args.partition_months))
+    # Preload: surface import/settings errors here, once, before forking workers
+    module, _, _ = APP.partition(":")
+    importlib.import_module(module)
+    get_settings()
+    uvicorn.run(APP, **build_config(args))
+
+
+if __name__ == "__main__":
+    main()
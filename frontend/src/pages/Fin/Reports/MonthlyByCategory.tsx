@@ -7,7 +7,7 @@ import { useSearchParams } from 'react-router-dom'
 import { formatMoney } from '../../../shared/format/money'
 import { exportCSV } from '../../../shared/export/csv'
 
-interface Item { category_id: number; category_name: string; type: 'INCOME' | 'EXPENSE'; total: string }
+interface Item { category_id: number; category_name: string; type: 'INCOME' | 'EXPENSE'; total: string; currency: string }
 
 export default function MonthlyByCategory() {
   const now = new Date()
@@ -28,11 +28,15 @@ export default function MonthlyByCategory() {
   })
 
   const rows = (query.data || []).slice().sort((a, b) => Number(b.total) - Number(a.total))
-  const totalsByType = rows.reduce<Record<string, number>>((acc, r) => {
+  // Totals per type and currency (amounts in different currencies are never summed)
+  const totals = rows.reduce<Record<string, { type: string; currency: string; total: number }>>((acc, r) => {
     const v = Number(r.total)
-    acc[r.type] = (acc[r.type] || 0) + (Number.isFinite(v) ? v : 0)
+    const key = `${r.type}|${r.currency}`
+    acc[key] = acc[key] || { type: r.type, currency: r.currency, total: 0 }
+    acc[key].total += Number.isFinite(v) ? v : 0
     return acc
   }, {})
+  const totalRows = Object.values(totals).sort((a, b) => a.type.localeCompare(b.type) || a.currency.localeCompare(b.currency))
 
   const onChangeFilters = (y: number, m: number, closed: boolean, inactive: boolean) => {
     setYear(y); setMonth(m); setIncludeClosed(closed); setIncludeInactive(inactive)
@@ -49,6 +53,7 @@ export default function MonthlyByCategory() {
       category: r.category_name,
       type: r.type,
       total: r.total,
+      currency: r.currency,
     })))
   }
 
@@ -89,27 +94,21 @@ export default function MonthlyByCategory() {
                   <tr><td colSpan={3} className="text-slate-500">Sem dados no período</td></tr>
                 )}
                 {rows.map((r) => (
-                  <tr key={r.category_id}>
+                  <tr key={`${r.category_id}-${r.currency}`}>
                     <td>{r.category_name}</td>
                     <td className={r.type === 'INCOME' ? 'text-emerald-600' : 'text-red-600'}>{r.type}</td>
-                    <td>{formatMoney(r.total, 'EUR')}</td>
+                    <td>{formatMoney(r.total, r.currency)}</td>
                   </tr>
                 ))}
               </tbody>
-              {(totalsByType['INCOME'] || totalsByType['EXPENSE']) && (
+              {totalRows.length > 0 && (
                 <tfoot>
-                  {typeof totalsByType['INCOME'] === 'number' && (
-                    <tr>
-                      <td colSpan={2} className="text-right font-medium">Total INCOME</td>
-                      <td className="font-medium">{formatMoney(totalsByType['INCOME'] || 0, 'EUR')}</td>
+                  {totalRows.map(t => (
+                    <tr key={`${t.type}-${t.currency}`}>
+                      <td colSpan={2} className="text-right font-medium">Total {t.type}</td>
+                      <td className="font-medium">{formatMoney(t.total, t.currency)}</td>
                     </tr>
-                  )}
-                  {typeof totalsByType['EXPENSE'] === 'number' && (
-                    <tr>
-                      <td colSpan={2} className="text-right font-medium">Total EXPENSE</td>
-                      <td className="font-medium">{formatMoney(totalsByType['EXPENSE'] || 0, 'EUR')}</td>
-                    </tr>
-                  )}
+                  ))}
                 </tfoot>
               )}
             </table>
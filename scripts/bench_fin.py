@@ -0,0 +1,385 @@
+"""Benchmark dos hot paths financeiros com dados sintéticos reproduzíveis.
+
+Gera N usuários, M contas por usuário (mix de moedas) e K transações por usuário
+ao longo de um ano, além das cotações diárias necessárias para relatórios
+convertidos. Mede latência (p50/p90/p99) e throughput de endpoints HTTP (via
+ASGI, sem rede) e dos casos de uso (`GenerateReportsUseCase`, `create_transfer`,
+`get_rate`). O resultado sai em JSON para comparação entre commits.
+
+Exemplos:
+  python scripts/bench_fin.py --users 20 --accounts 3 --transactions 2000
+  python scripts/bench_fin.py --db-url postgresql+asyncpg://u:p@localhost/bench --output bench.json
+
+O banco informado recebe tabelas (create_all) e dados novos a cada execução;
+use um banco descartável. `--reset` apaga e recria todas as tabelas antes.
+"""
+import argparse
+import asyncio
+import datetime as dt
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+# Ensure project root is on sys.path when running as a script
+ROOT: Path = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# Settings validation requires a SECRET_KEY even though auth is bypassed here
+os.environ.setdefault("SECRET_KEY", "bench-secret-key")
+
+import httpx
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.auth.persistence.models.user import User
+from app.core.auth.security import get_current_principal
+from app.db.base import Base
+from app.db.session import get_session as app_get_session
+from app.main import create_app
+from app.modules.finance.application.use_cases.generate_reports import (
+    GenerateBalanceByAccountRequest,
+    GenerateMonthlyByCategoryRequest,
+    GenerateReportsUseCase,
+)
+from app.modules.finance.infrastructure.external.fx_rate_service import get_rate
+from app.modules.finance.infrastructure.persistence.models.account import Account
+from app.modules.finance.infrastructure.persistence.models.category import Category
+from app.modules.finance.infrastructure.persistence.models.fx_rate import FxRate
+from app.modules.finance.infrastructure.persistence.models.transaction import Transaction
+from app.modules.finance.infrastructure.persistence.transfer import create_transfer
+from app.modules.finance.interfaces.api.schemas.transfer import TransferCreate
+from scripts.fin_diag import async_db_url
+
+
+# Currency mix of generated accounts (weights) and indicative rates to EUR
+CURRENCY_MIX: dict[str, float] = {"EUR": 0.5, "BRL": 0.3, "USD": 0.15, "JPY": 0.05}
+TO_EUR: dict[str, Decimal] = {"BRL": Decimal("0.17"), "USD": Decimal("0.92"), "JPY": Decimal("0.0061")}
+# Typical magnitude of one transaction in minor units, per currency
+AMOUNT_RANGE: dict[str, tuple[int, int]] = {
+    "EUR": (100, 50_000),
+    "BRL": (500, 250_000),
+    "USD": (100, 50_000),
+    "JPY": (100, 50_000),
+}
+YEAR = 2025
+INSERT_BATCH = 5000
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Benchmark de endpoints e casos de uso financeiros")
+    p.add_argument("--db-url", type=str, default=f"sqlite+aiosqlite:///{ROOT / 'bench_fin.db'}", help="URL do banco (default: sqlite em ./bench_fin.db)")
+    p.add_argument("--users", type=int, default=10, help="Usuários sintéticos (default: 10)")
+    p.add_argument("--accounts", type=int, default=3, help="Contas por usuário (default: 3)")
+    p.add_argument("--transactions", type=int, default=1000, help="Transações por usuário (default: 1000)")
+    p.add_argument("--iterations", type=int, default=50, help="Execuções medidas por cenário (default: 50)")
+    p.add_argument("--warmup", type=int, default=5, help="Execuções de aquecimento por cenário (default: 5)")
+    p.add_argument("--seed", type=int, default=42, help="Semente do gerador (default: 42)")
+    p.add_argument("--only", type=str, default=None, help="Roda só cenários cujo nome contém este texto")
+    p.add_argument("--reset", action="store_true", help="Apaga e recria todas as tabelas antes de gerar dados")
+    p.add_argument("--output", type=str, default=None, help="Arquivo JSON de saída (default: stdout)")
+    return p.parse_args()
+
+
+async def seed(
+    async_session: async_sessionmaker[AsyncSession], *, users: int, accounts: int, transactions: int, rng: random.Random
+) -> list[dict[str, Any]]:
+    """Insert synthetic users/accounts/categories/transactions; returns per-user fixtures."""
+    run_id = uuid.uuid4().hex[:8]
+    start = dt.datetime(YEAR, 1, 1, tzinfo=dt.timezone.utc)
+    seconds_in_year = 365 * 24 * 3600
+    currencies = list(CURRENCY_MIX)
+    weights = list(CURRENCY_MIX.values())
+    fixtures: list[dict[str, Any]] = []
+
+    async with async_session() as s:
+        for i in range(users):
+            user = User(email=f"bench-{run_id}-{i}@example.com", hashed_password="x")
+            s.add(user)
+            await s.flush()
+            # At least one EUR account so transfers always have a cross-currency pair
+            curs = ["EUR"] + rng.choices(currencies, weights, k=max(accounts - 1, 0))
+            accs = [Account(user_id=user.id, name=f"acc-{j}", currency=c) for j, c in enumerate(curs[:accounts])]
+            cats = [Category(user_id=user.id, name=f"inc-{j}", type="INCOME") for j in range(3)]
+            cats += [Category(user_id=user.id, name=f"exp-{j}", type="EXPENSE") for j in range(5)]
+            s.add_all(accs + cats)
+            await s.flush()
+            fixtures.append(
+                {
+                    "user_id": user.id,
+                    "email": user.email,
+                    "accounts": [(a.id, a.currency) for a in accs],
+                    "categories": [c.id for c in cats],
+                }
+            )
+
+            rows = []
+            for _ in range(transactions):
+                acc_id, cur = rng.choice(fixtures[-1]["accounts"])
+                # Expenses dominate, as in real ledgers
+                cat_id = rng.choice(fixtures[-1]["categories"][3:] if rng.random() < 0.8 else fixtures[-1]["categories"][:3])
+                lo, hi = AMOUNT_RANGE[cur]
+                rows.append(
+                    {
+                        "user_id": user.id,
+                        "account_id": acc_id,
+                        "category_id": cat_id,
+                        "amount_cents": rng.randint(lo, hi),
+                        "occurred_at": start + dt.timedelta(seconds=rng.randrange(seconds_in_year)),
+                        "voided": rng.random() < 0.02,
+                    }
+                )
+                if len(rows) >= INSERT_BATCH:
+                    await s.execute(insert(Transaction), rows)
+                    rows = []
+            if rows:
+                await s.execute(insert(Transaction), rows)
+
+        # Daily rates to EUR for the whole year, skipping ones already present
+        existing = set(
+            (await s.execute(select(FxRate.date, FxRate.base, FxRate.quote).where(FxRate.quote == "EUR"))).all()
+        )
+        fx_rows = []
+        day = start.date()
+        while day.year == YEAR:
+            for base, rate in TO_EUR.items():
+                if (day, base, "EUR") not in existing:
+                    jitter = Decimal(str(round(rng.uniform(0.97, 1.03), 4)))
+                    fx_rows.append({"date": day, "base": base, "quote": "EUR", "rate_value": rate * jitter})
+            day += dt.timedelta(days=1)
+        if fx_rows:
+            await s.execute(insert(FxRate), fx_rows)
+        await s.commit()
+    return fixtures
+
+
+def summarize(samples_s: list[float], wall_s: float) -> dict[str, float | int]:
+    ms = sorted(x * 1000 for x in samples_s)
+
+    def pct(p: float) -> float:
+        # Nearest-rank percentile
+        k = max(0, min(len(ms) - 1, int(round(p / 100 * len(ms) + 0.5)) - 1))
+        return round(ms[k], 3)
+
+    return {
+        "n": len(ms),
+        "mean_ms": round(statistics.fmean(ms), 3),
+        "min_ms": round(ms[0], 3),
+        "p50_ms": pct(50),
+        "p90_ms": pct(90),
+        "p99_ms": pct(99),
+        "max_ms": round(ms[-1], 3),
+        "ops_per_s": round(len(ms) / wall_s, 2) if wall_s > 0 else 0.0,
+    }
+
+
+async def measure(fn: Callable[[int], Awaitable[None]], *, iterations: int, warmup: int) -> dict[str, float | int]:
+    for i in range(warmup):
+        await fn(i)
+    samples: list[float] = []
+    wall_start = time.perf_counter()
+    for i in range(iterations):
+        t0 = time.perf_counter()
+        await fn(warmup + i)
+        samples.append(time.perf_counter() - t0)
+    return summarize(samples, time.perf_counter() - wall_start)
+
+
+def build_scenarios(
+    async_session: async_sessionmaker[AsyncSession], client: httpx.AsyncClient, fixtures: list[dict[str, Any]], acting: dict[str, Any]
+) -> dict[str, Callable[[int], Awaitable[None]]]:
+    def fx(i: int) -> dict[str, Any]:
+        f = fixtures[i % len(fixtures)]
+        acting.update(f)
+        return f
+
+    def month(i: int) -> int:
+        return i % 12 + 1
+
+    async def http_get(path: str) -> None:
+        r = await client.get(path)
+        if r.status_code != 200:
+            raise RuntimeError(f"GET {path} -> {r.status_code}: {r.text[:200]}")
+
+    async def ep_list_transactions(i: int) -> None:
+        fx(i)
+        m = month(i)
+        await http_get(f"/fin/transactions?from_date={YEAR}-{m:02d}-01T00:00:00Z&to_date={YEAR}-{m:02d}-28T23:59:59Z")
+
+    async def ep_list_transactions_all(i: int) -> None:
+        fx(i)
+        await http_get("/fin/transactions")
+
+    async def ep_balance(i: int) -> None:
+        fx(i)
+        await http_get(f"/fin/reports/balance-by-account?year={YEAR}&month={month(i)}")
+
+    async def ep_monthly(i: int) -> None:
+        fx(i)
+        await http_get(f"/fin/reports/monthly-by-category?year={YEAR}&month={month(i)}")
+
+    async def ep_monthly_eur(i: int) -> None:
+        fx(i)
+        await http_get(f"/fin/reports/monthly-by-category?year={YEAR}&month={month(i)}&report_currency=EUR")
+
+    async def ep_list_transfers(i: int) -> None:
+        fx(i)
+        await http_get("/fin/transfers?limit=50")
+
+    def _transfer_payload(f: dict[str, Any], i: int) -> dict[str, Any]:
+        accs = f["accounts"]
+        src, src_cur = accs[i % len(accs)]
+        dst, dst_cur = accs[(i + 1) % len(accs)]
+        payload: dict[str, Any] = {
+            "src_account_id": src,
+            "dst_account_id": dst,
+            "src_amount": "10.00" if src_cur != "JPY" else "1000",
+            "occurred_at": dt.datetime(YEAR, month(i), 15, 12, tzinfo=dt.timezone.utc).isoformat(),
+        }
+        if src_cur != dst_cur:
+            payload["fx_rate"] = "1.2345"
+        return payload
+
+    async def ep_create_transfer(i: int) -> None:
+        f = fx(i)
+        if len(f["accounts"]) < 2:
+            return
+        r = await client.post("/fin/transfers", json=_transfer_payload(f, i))
+        if r.status_code != 201:
+            raise RuntimeError(f"POST /fin/transfers -> {r.status_code}: {r.text[:200]}")
+
+    async def uc_balance(i: int) -> None:
+        f = fx(i)
+        async with async_session() as s:
+            await GenerateReportsUseCase(s).generate_balance_by_account(
+                GenerateBalanceByAccountRequest(user_id=f["user_id"], year=YEAR, month=month(i))
+            )
+
+    async def uc_monthly_eur(i: int) -> None:
+        f = fx(i)
+        async with async_session() as s:
+            await GenerateReportsUseCase(s).generate_monthly_by_category(
+                GenerateMonthlyByCategoryRequest(user_id=f["user_id"], year=YEAR, month=month(i), report_currency="EUR")
+            )
+
+    async def uc_create_transfer(i: int) -> None:
+        f = fx(i)
+        if len(f["accounts"]) < 2:
+            return
+        async with async_session() as s:
+            await create_transfer(s, user_id=f["user_id"], data=TransferCreate(**_transfer_payload(f, i)))
+            await s.commit()
+
+    bases = list(TO_EUR)
+
+    async def uc_get_rate(i: int) -> None:
+        async with async_session() as s:
+            await get_rate(s, date=dt.date(YEAR, month(i), i % 28 + 1), base=bases[i % len(bases)], quote="EUR")
+
+    return {
+        "endpoint.list_transactions.month": ep_list_transactions,
+        "endpoint.list_transactions.all": ep_list_transactions_all,
+        "endpoint.reports.balance_by_account": ep_balance,
+        "endpoint.reports.monthly_by_category": ep_monthly,
+        "endpoint.reports.monthly_by_category.eur": ep_monthly_eur,
+        "endpoint.transfers.list": ep_list_transfers,
+        "endpoint.transfers.create": ep_create_transfer,
+        "usecase.reports.balance_by_account": uc_balance,
+        "usecase.reports.monthly_by_category.eur": uc_monthly_eur,
+        "usecase.create_transfer": uc_create_transfer,
+        "usecase.get_rate": uc_get_rate,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, timeout=5)
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+
+async def main():
+    args = parse_args()
+    db_url = async_db_url(args.db_url)
+    rng = random.Random(args.seed)
+
+    engine = create_async_engine(db_url, future=True)
+    async_session = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    try:
+        async with engine.begin() as conn:
+            if args.reset:
+                await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+
+        t0 = time.perf_counter()
+        fixtures = await seed(
+            async_session, users=args.users, accounts=args.accounts, transactions=args.transactions, rng=rng
+        )
+        seed_s = time.perf_counter() - t0
+        print(f"seed: {args.users * args.transactions} transações em {seed_s:.1f}s", file=sys.stderr)
+
+        app = create_app()
+        acting: dict[str, Any] = dict(fixtures[0])
+
+        async def override_get_session():
+            async with async_session() as session:
+                yield session
+
+        async def override_get_user():
+            return User(id=acting["user_id"], email=acting["email"], hashed_password="x")
+
+        app.dependency_overrides[app_get_session] = override_get_session
+        app.dependency_overrides[get_current_principal] = override_get_user
+
+        results: dict[str, Any] = {}
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for name, fn in build_scenarios(async_session, client, fixtures, acting).items():
+                if args.only and args.only not in name:
+                    continue
+                results[name] = await measure(fn, iterations=args.iterations, warmup=args.warmup)
+                r = results[name]
+                print(
+                    f"{name:45s} p50={r['p50_ms']:>9.3f}ms p90={r['p90_ms']:>9.3f}ms p99={r['p99_ms']:>9.3f}ms {r['ops_per_s']:>9.2f} ops/s",
+                    file=sys.stderr,
+                )
+    finally:
+        await engine.dispose()
+
+    report = {
+        "meta": {
+            "git_commit": _git_commit(),
+            "timestamp": dt.datetime.now(dt.timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "dialect": engine.dialect.name,
+            "params": {
+                "users": args.users,
+                "accounts": args.accounts,
+                "transactions": args.transactions,
+                "iterations": args.iterations,
+                "warmup": args.warmup,
+                "seed": args.seed,
+            },
+            "seed_seconds": round(seed_s, 3),
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
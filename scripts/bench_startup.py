@@ -0,0 +1,123 @@
+"""Benchmark de partida a frio: `import app.main` (que já chama `create_app`).
+
+Cada execução roda num interpretador novo, com `-X importtime`, e mede o tempo
+do import e de um `create_app()` adicional. Reporta a mediana por cenário
+(módulos habilitados/desabilitados) e os imports mais caros pelo tempo
+acumulado. Com `--budget-ms`, sai com código 1 se a mediana do import com
+todos os módulos habilitados passar do orçamento (útil em CI).
+
+Exemplos:
+  python scripts/bench_startup.py
+  python scripts/bench_startup.py --runs 10 --budget-ms 1500 --output startup.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+ROOT: Path = Path(__file__).resolve().parents[1]
+
+_PROBE = """
+import json, time
+t0 = time.perf_counter()
+import app.main
+t1 = time.perf_counter()
+app.main.create_app()
+t2 = time.perf_counter()
+print(json.dumps({"import_ms": (t1 - t0) * 1000, "create_app_ms": (t2 - t1) * 1000}))
+"""
+
+SCENARIOS: dict[str, dict[str, str]] = {
+    "all_modules": {"ENABLE_FINANCE": "true"},
+    "finance_disabled": {"ENABLE_FINANCE": "false"},
+}
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Benchmark de tempo de partida da aplicação")
+    p.add_argument("--runs", type=int, default=5, help="Execuções por cenário (default: 5)")
+    p.add_argument("--top", type=int, default=15, help="Imports mais caros a listar (default: 15)")
+    p.add_argument("--budget-ms", type=float, default=None, help="Orçamento para a mediana do import (cenário all_modules)")
+    p.add_argument("--output", type=str, default=None, help="Arquivo JSON de saída (default: stdout)")
+    return p.parse_args()
+
+
+def _parse_importtime(stderr: str) -> dict[str, int]:
+    """`import time: self [us] | cumulative | name` -> {module: cumulative us}."""
+    out: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        try:
+            _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+            out[name.strip()] = int(cumulative)
+        except ValueError:
+            continue
+    return out
+
+
+def run_once(env_overrides: dict[str, str]) -> tuple[dict[str, float], dict[str, int]]:
+    env = {**os.environ, "SECRET_KEY": os.environ.get("SECRET_KEY", "bench-secret-key"), **env_overrides}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = json.loads(proc.stdout.strip().splitlines()[-1])
+    return timings, _parse_importtime(proc.stderr)
+
+
+def bench(runs: int, top: int) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    for name, overrides in SCENARIOS.items():
+        imports: list[float] = []
+        creates: list[float] = []
+        modules: dict[str, int] = {}
+        for _ in range(runs):
+            timings, modules = run_once(overrides)
+            imports.append(timings["import_ms"])
+            creates.append(timings["create_app_ms"])
+        app_modules = [m for m in modules if m.startswith("app.")]
+        results[name] = {
+            "import_ms_median": round(statistics.median(imports), 2),
+            "import_ms_min": round(min(imports), 2),
+            "create_app_ms_median": round(statistics.median(creates), 2),
+            "app_modules_imported": len(app_modules),
+            "slowest_imports_ms": [
+                {"module": m, "cumulative_ms": round(us / 1000, 2)}
+                for m, us in sorted(modules.items(), key=lambda kv: kv[1], reverse=True)[:top]
+            ],
+        }
+    return results
+
+
+def main() -> int:
+    args = parse_args()
+    report = {
+        "python": platform.python_version(),
+        "runs": args.runs,
+        "scenarios": bench(args.runs, args.top),
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text)
+    else:
+        print(text)
+    if args.budget_ms is not None:
+        median = report["scenarios"]["all_modules"]["import_ms_median"]
+        if median > args.budget_ms:
+            print(f"startup budget exceeded: {median} ms > {args.budget_ms} ms", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
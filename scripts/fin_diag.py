@@ -4,7 +4,7 @@ import datetime as dt
 import os
 import sys
 from pathlib import Path
-from decimal import Decimal
+from typing import Callable
 
 # Ensure project root is on sys.path when running as a script
 ROOT: Path = Path(__file__).resolve().parents[1]
@@ -12,9 +12,9 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func, case
+from sqlalchemy.sql import Select
 
-from app.db.base import Base
 from app.modules.finance.infrastructure.persistence.models.account import Account
 from app.modules.finance.infrastructure.persistence.models.category import Category
 from app.modules.finance.infrastructure.persistence.models.transaction import Transaction
@@ -27,10 +27,179 @@ def parse_args():
     p.add_argument("--year", type=int, default=None, help="Ano (UTC)")
     p.add_argument("--month", type=int, default=None, help="Mês (1-12, UTC)")
     p.add_argument("--user", type=int, default=None, help="ID do usuário para filtrar (opcional)")
-    p.add_argument("--env-file", type=str, default=str(ROOT / ".env"), help="Caminho do arquivo .env (default: ./\.env)")
+    p.add_argument(
+        "--all-users",
+        action="store_true",
+        help="Diagnostica cada usuário com movimento no mês, em paralelo",
+    )
+    p.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Máximo de conexões simultâneas no modo --all-users (default: 4)",
+    )
+    p.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Lista cada transação do mês (streaming do banco)",
+    )
+    p.add_argument("--env-file", type=str, default=str(ROOT / ".env"), help="Caminho do arquivo .env (default: ./.env)")
     return p.parse_args()
 
 
+def month_range(year: int, month: int) -> tuple[dt.datetime, dt.datetime]:
+    """Return [start, end) of a UTC month, so filters stay sargable in SQL."""
+    start = dt.datetime(year, month, 1, tzinfo=dt.timezone.utc)
+    if month == 12:
+        end = dt.datetime(year + 1, 1, 1, tzinfo=dt.timezone.utc)
+    else:
+        end = dt.datetime(year, month + 1, 1, tzinfo=dt.timezone.utc)
+    return start, end
+
+
+def _signed_cents():
+    # INCOME (or uncategorized) adds, EXPENSE subtracts — same rule as the reports
+    return case((Category.type == "EXPENSE", -Transaction.amount_cents), else_=Transaction.amount_cents)
+
+
+def _month_filter(q: Select, start: dt.datetime, end: dt.datetime, user_id: int | None) -> Select:
+    q = q.where(
+        Transaction.occurred_at >= start,
+        Transaction.occurred_at < end,
+        Transaction.voided.is_(False),
+    )
+    if user_id is not None:
+        q = q.where(Transaction.user_id == user_id)
+    return q
+
+
+async def diagnose(
+    session: AsyncSession,
+    *,
+    start: dt.datetime,
+    end: dt.datetime,
+    user_id: int | None,
+    verbose: bool,
+    emit: Callable[[str], None],
+) -> None:
+    # Totals per account are aggregated by the database; only one row per account comes back
+    q_tot = _month_filter(
+        select(Transaction.account_id, func.sum(_signed_cents()), func.count())
+        .join(Category, Transaction.category_id == Category.id, isouter=True)
+        .group_by(Transaction.account_id),
+        start,
+        end,
+        user_id,
+    )
+    totals: dict[int, tuple[int, int]] = {
+        acc_id: (int(cents or 0), int(n)) for acc_id, cents, n in (await session.execute(q_tot)).all()
+    }
+
+    q_acc = select(Account)
+    if user_id is not None:
+        q_acc = q_acc.where(Account.user_id == user_id)
+    else:
+        # Whole-database mode: only load the accounts that actually moved. A
+        # subquery, not the ids from `totals`: one bind parameter per account
+        # would overflow the driver's limit (32767 on asyncpg) on large databases
+        moved = _month_filter(select(Transaction.account_id), start, end, None)
+        q_acc = q_acc.where(Account.id.in_(moved.scalar_subquery()))
+    accounts: dict[int, Account] = {a.id: a for a in (await session.execute(q_acc)).scalars().all()}
+
+    emit("--- Accounts ---")
+    for a in accounts.values():
+        emit(f"Account id={a.id} name={a.name} currency={a.currency} status={getattr(a, 'status', 'ACTIVE')}")
+
+    emit("")
+    emit("--- Recent Transfers (10) ---")
+    q_tr = select(Transfer).order_by(Transfer.id.desc()).limit(10)
+    if user_id is not None:
+        q_tr = q_tr.where(Transfer.user_id == user_id)
+    for t in (await session.execute(q_tr)).scalars().all():
+        emit(f"Transfer id={t.id} user={t.user_id} src={t.src_account_id} dst={t.dst_account_id} src_cents={t.src_amount_cents} dst_cents={t.dst_amount_cents} when={t.occurred_at} voided={getattr(t, 'voided', False)}")
+
+    if verbose:
+        emit("")
+        emit("--- Transactions in month ---")
+        q_tx = _month_filter(
+            select(
+                Transaction.id,
+                Transaction.account_id,
+                Transaction.amount_cents,
+                Category.type,
+                Transaction.transfer_id,
+                Transaction.occurred_at,
+            )
+            .join(Category, Transaction.category_id == Category.id, isouter=True)
+            .order_by(Transaction.occurred_at, Transaction.id),
+            start,
+            end,
+            user_id,
+        )
+        # Stream rows with a server-side cursor instead of materializing the month
+        result = await session.stream(q_tx.execution_options(yield_per=1000))
+        async for tx_id, acc_id, cents, typ, transfer_id, occurred_at in result:
+            sign = -1 if str(typ or "").upper() == "EXPENSE" else 1
+            emit(f"tx id={tx_id} acc={acc_id} cents={cents} sign={sign} type={typ} transfer_id={transfer_id} when={occurred_at}")
+
+    emit("")
+    emit("--- Totals (cents) ---")
+    for acc_id, (cents, n) in sorted(totals.items()):
+        acc = accounts.get(acc_id)
+        cur = acc.currency if acc else '??'
+        emit(f"account_id={acc_id} total_cents={cents} currency={cur} transactions={n}")
+
+
+async def _users_with_activity(session: AsyncSession, start: dt.datetime, end: dt.datetime) -> list[int]:
+    q = _month_filter(select(Transaction.user_id).distinct(), start, end, None)
+    return sorted((await session.execute(q)).scalars().all())
+
+
+async def diagnose_all_users(
+    async_session: async_sessionmaker[AsyncSession],
+    *,
+    start: dt.datetime,
+    end: dt.datetime,
+    verbose: bool,
+    concurrency: int,
+) -> None:
+    async with async_session() as session:
+        user_ids = await _users_with_activity(session, start, end)
+    print(f"Usuários com movimento: {len(user_ids)}")
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one(uid: int) -> None:
+        async with sem:
+            async with async_session() as session:
+                # Lines are prefixed so output from concurrent users stays attributable
+                await diagnose(
+                    session,
+                    start=start,
+                    end=end,
+                    user_id=uid,
+                    verbose=verbose,
+                    emit=lambda line, uid=uid: print(f"[user={uid}] {line}"),
+                )
+
+    await asyncio.gather(*(_one(uid) for uid in user_ids))
+
+
+def async_db_url(db_url: str) -> str:
+    # Suporta URLs sync convertendo para async quando necessário
+    if db_url.startswith("postgresql://"):
+        return db_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if db_url.startswith("postgres://"):
+        return db_url.replace("postgres://", "postgresql+asyncpg://", 1)
+    return db_url
+
+
+def engine_kwargs(db_url: str, concurrency: int) -> dict:
+    if db_url.startswith("sqlite"):
+        return {}
+    # Bound the pool so parallel diagnostics never exceed `concurrency` connections
+    return {"pool_size": concurrency, "max_overflow": 0}
+
+
 async def main():
     args = parse_args()
     # Load .env first
@@ -39,71 +208,32 @@ async def main():
     if not db_url:
         print("DATABASE_URL não definido no ambiente.")
         return
+    db_url = async_db_url(db_url)
+    concurrency = max(1, args.concurrency)
 
-    # Suporta URLs sync convertendo para async quando necessário
-    if db_url.startswith("postgresql://"):
-        db_url = db_url.replace("postgresql://", "postgresql+asyncpg://", 1)
-    elif db_url.startswith("postgres://"):
-        db_url = db_url.replace("postgres://", "postgresql+asyncpg://", 1)
-
-    engine = create_async_engine(db_url, future=True)
+    engine = create_async_engine(db_url, future=True, **engine_kwargs(db_url, concurrency))
     async_session = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
     now = dt.datetime.now(dt.timezone.utc)
     year = args.year or now.year
     month = args.month or now.month
+    start, end = month_range(year, month)
 
-    async with async_session() as session:
+    try:
         print(f"Diagnóstico: {year}-{month:02d} (UTC)")
+        if args.all_users:
+            await diagnose_all_users(
+                async_session, start=start, end=end, verbose=args.verbose, concurrency=concurrency
+            )
+            return
         if args.user:
             print(f"Filtro user_id={args.user}")
-        print("--- Accounts ---")
-        q_acc = select(Account)
-        if args.user:
-            q_acc = q_acc.where(Account.user_id == args.user)
-        accounts = (await session.execute(q_acc)).scalars().all()
-        for a in accounts:
-            print(f"Account id={a.id} name={a.name} currency={a.currency} status={getattr(a, 'status', 'ACTIVE')}")
-
-        print("\n--- Recent Transfers (10) ---")
-        q_tr = select(Transfer).order_by(Transfer.id.desc()).limit(10)
-        if args.user:
-            q_tr = q_tr.where(Transfer.user_id == args.user)
-        transfers = (await session.execute(q_tr)).scalars().all()
-        for t in transfers:
-            print(f"Transfer id={t.id} user={t.user_id} src={t.src_account_id} dst={t.dst_account_id} src_cents={t.src_amount_cents} dst_cents={t.dst_amount_cents} when={t.occurred_at} voided={getattr(t, 'voided', False)}")
-
-        print("\n--- Transactions in month ---")
-        q_tx = (
-            select(Transaction, Account, Category)
-            .join(Account, Transaction.account_id == Account.id)
-            .join(Category, Transaction.category_id == Category.id, isouter=True)
-        )
-        if args.user:
-            q_tx = q_tx.where(Transaction.user_id == args.user)
-        rows = (await session.execute(q_tx)).all()
-        totals: dict[int, int] = {}
-        for tx, acc, cat in rows:
-            occ = tx.occurred_at
-            if occ.tzinfo is not None:
-                occ = occ.astimezone(dt.timezone.utc)
-            if occ.year != year or occ.month != month:
-                continue
-            sign = 1
-            if cat is not None and str(getattr(cat, 'type', '')).upper() == 'EXPENSE':
-                sign = -1
-            if bool(getattr(tx, 'voided', False)):
-                continue
-            totals[tx.account_id] = totals.get(tx.account_id, 0) + sign * int(tx.amount_cents)
-            print(f"tx id={tx.id} acc={tx.account_id} cents={tx.amount_cents} sign={sign} type={getattr(cat, 'type', None)} transfer_id={tx.transfer_id} voided={tx.voided} when={tx.occurred_at}")
-
-        print("\n--- Totals (cents) ---")
-        for acc_id, cents in sorted(totals.items()):
-            acc = next((a for a in accounts if a.id == acc_id), None)
-            cur = acc.currency if acc else '??'
-            print(f"account_id={acc_id} total_cents={cents} currency={cur}")
-
-    await engine.dispose()
+        async with async_session() as session:
+            await diagnose(
+                session, start=start, end=end, user_id=args.user, verbose=args.verbose, emit=print
+            )
+    finally:
+        await engine.dispose()
 
 
 if __name__ == "__main__":
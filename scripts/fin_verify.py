@@ -0,0 +1,316 @@
+"""Verificação de consistência do ledger financeiro (incremental).
+
+Recalcula saldos por conta e confere a integridade dos pares de transferência:
+- cada `transfer_id` tem exatamente duas pernas (saída na conta origem, entrada na destino);
+- `voided` das pernas bate com o da transferência;
+- centavos das pernas batem com `src_amount_cents`/`dst_amount_cents`;
+- a parcela de transferências no saldo de cada conta bate com as transferências ativas;
+- transações pertencem ao mesmo usuário da conta.
+
+Processa usuários em blocos (`--chunk-size`) e persiste um high-water mark em
+`--state-file`: execuções seguintes só verificam linhas com `updated_at` posterior
+à última execução concluída. Uma execução interrompida retoma do último bloco salvo.
+"""
+import argparse
+import asyncio
+import datetime as dt
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+# Ensure project root is on sys.path when running as a script
+ROOT: Path = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy import select, func, case, union
+from dotenv import load_dotenv
+
+from app.modules.finance.infrastructure.persistence.models.account import Account
+from app.modules.finance.infrastructure.persistence.models.category import Category
+from app.modules.finance.infrastructure.persistence.models.transaction import Transaction
+from app.modules.finance.infrastructure.persistence.models.transfer import Transfer
+from scripts.fin_diag import async_db_url, engine_kwargs
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Verificação incremental de saldos e pares de transferência")
+    p.add_argument("--state-file", type=str, default=str(ROOT / ".fin_verify_state.json"), help="Arquivo do high-water mark (default: ./.fin_verify_state.json)")
+    p.add_argument("--full", action="store_true", help="Ignora o high-water mark e verifica tudo")
+    p.add_argument("--chunk-size", type=int, default=500, help="Usuários por bloco (default: 500)")
+    p.add_argument("--overlap-seconds", type=int, default=300, help="Margem sobre o high-water mark para relógios/commits atrasados (default: 300)")
+    p.add_argument("--user", type=int, default=None, help="Verifica apenas um usuário (não altera o estado)")
+    p.add_argument("--verbose", action="store_true", help="Imprime o saldo recalculado de cada conta verificada")
+    p.add_argument("--env-file", type=str, default=str(ROOT / ".env"), help="Caminho do arquivo .env (default: ./.env)")
+    return p.parse_args()
+
+
+@dataclass
+class State:
+    high_water_mark: dt.datetime | None = None
+    # Progress of an interrupted run: resume after this user id with the same run start
+    run_started_at: dt.datetime | None = None
+    last_user_id: int | None = None
+
+    @classmethod
+    def load(cls, path: Path) -> "State":
+        if not path.exists():
+            return cls()
+        raw = json.loads(path.read_text())
+
+        def _ts(key: str) -> dt.datetime | None:
+            return dt.datetime.fromisoformat(raw[key]) if raw.get(key) else None
+
+        return cls(
+            high_water_mark=_ts("high_water_mark"),
+            run_started_at=_ts("run_started_at"),
+            last_user_id=raw.get("last_user_id"),
+        )
+
+    def save(self, path: Path) -> None:
+        data = {
+            "high_water_mark": self.high_water_mark.isoformat() if self.high_water_mark else None,
+            "run_started_at": self.run_started_at.isoformat() if self.run_started_at else None,
+            "last_user_id": self.last_user_id,
+        }
+        # Write-then-rename so a crash never leaves a truncated state file
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(data, indent=2))
+        os.replace(tmp, path)
+
+
+@dataclass
+class Report:
+    issues: list[str] = field(default_factory=list)
+    users: int = 0
+    accounts: int = 0
+    transfers: int = 0
+
+    def issue(self, msg: str) -> None:
+        self.issues.append(msg)
+        print(f"ISSUE {msg}")
+
+
+def _changed(col: Any, since: dt.datetime | None) -> Any:
+    return col > since if since is not None else True
+
+
+async def _next_user_chunk(
+    session: AsyncSession, *, since: dt.datetime | None, after_user: int | None, limit: int
+) -> list[int]:
+    """Next ascending block of user ids that have rows changed since `since`."""
+    lower = after_user if after_user is not None else -1
+    q_tx = select(Transaction.user_id).where(Transaction.user_id > lower, _changed(Transaction.updated_at, since))
+    q_tr = select(Transfer.user_id).where(Transfer.user_id > lower, _changed(Transfer.updated_at, since))
+    u = union(q_tx, q_tr).subquery()
+    q = select(u.c.user_id).order_by(u.c.user_id).limit(limit)
+    return list((await session.execute(q)).scalars().all())
+
+
+async def _check_chunk(
+    session: AsyncSession, user_ids: list[int], since: dt.datetime | None, report: Report, verbose: bool
+) -> None:
+    # Transfers touched directly or through one of their legs
+    changed_tr_ids = set(
+        (
+            await session.execute(
+                select(Transfer.id).where(Transfer.user_id.in_(user_ids), _changed(Transfer.updated_at, since))
+            )
+        ).scalars()
+    )
+    changed_tx = (
+        await session.execute(
+            select(Transaction.account_id, Transaction.transfer_id).where(
+                Transaction.user_id.in_(user_ids), _changed(Transaction.updated_at, since)
+            )
+        )
+    ).all()
+    touched_accounts = {acc_id for acc_id, _ in changed_tx}
+    changed_tr_ids.update(tr_id for _, tr_id in changed_tx if tr_id is not None)
+
+    # Transactions whose account belongs to someone else
+    bad_owner = (
+        await session.execute(
+            select(Transaction.id, Transaction.user_id, Account.user_id)
+            .join(Account, Transaction.account_id == Account.id)
+            .where(
+                Transaction.user_id.in_(user_ids),
+                _changed(Transaction.updated_at, since),
+                Account.user_id != Transaction.user_id,
+            )
+        )
+    ).all()
+    for tx_id, tx_user, acc_user in bad_owner:
+        report.issue(f"tx id={tx_id} user={tx_user} references account of user={acc_user}")
+
+    # Transfer pair integrity, in blocks to keep IN lists bounded
+    tr_ids = sorted(changed_tr_ids)
+    for i in range(0, len(tr_ids), 1000):
+        block = tr_ids[i : i + 1000]
+        transfers = {t.id: t for t in (await session.execute(select(Transfer).where(Transfer.id.in_(block)))).scalars()}
+        legs: dict[int, list[tuple[int, int, int, bool]]] = {}
+        for tx_id, tr_id, acc_id, cents, voided in (
+            await session.execute(
+                select(
+                    Transaction.id,
+                    Transaction.transfer_id,
+                    Transaction.account_id,
+                    Transaction.amount_cents,
+                    Transaction.voided,
+                ).where(Transaction.transfer_id.in_(block))
+            )
+        ).all():
+            legs.setdefault(tr_id, []).append((tx_id, acc_id, cents, bool(voided)))
+        for tr_id in block:
+            tr = transfers.get(tr_id)
+            if tr is None:
+                report.issue(f"transfer id={tr_id} referenced by transactions but missing")
+                continue
+            report.transfers += 1
+            touched_accounts.update((tr.src_account_id, tr.dst_account_id))
+            _check_pair(tr, legs.get(tr_id, []), report)
+
+    if not touched_accounts:
+        return
+    acc_ids = sorted(touched_accounts)
+    report.accounts += len(acc_ids)
+    accounts = {a.id: a for a in (await session.execute(select(Account).where(Account.id.in_(acc_ids)))).scalars()}
+
+    # Full recomputed balance (all active transactions) and its transfer component
+    signed = case((Category.type == "EXPENSE", -Transaction.amount_cents), else_=Transaction.amount_cents)
+    bal_rows = (
+        await session.execute(
+            select(
+                Transaction.account_id,
+                func.sum(signed),
+                func.sum(case((Transaction.transfer_id.is_not(None), signed), else_=0)),
+            )
+            .join(Category, Transaction.category_id == Category.id, isouter=True)
+            .where(Transaction.account_id.in_(acc_ids), Transaction.voided.is_(False))
+            .group_by(Transaction.account_id)
+        )
+    ).all()
+    balances = {acc_id: (int(total or 0), int(via_tr or 0)) for acc_id, total, via_tr in bal_rows}
+
+    # Expected transfer component: incoming dst cents minus outgoing src cents of active transfers
+    expected_tr: dict[int, int] = {}
+    for acc_col, cents_col, sign in (
+        (Transfer.dst_account_id, Transfer.dst_amount_cents, 1),
+        (Transfer.src_account_id, Transfer.src_amount_cents, -1),
+    ):
+        rows = (
+            await session.execute(
+                select(acc_col, func.sum(cents_col))
+                .where(acc_col.in_(acc_ids), Transfer.voided.is_(False))
+                .group_by(acc_col)
+            )
+        ).all()
+        for acc_id, cents in rows:
+            expected_tr[acc_id] = expected_tr.get(acc_id, 0) + sign * int(cents or 0)
+
+    for acc_id in acc_ids:
+        total, via_tr = balances.get(acc_id, (0, 0))
+        expected = expected_tr.get(acc_id, 0)
+        acc = accounts.get(acc_id)
+        if acc is None:
+            report.issue(f"account id={acc_id} referenced but missing")
+            continue
+        if via_tr != expected:
+            report.issue(
+                f"account id={acc_id} transfer component {via_tr} != transfers net {expected} ({acc.currency})"
+            )
+        if verbose:
+            print(f"account_id={acc_id} user={acc.user_id} balance_cents={total} transfers_cents={via_tr} currency={acc.currency}")
+
+
+def _check_pair(tr: Transfer, legs: list[tuple[int, int, int, bool]], report: Report) -> None:
+    if len(legs) != 2:
+        report.issue(f"transfer id={tr.id} has {len(legs)} legs (expected 2)")
+        return
+    by_account = {acc_id: (tx_id, cents, voided) for tx_id, acc_id, cents, voided in legs}
+    out_leg = by_account.get(tr.src_account_id)
+    in_leg = by_account.get(tr.dst_account_id)
+    if out_leg is None or in_leg is None:
+        report.issue(f"transfer id={tr.id} legs not on src={tr.src_account_id}/dst={tr.dst_account_id}")
+        return
+    if out_leg[1] != tr.src_amount_cents:
+        report.issue(f"transfer id={tr.id} out leg tx={out_leg[0]} cents={out_leg[1]} != src_amount_cents={tr.src_amount_cents}")
+    if in_leg[1] != tr.dst_amount_cents:
+        report.issue(f"transfer id={tr.id} in leg tx={in_leg[0]} cents={in_leg[1]} != dst_amount_cents={tr.dst_amount_cents}")
+    tr_voided = bool(tr.voided)
+    for tx_id, _, voided in (out_leg, in_leg):
+        if voided != tr_voided:
+            report.issue(f"transfer id={tr.id} voided={tr_voided} but leg tx={tx_id} voided={voided}")
+
+
+async def run(args: argparse.Namespace, async_session: async_sessionmaker[AsyncSession]) -> Report:
+    state_path = Path(args.state_file)
+    state = State() if args.full else State.load(state_path)
+    persist = args.user is None
+    report = Report()
+
+    since = state.high_water_mark
+    if since is not None:
+        since = since - dt.timedelta(seconds=args.overlap_seconds)
+    # A single-user check never resumes: the interrupted run's cursor belongs to
+    # the chunked scan and could be past `args.user`
+    if state.run_started_at is not None and not args.full and persist:
+        print(f"Retomando execução iniciada em {state.run_started_at.isoformat()} após user_id={state.last_user_id}")
+        run_started_at = state.run_started_at
+        after_user = state.last_user_id
+    else:
+        run_started_at = dt.datetime.now(dt.timezone.utc)
+        after_user = None
+    print(f"Verificando alterações desde: {since.isoformat() if since else 'início (varredura completa)'}")
+
+    while True:
+        async with async_session() as session:
+            if args.user is not None:
+                chunk = [args.user] if after_user is None else []
+            else:
+                chunk = await _next_user_chunk(session, since=since, after_user=after_user, limit=args.chunk_size)
+            if not chunk:
+                break
+            await _check_chunk(session, chunk, since, report, args.verbose)
+        report.users += len(chunk)
+        after_user = chunk[-1]
+        if persist:
+            state.run_started_at = run_started_at
+            state.last_user_id = after_user
+            state.save(state_path)
+
+    if persist:
+        # Only a completed run advances the high-water mark
+        state.high_water_mark = run_started_at
+        state.run_started_at = None
+        state.last_user_id = None
+        state.save(state_path)
+    return report
+
+
+async def main():
+    args = parse_args()
+    load_dotenv(args.env_file)
+    db_url = os.getenv("DATABASE_URL")
+    if not db_url:
+        print("DATABASE_URL não definido no ambiente.")
+        sys.exit(2)
+    db_url = async_db_url(db_url)
+    engine = create_async_engine(db_url, future=True, **engine_kwargs(db_url, 1))
+    async_session = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    try:
+        report = await run(args, async_session)
+    finally:
+        await engine.dispose()
+    print(
+        f"Verificados: users={report.users} accounts={report.accounts} transfers={report.transfers} issues={len(report.issues)}"
+    )
+    sys.exit(1 if report.issues else 0)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
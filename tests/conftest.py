@@ -3,3 +3,15 @@ import os
 # Ensure a SECRET_KEY for all tests to satisfy settings validation
 os.environ.setdefault("SECRET_KEY", "test-secret-key-global")
 
+
+import pytest
+
+from app.core.settings import clear_settings_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_settings():
+    # Settings are cached per process; tests that change env vars get a fresh parse
+    clear_settings_cache()
+    yield
+    clear_settings_cache()
@@ -0,0 +1,142 @@
+import asyncio
+import datetime as dt
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine, AsyncSession
+
+from app.main import create_app
+from app.db.session import get_session as app_get_session
+from app.db.base import Base
+from app.core.auth.persistence.models.user import User
+from app.core.auth.security import get_current_principal
+from app.core.http_cache import etag_matches, weak_etag
+
+
+DB_FILE = Path("./test_fin_conditional_get.db")
+TEST_DB_URL = f"sqlite+aiosqlite:///{DB_FILE}"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+def app():
+    app = create_app()
+    return app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_test_db(app):
+    if DB_FILE.exists():
+        DB_FILE.unlink()
+
+    engine = create_async_engine(TEST_DB_URL, future=True)
+    async_session = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+    async def init_models():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with async_session() as s:
+            s.add_all([
+                User(email="etag1@example.com", hashed_password="x"),
+                User(email="etag2@example.com", hashed_password="x"),
+            ])
+            await s.commit()
+
+    asyncio.run(init_models())
+
+    async def override_get_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[app_get_session] = override_get_session
+
+    yield
+
+    async def drop_models():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+    asyncio.run(drop_models())
+    try:
+        DB_FILE.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _as_user(app, user_id: int, email: str):
+    async def _get_user():
+        return User(id=user_id, email=email, hashed_password="x")
+    app.dependency_overrides[get_current_principal] = _get_user
+
+
+def test_etag_weak_comparison():
+    tag = weak_etag("accounts", "1;x")
+    assert tag.startswith('W/"')
+    assert etag_matches(tag, tag)
+    assert etag_matches(tag[2:], tag)
+    assert etag_matches(f'"other", {tag}', tag)
+    assert etag_matches("*", tag)
+    assert not etag_matches(None, tag)
+    assert not etag_matches(weak_etag("accounts", "2;x"), tag)
+
+
+def test_accounts_list_not_modified_until_write(client, app):
+    _as_user(app, 1, "etag1@example.com")
+    assert client.post("/fin/accounts", json={"name": "A1", "currency": "EUR"}).status_code == 201
+
+    r1 = client.get("/fin/accounts")
+    assert r1.status_code == 200
+    etag = r1.headers["etag"]
+    assert r1.headers["cache-control"] == "private, no-cache"
+
+    r2 = client.get("/fin/accounts", headers={"If-None-Match": etag})
+    assert r2.status_code == 304
+    assert r2.content == b""
+    assert r2.headers["etag"] == etag
+
+    # Query parameters are part of the tag
+    r3 = client.get("/fin/accounts?include_closed=true", headers={"If-None-Match": etag})
+    assert r3.status_code == 200
+
+    # Any write changes the version
+    acc_id = r1.json()[0]["id"]
+    assert client.patch(f"/fin/accounts/{acc_id}", json={"name": "A1-renamed"}).status_code == 200
+    r4 = client.get("/fin/accounts", headers={"If-None-Match": etag})
+    assert r4.status_code == 200
+    assert r4.headers["etag"] != etag
+    assert r4.json()[0]["name"] == "A1-renamed"
+
+
+def test_transactions_and_categories_versions(client, app):
+    _as_user(app, 1, "etag1@example.com")
+    acc = client.post("/fin/accounts", json={"name": "TXA", "currency": "EUR"}).json()["id"]
+    cat = client.post("/fin/categories", json={"name": "C1", "type": "EXPENSE"}).json()["id"]
+    when = dt.datetime(2025, 5, 5, 12, tzinfo=dt.timezone.utc).isoformat()
+    tx = client.post("/fin/transactions", json={"account_id": acc, "category_id": cat, "amount": "1.00", "occurred_at": when}).json()["id"]
+
+    cats = client.get("/fin/categories")
+    assert client.get("/fin/categories", headers={"If-None-Match": cats.headers["etag"]}).status_code == 304
+
+    txs = client.get("/fin/transactions")
+    etag = txs.headers["etag"]
+    assert client.get("/fin/transactions", headers={"If-None-Match": etag}).status_code == 304
+
+    # Deleting lowers the count even though no updated_at moves forward
+    assert client.delete(f"/fin/transactions/{tx}").status_code == 204
+    assert client.get("/fin/transactions", headers={"If-None-Match": etag}).status_code == 200
+
+    # Another user's writes do not invalidate this user's lists
+    etag = client.get("/fin/transactions").headers["etag"]
+    _as_user(app, 2, "etag2@example.com")
+    assert client.post("/fin/accounts", json={"name": "OTHER", "currency": "EUR"}).status_code == 201
+    _as_user(app, 1, "etag1@example.com")
+    assert client.get("/fin/transactions", headers={"If-None-Match": etag}).status_code == 304
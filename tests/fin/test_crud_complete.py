@@ -14,7 +14,7 @@ from app.main import create_app
 from app.db.session import get_session as app_get_session
 from app.db.base import Base
 from app.core.auth.persistence.models.user import User
-from app.core.auth.security import get_current_user
+from app.core.auth.security import get_current_principal
 
 
 DB_FILE = Path("./test_fin_crud_complete.db")
@@ -81,7 +81,7 @@ def setup_test_db(app):
 def _as_user(app, user_id: int, email: str):
     async def _get_user():
         return User(id=user_id, email=email, hashed_password="x")
-    app.dependency_overrides[get_current_user] = _get_user
+    app.dependency_overrides[get_current_principal] = _get_user
 
 
 def test_accounts_categories_transactions_crud_complete(client, app):
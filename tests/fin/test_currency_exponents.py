@@ -1,7 +1,22 @@
 from decimal import Decimal
 import pytest
 
-from app.core.money import currency_exponent, validate_amount_for_currency, amount_to_cents
+from app.core.money import (
+    currency_exponent,
+    validate_amount_for_currency,
+    amount_to_cents,
+    cents_to_amount,
+    cents_to_amounts,
+    amounts_to_cents,
+    currency_context,
+    quantize_amount,
+    currency_info,
+    is_valid_currency,
+    CURRENCIES,
+    MinorUnitConverter,
+    RATE_SCALE,
+    scaled_rate,
+)
 
 
 def test_currency_exponent_known_codes():
@@ -31,3 +46,85 @@ def test_amount_to_cents_varied_currencies():
     # KWD: 3 decimals
     assert amount_to_cents(Decimal("1.234"), "KWD") == 1234
 
+
+
+def test_cents_to_amount_keeps_currency_places():
+    assert str(cents_to_amount(1050, "EUR")) == "10.50"
+    assert str(cents_to_amount(0, "EUR")) == "0.00"
+    assert str(cents_to_amount(-5, "EUR")) == "-0.05"
+    assert str(cents_to_amount(123, "JPY")) == "123"
+    assert str(cents_to_amount(1234, "kwd")) == "1.234"
+    # bigint-sized values stay exact
+    assert cents_to_amount(9_223_372_036_854_775_807, "EUR") == Decimal("92233720368547758.07")
+
+
+def test_amount_to_cents_accepts_trailing_zeros_and_rejects_excess():
+    assert amount_to_cents(Decimal("10.500"), "EUR") == 1050
+    assert amount_to_cents(Decimal("-0.01"), "EUR") == -1
+    assert amount_to_cents(Decimal("1E+2"), "JPY") == 100
+    with pytest.raises(ValueError):
+        amount_to_cents(Decimal("10.005"), "EUR")
+
+
+def test_batch_conversions_round_trip():
+    cents = [0, 1, -1, 1050, 99999]
+    amounts = cents_to_amounts(cents, "EUR")
+    assert [str(a) for a in amounts] == ["0.00", "0.01", "-0.01", "10.50", "999.99"]
+    assert amounts_to_cents(amounts, "EUR") == cents
+    with pytest.raises(ValueError):
+        amounts_to_cents([Decimal("1"), Decimal("1.5")], "JPY")
+
+
+def test_currency_context_is_cached_and_quantizes_half_up():
+    ctx = currency_context("EUR")
+    assert ctx is currency_context("EUR")
+    assert (ctx.exponent, ctx.scale, ctx.quantum) == (2, 100, Decimal("0.01"))
+    assert quantize_amount(Decimal("2.345"), "EUR") == Decimal("2.35")
+    assert quantize_amount(Decimal("-2.345"), "EUR") == Decimal("-2.35")
+    # Unknown codes default to 2 places
+    assert currency_context("XYZ").exponent == 2
+
+
+def test_registry_metadata_and_validity():
+    assert currency_info("brl") == ("BRL", 986, 2)
+    assert currency_info("CLF").exponent == 4
+    assert currency_info("ISK").exponent == 0
+    assert currency_info("XYZ") is None
+    assert is_valid_currency("usd")
+    assert not is_valid_currency("ABC")
+    # Metals/testing codes have no minor unit and are not accepted
+    assert not is_valid_currency("XAU")
+    with pytest.raises(TypeError):
+        CURRENCIES["ABC"] = CURRENCIES["EUR"]  # type: ignore[index]
+    # Exponents now come from the registry instead of defaulting to 2
+    assert currency_exponent("IQD") == 3
+    assert str(cents_to_amount(5, "UGX")) == "5"
+
+
+def test_scaled_rate_is_fixed_point_at_ten_places():
+    assert scaled_rate(Decimal("5")) == 5 * RATE_SCALE
+    assert scaled_rate(Decimal("0.1234567891")) == 1234567891
+    # Beyond Numeric(18, 10) precision rounds half up
+    assert scaled_rate(Decimal("0.00000000005")) == 1
+
+
+def test_minor_unit_converter_rounds_once_per_total():
+    conv = MinorUnitConverter("EUR")
+    factor = conv.factor("USD", scaled_rate(Decimal("0.3333333333")))
+    # Three 0.01 USD rows: rounding each row would give 0.00 EUR
+    total = sum(1 * factor for _ in range(3))
+    assert conv.to_amount(total) == Decimal("0.01")
+    # 1.00 USD * 0.015 = 0.015 EUR -> half up (away from zero for negatives)
+    half = conv.factor("USD", scaled_rate(Decimal("0.015")))
+    assert conv.to_amount(100 * half) == Decimal("0.02")
+    assert conv.to_amount(-100 * half) == Decimal("-0.02")
+
+
+def test_minor_unit_converter_aligns_exponents():
+    # 1500 JPY (exp 0) -> KWD (exp 3) at 0.002 = 3.000 KWD
+    conv = MinorUnitConverter("KWD")
+    assert conv.to_amount(1500 * conv.factor("JPY", scaled_rate(Decimal("0.002")))) == Decimal("3.000")
+    # 1.234 KWD -> JPY at 500 = 617 JPY; same currency is exact
+    jpy = MinorUnitConverter("JPY")
+    assert jpy.to_amount(1234 * jpy.factor("KWD", scaled_rate(Decimal("500")))) == Decimal("617")
+    assert jpy.to_amount(42 * jpy.factor("JPY", RATE_SCALE)) == Decimal("42")
@@ -15,7 +15,7 @@ from app.main import create_app
 from app.db.session import get_session as app_get_session
 from app.db.base import Base
 from app.core.auth.persistence.models.user import User
-from app.core.auth.security import get_current_user
+from app.core.auth.security import get_current_principal
 
 
 DB_FILE = Path("./test_fin_endpoints.db")
@@ -84,7 +84,7 @@ def test_fin_endpoints_happy_path(client, app):
     async def _get_user1():
         return User(id=1, email="fin1@example.com", hashed_password="x")
 
-    app.dependency_overrides[get_current_user] = _get_user1
+    app.dependency_overrides[get_current_principal] = _get_user1
 
     # Create account
     r_acc = client.post("/fin/accounts", json={"name": "Main", "currency": "EUR"})
@@ -151,7 +151,7 @@ def test_fin_isolation_across_users(client, app):
     async def _get_user2():
         return User(id=2, email="fin2@example.com", hashed_password="x")
 
-    app.dependency_overrides[get_current_user] = _get_user2
+    app.dependency_overrides[get_current_principal] = _get_user2
     # Should see zero accounts initially
     r_accs = client.get("/fin/accounts")
     assert r_accs.status_code == 200
@@ -14,7 +14,7 @@ from app.main import create_app
 from app.db.session import get_session as app_get_session
 from app.db.base import Base
 from app.core.auth.persistence.models.user import User
-from app.core.auth.security import get_current_user
+from app.core.auth.security import get_current_principal
 
 
 DB_FILE = Path("./test_fin_filters.db")
@@ -81,7 +81,7 @@ def test_transactions_filters(client, app):
     async def _get_user():
         return User(id=1, email="flt1@example.com", hashed_password="x")
 
-    app.dependency_overrides[get_current_user] = _get_user
+    app.dependency_overrides[get_current_principal] = _get_user
 
     # account + categories
     acc_id = client.post("/fin/accounts", json={"name": "A1", "currency": "EUR"}).json()["id"]
@@ -121,7 +121,7 @@ def test_patch_invalid_amount(client, app):
     async def _get_user():
         return User(id=1, email="flt1@example.com", hashed_password="x")
 
-    app.dependency_overrides[get_current_user] = _get_user
+    app.dependency_overrides[get_current_principal] = _get_user
 
     acc_id = client.post("/fin/accounts", json={"name": "A2", "currency": "EUR"}).json()["id"]
     now_iso = dt.datetime(2025, 1, 1, 12, tzinfo=dt.timezone.utc).isoformat()
@@ -135,7 +135,7 @@ def test_accounts_filter_by_name(client, app):
     async def _get_user():
         return User(id=1, email="flt1@example.com", hashed_password="x")
 
-    app.dependency_overrides[get_current_user] = _get_user
+    app.dependency_overrides[get_current_principal] = _get_user
 
     # create accounts
     client.post("/fin/accounts", json={"name": "Main", "currency": "EUR"})
@@ -154,7 +154,7 @@ def test_categories_filter_by_type(client, app):
     async def _get_user():
         return User(id=1, email="flt1@example.com", hashed_password="x")
 
-    app.dependency_overrides[get_current_user] = _get_user
+    app.dependency_overrides[get_current_principal] = _get_user
 
     # create categories of both types
     client.post("/fin/categories", json={"name": "Gift", "type": "INCOME"})
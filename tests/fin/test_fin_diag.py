@@ -0,0 +1,118 @@
+import asyncio
+import datetime as dt
+from pathlib import Path
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.auth.persistence.models.user import User
+from app.db.base import Base
+from app.modules.finance.infrastructure.persistence.models.account import Account
+from app.modules.finance.infrastructure.persistence.models.category import Category
+from app.modules.finance.infrastructure.persistence.models.transaction import Transaction
+from scripts import fin_diag
+
+
+START, END = fin_diag.month_range(2025, 3)
+IN_MONTH = dt.datetime(2025, 3, 10, tzinfo=dt.timezone.utc)
+
+
+def _tx(uid: int, acc: int, cat: int | None, cents: int, *, when: dt.datetime = IN_MONTH, voided: bool = False):
+    return Transaction(
+        user_id=uid, account_id=acc, category_id=cat, amount_cents=cents, occurred_at=when, voided=voided,
+    )
+
+
+async def _seed(factory: async_sessionmaker[AsyncSession]) -> None:
+    async with factory() as s:
+        for uid in (1, 2):
+            # Account 10*uid moves in March, 10*uid+1 never does; category 10*uid is an expense
+            s.add(User(id=uid, email=f"u{uid}@example.com", hashed_password="x"))
+            s.add(Account(id=10 * uid, user_id=uid, name="main", currency="BRL"))
+            s.add(Account(id=10 * uid + 1, user_id=uid, name="idle", currency="USD"))
+            s.add(Category(id=10 * uid, user_id=uid, name="out", type="EXPENSE"))
+            s.add(Category(id=10 * uid + 1, user_id=uid, name="in", type="INCOME"))
+        await s.flush()
+        s.add_all([
+            _tx(1, 10, 11, 1000),
+            _tx(1, 10, 10, 300),
+            _tx(1, 10, None, 5),  # uncategorized adds
+            _tx(1, 10, 10, 999, voided=True),
+            _tx(1, 10, 10, 999, when=END),  # April: outside the month
+            _tx(1, 11, 11, 999, when=START - dt.timedelta(seconds=1)),
+            _tx(2, 20, 20, 40),
+        ])
+        await s.commit()
+
+
+@pytest.fixture()
+def books(tmp_path: Path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'diag.db'}")
+    factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+    async def init() -> None:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        await _seed(factory)
+
+    asyncio.run(init())
+    yield factory
+    asyncio.run(engine.dispose())
+
+
+def _diagnose(factory, *, user_id: int | None, verbose: bool = False) -> list[str]:
+    lines: list[str] = []
+
+    async def run() -> None:
+        async with factory() as session:
+            await fin_diag.diagnose(
+                session, start=START, end=END, user_id=user_id, verbose=verbose, emit=lines.append
+            )
+
+    asyncio.run(run())
+    return lines
+
+
+def _section(lines: list[str], title: str) -> list[str]:
+    start = lines.index(title) + 1
+    end = lines.index("", start) if "" in lines[start:] else len(lines)
+    return lines[start:end]
+
+
+def test_single_user_totals(books):
+    lines = _diagnose(books, user_id=1)
+    assert _section(lines, "--- Totals (cents) ---") == [
+        "account_id=10 total_cents=705 currency=BRL transactions=3"
+    ]
+    # Single-user mode lists every account of the user, moved or not
+    assert [line.split(" name=")[0] for line in _section(lines, "--- Accounts ---")] == [
+        "Account id=10", "Account id=11"
+    ]
+    assert "--- Transactions in month ---" not in lines
+
+
+def test_whole_database_loads_only_moved_accounts(books):
+    lines = _diagnose(books, user_id=None)
+    assert _section(lines, "--- Totals (cents) ---") == [
+        "account_id=10 total_cents=705 currency=BRL transactions=3",
+        "account_id=20 total_cents=-40 currency=BRL transactions=1",
+    ]
+    assert sorted(line.split(" name=")[0] for line in _section(lines, "--- Accounts ---")) == [
+        "Account id=10", "Account id=20"
+    ]
+
+
+def test_verbose_streams_month_transactions_in_order(books):
+    rows = _section(_diagnose(books, user_id=1, verbose=True), "--- Transactions in month ---")
+    assert len(rows) == 3
+    assert [r.split(" cents=")[1].split()[0] for r in rows] == ["1000", "300", "5"]
+    assert " sign=-1 type=EXPENSE" in rows[1] and " sign=1 type=None" in rows[2]
+
+
+def test_all_users_prefixes_each_users_report(books, capsys):
+    asyncio.run(fin_diag.diagnose_all_users(books, start=START, end=END, verbose=False, concurrency=2))
+    out = capsys.readouterr().out.splitlines()
+    assert out[0] == "Usuários com movimento: 2"
+    assert "[user=1] account_id=10 total_cents=705 currency=BRL transactions=3" in out
+    assert "[user=2] account_id=20 total_cents=-40 currency=BRL transactions=1" in out
+    assert not any(line.startswith("[user=2] Account id=1") for line in out)
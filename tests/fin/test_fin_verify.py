@@ -0,0 +1,166 @@
+import argparse
+import asyncio
+import datetime as dt
+from pathlib import Path
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.auth.persistence.models.user import User
+from app.db.base import Base
+from app.modules.finance.infrastructure.persistence.models.account import Account
+from app.modules.finance.infrastructure.persistence.models.category import Category
+from app.modules.finance.infrastructure.persistence.models.transaction import Transaction
+from app.modules.finance.infrastructure.persistence.models.transfer import Transfer
+from scripts import fin_verify
+from scripts.fin_verify import State
+
+
+OLD = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+
+
+def _stamp(obj):
+    obj.created_at = obj.updated_at = OLD
+    return obj
+
+
+def _transfer(tid: int, uid: int, src: int, dst: int, *, voided: bool = False) -> Transfer:
+    return _stamp(Transfer(
+        id=tid, user_id=uid, src_account_id=src, dst_account_id=dst,
+        src_amount_cents=100, dst_amount_cents=100,
+        rate_base="BRL", rate_quote="BRL", rate_value=1,
+        occurred_at=OLD, voided=voided,
+    ))
+
+
+def _leg(uid: int, tid: int, acc: int, cat: int, cents: int) -> Transaction:
+    return _stamp(Transaction(
+        user_id=uid, account_id=acc, category_id=cat, amount_cents=cents, occurred_at=OLD, transfer_id=tid,
+    ))
+
+
+async def _seed(factory: async_sessionmaker[AsyncSession]) -> None:
+    async with factory() as s:
+        for uid in (1, 2, 3):
+            # Accounts 10*uid (source) and 10*uid+1 (destination); categories likewise
+            s.add(User(id=uid, email=f"u{uid}@example.com", hashed_password="x"))
+            s.add(_stamp(Account(id=10 * uid, user_id=uid, name="src", currency="BRL")))
+            s.add(_stamp(Account(id=10 * uid + 1, user_id=uid, name="dst", currency="BRL")))
+            s.add(_stamp(Category(id=10 * uid, user_id=uid, name="out", type="EXPENSE")))
+            s.add(_stamp(Category(id=10 * uid + 1, user_id=uid, name="in", type="INCOME")))
+        await s.flush()
+        # Users 1 and 3: consistent pairs
+        for uid in (1, 3):
+            s.add(_transfer(uid, uid, 10 * uid, 10 * uid + 1))
+            s.add(_leg(uid, uid, 10 * uid, 10 * uid, 100))
+            s.add(_leg(uid, uid, 10 * uid + 1, 10 * uid + 1, 100))
+        # User 2: missing in leg, cents mismatch, void mismatch
+        s.add_all([_transfer(21, 2, 20, 21), _transfer(22, 2, 20, 21), _transfer(23, 2, 20, 21, voided=True)])
+        s.add(_leg(2, 21, 20, 20, 100))
+        s.add_all([_leg(2, 22, 20, 20, 100), _leg(2, 22, 21, 21, 90)])
+        s.add_all([_leg(2, 23, 20, 20, 100), _leg(2, 23, 21, 21, 100)])
+        await s.commit()
+
+
+@pytest.fixture()
+def ledger(tmp_path: Path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'ledger.db'}")
+    factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+    async def init() -> None:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        await _seed(factory)
+
+    asyncio.run(init())
+    yield factory
+    asyncio.run(engine.dispose())
+
+
+def _args(tmp_path: Path, **overrides) -> argparse.Namespace:
+    opts = dict(
+        state_file=str(tmp_path / "state.json"), full=False, chunk_size=500,
+        overlap_seconds=0, user=None, verbose=False,
+    )
+    opts.update(overrides)
+    return argparse.Namespace(**opts)
+
+
+def test_state_roundtrip(tmp_path: Path):
+    path = tmp_path / "state.json"
+    assert State.load(path) == State()
+    state = State(high_water_mark=OLD, run_started_at=OLD + dt.timedelta(hours=1), last_user_id=7)
+    state.save(path)
+    assert State.load(path) == state
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+
+def test_reports_inconsistent_pairs_and_balances(ledger, tmp_path):
+    report = asyncio.run(fin_verify.run(_args(tmp_path), ledger))
+    assert report.users == 3 and report.transfers == 5
+    issues = report.issues
+    assert any(i.startswith("transfer id=21 has 1 legs") for i in issues)
+    assert any(i.startswith("transfer id=22 in leg") and "cents=90 != dst_amount_cents=100" in i for i in issues)
+    assert sum(i.startswith("transfer id=23 voided=True but leg") for i in issues) == 2
+    # Transfer component: legs of voided #23 still count, #21 lacks its in leg, #22 is short
+    assert any(i.startswith("account id=20 transfer component -300 != transfers net -200") for i in issues)
+    assert any(i.startswith("account id=21 transfer component 190 != transfers net 200") for i in issues)
+    assert len(issues) == 6, issues
+
+
+def test_second_run_skips_unchanged_users(ledger, tmp_path):
+    args = _args(tmp_path)
+    first = asyncio.run(fin_verify.run(args, ledger))
+    assert first.users == 3
+    state = State.load(Path(args.state_file))
+    assert state.high_water_mark is not None and state.last_user_id is None
+
+    assert asyncio.run(fin_verify.run(args, ledger)).users == 0
+
+    async def touch() -> None:
+        async with ledger() as s:
+            await s.execute(update(Transaction).where(Transaction.user_id == 3).values(amount_cents=100))
+            await s.commit()
+
+    asyncio.run(touch())
+    third = asyncio.run(fin_verify.run(args, ledger))
+    assert third.users == 1 and third.transfers == 1 and third.issues == []
+
+
+def test_interrupted_run_resumes_after_last_user(ledger, tmp_path, monkeypatch):
+    args = _args(tmp_path, chunk_size=1)
+    real_check = fin_verify._check_chunk
+
+    async def failing_check(session, user_ids, since, report, verbose):
+        if user_ids == [2]:
+            raise RuntimeError("interrupted")
+        await real_check(session, user_ids, since, report, verbose)
+
+    monkeypatch.setattr(fin_verify, "_check_chunk", failing_check)
+    with pytest.raises(RuntimeError):
+        asyncio.run(fin_verify.run(args, ledger))
+    state = State.load(Path(args.state_file))
+    assert state.last_user_id == 1 and state.high_water_mark is None
+    started = state.run_started_at
+    assert started is not None
+
+    monkeypatch.setattr(fin_verify, "_check_chunk", real_check)
+    resumed = asyncio.run(fin_verify.run(args, ledger))
+    assert resumed.users == 2  # users 2 and 3 only
+    state = State.load(Path(args.state_file))
+    # The cutoff is the interrupted run's start: changes made meanwhile are rechecked next time
+    assert state.high_water_mark == started
+    assert state.run_started_at is None and state.last_user_id is None
+
+
+def test_single_user_check_ignores_interrupted_run(ledger, tmp_path):
+    args = _args(tmp_path, user=2)
+    stale = State(run_started_at=OLD + dt.timedelta(days=1), last_user_id=3)
+    stale.save(Path(args.state_file))
+
+    report = asyncio.run(fin_verify.run(args, ledger))
+    assert report.users == 1 and report.transfers == 3
+    assert len(report.issues) == 6, report.issues
+    # The interrupted full run can still resume
+    assert State.load(Path(args.state_file)) == stale
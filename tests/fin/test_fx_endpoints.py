@@ -10,7 +10,7 @@ from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine, Asyn
 from app.main import create_app
 from app.db.session import get_session as app_get_session
 from app.db.base import Base
-from app.core.auth.security import get_current_user
+from app.core.auth.security import get_current_principal
 from app.core.auth.persistence.models.user import User
 
 
@@ -67,7 +67,7 @@ def setup_db(app):
 def _as_user(app, user_id: int, email: str):
     async def _get_user():
         return User(id=user_id, email=email, hashed_password="x")
-    app.dependency_overrides[get_current_user] = _get_user
+    app.dependency_overrides[get_current_principal] = _get_user
 
 
 def test_post_fx_rates_create_and_update(client, app):
@@ -104,3 +104,49 @@ def test_transactions_table_schema_and_indexes():
     assert {"user_id", "account_id"} in cols_sets
     assert {"user_id", "category_id"} in cols_sets
 
+
+
+def test_transfers_user_occurred_index():
+    insp = get_inspector()
+    idx = insp.get_indexes("transfers")
+    assert any(i.get("column_names") == ["user_id", "occurred_at"] for i in idx)
+
+
+def test_user_updated_at_indexes():
+    insp = get_inspector()
+    for table in ("accounts", "categories", "transactions"):
+        idx = insp.get_indexes(table)
+        assert any(i.get("column_names") == ["user_id", "updated_at"] for i in idx), table
+
+
+def test_sync_tombstones_table_and_transfer_index():
+    insp = get_inspector()
+    cols = {c["name"] for c in insp.get_columns("fin_tombstones")}
+    assert {"user_id", "entity", "entity_id", "deleted_at"} <= cols
+    idx = insp.get_indexes("fin_tombstones")
+    assert any(i.get("column_names") == ["user_id", "deleted_at"] for i in idx)
+    idx = insp.get_indexes("transfers")
+    assert any(i.get("column_names") == ["user_id", "updated_at"] for i in idx)
+
+
+def test_auth_token_tables():
+    insp = get_inspector()
+    cols = {c["name"] for c in insp.get_columns("refresh_tokens")}
+    assert {"user_id", "family_id", "token_hash", "expires_at", "revoked_at"} <= cols
+    assert {c["name"] for c in insp.get_columns("revoked_tokens")} == {"jti", "expires_at"}
+
+
+def test_transactions_partial_indexes():
+    insp = get_inspector()
+    idx = {i["name"]: i for i in insp.get_indexes("transactions")}
+    active = idx["ix_transactions_user_occurred_active"]
+    assert active["column_names"] == ["user_id", "occurred_at"]
+    assert "voided" in str(active["dialect_options"]["sqlite_where"])
+    assert idx["ix_transactions_transfer_id"]["column_names"] == ["transfer_id"]
+
+
+def test_tombstone_triggers():
+    eng = create_engine(SQLITE_SYNC_URL)
+    with eng.connect() as conn:
+        names = set(conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'trigger'").scalars())
+    assert {f"{t}_tombstone" for t in ("accounts", "categories", "transactions", "transfers")} <= names
@@ -0,0 +1,132 @@
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.auth.persistence.models.user import User
+from app.core.auth.security import create_access_token
+from app.core.settings import get_settings
+from app.db import session as session_mod
+from app.db.base import Base
+from app.db.session import get_session as app_get_session
+from app.main import create_app
+from app.modules.finance.infrastructure.persistence.models.account import Account
+
+
+PRIMARY = Path("./test_read_primary.db")
+REPLICA = Path("./test_read_replica.db")
+
+
+def _url(path: Path) -> str:
+    return f"sqlite+aiosqlite:///{path}"
+
+
+@pytest.fixture(scope="module")
+def databases():
+    os.environ.setdefault("SECRET_KEY", "test-secret-key-change-me")
+
+    async def init(path: Path, account_name: str) -> None:
+        engine = create_async_engine(_url(path), future=True)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+        async with async_sessionmaker(engine, class_=AsyncSession)() as s:
+            s.add(User(id=1, email="reader@example.com", hashed_password="x"))
+            s.add(Account(user_id=1, name=account_name, currency="BRL"))
+            await s.commit()
+        await engine.dispose()
+
+    # Same schema, different rows: the account name tells which database served a read
+    asyncio.run(init(PRIMARY, "on-primary"))
+    asyncio.run(init(REPLICA, "on-replica"))
+    yield
+    for path in (PRIMARY, REPLICA):
+        path.unlink(missing_ok=True)
+
+
+@pytest.fixture()
+def client(databases, monkeypatch):
+    monkeypatch.setenv("READ_DATABASE_URL", _url(REPLICA))
+    session_mod.reset_read_engine()
+    app = create_app()
+    engine = create_async_engine(_url(PRIMARY), future=True)
+    factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+    async def override_get_session():
+        async with factory() as s:
+            yield s
+
+    app.dependency_overrides[app_get_session] = override_get_session
+    token = create_access_token({"sub": "reader@example.com", "uid": 1}, get_settings())
+    c = TestClient(app, headers={"Authorization": f"Bearer {token}"})
+    yield c
+    session_mod.reset_read_engine()
+
+
+def _names(client: TestClient) -> set[str]:
+    r = client.get("/fin/accounts")
+    assert r.status_code == 200, r.text
+    return {a["name"] for a in r.json()}
+
+
+def test_lists_and_reports_read_from_replica(client):
+    assert _names(client) == {"on-replica"}
+    r = client.get("/fin/reports/balance-by-account?year=2025&month=1")
+    assert r.status_code == 200, r.text
+    # Point reads and writes stay on the primary
+    assert client.get("/fin/accounts/1").json()["name"] == "on-primary"
+
+
+def test_user_reads_primary_after_writing(client, monkeypatch):
+    r = client.post("/fin/accounts", json={"name": "fresh", "currency": "BRL"})
+    assert r.status_code == 201, r.text
+    # Inside the sticky window the replica (which lacks "fresh") is bypassed
+    assert "fresh" in _names(client)
+
+    monkeypatch.setenv("READ_AFTER_WRITE_SECONDS", "0")
+    assert _names(client) == {"on-replica"}
+
+
+def test_without_replica_reads_use_primary(client, monkeypatch):
+    monkeypatch.delenv("READ_DATABASE_URL")
+    session_mod.reset_read_engine()
+    assert "on-primary" in _names(client)
+
+
+def test_report_after_write_does_not_join_older_flight(monkeypatch):
+    from app.modules.finance.application.use_cases.generate_reports import (
+        GenerateBalanceByAccountRequest,
+        GenerateReportsUseCase,
+    )
+
+    session_mod.reset_read_engine()
+    request = GenerateBalanceByAccountRequest(user_id=77, year=2025, month=1)
+    calls: list[int] = []
+
+    async def fake_report(self, req):
+        calls.append(req.user_id)
+        n = len(calls)
+        await asyncio.sleep(0.05)
+        return [n]
+
+    monkeypatch.setattr(GenerateReportsUseCase, "_timed_balance_by_account", fake_report)
+
+    async def run() -> list[object]:
+        use_case = GenerateReportsUseCase(object())
+        before = asyncio.create_task(use_case.generate_balance_by_account(request))
+        await asyncio.sleep(0)
+        joined = asyncio.create_task(use_case.generate_balance_by_account(request))
+        await asyncio.sleep(0)
+        session_mod.note_write(77)
+        after = asyncio.create_task(use_case.generate_balance_by_account(request))
+        return list(await asyncio.gather(before, joined, after))
+
+    try:
+        # The flight started before the write is shared; the later request recomputes
+        assert asyncio.run(run()) == [[1], [1], [2]]
+        assert calls == [77, 77]
+    finally:
+        session_mod.reset_read_engine()
@@ -13,7 +13,7 @@ from app.main import create_app
 from app.db.session import get_session as app_get_session
 from app.db.base import Base
 from app.core.auth.persistence.models.user import User
-from app.core.auth.security import get_current_user
+from app.core.auth.security import get_current_principal
 
 
 DB_FILE = Path("./test_fin_report_flags.db")
@@ -79,7 +79,7 @@ def setup_test_db(app):
 def _as_user(app, user_id: int, email: str):
     async def _get_user():
         return User(id=user_id, email=email, hashed_password="x")
-    app.dependency_overrides[get_current_user] = _get_user
+    app.dependency_overrides[get_current_principal] = _get_user
 
 
 def test_reports_flags_include_closed_and_inactive(client, app):
@@ -12,7 +12,7 @@ from app.db.session import get_session as app_get_session
 from app.db.base import Base
 from app.core.auth.persistence.models.user import User
 from app.modules.finance.infrastructure.persistence.models.fx_rate import FxRate
-from app.core.auth.security import get_current_user
+from app.core.auth.security import get_current_principal
 
 
 DB_FILE = Path("./test_fin_reports_currency.db")
@@ -75,7 +75,7 @@ def setup_test_db(app):
 def _as_user(app, user_id: int, email: str):
     async def _get_user():
         return User(id=user_id, email=email, hashed_password="x")
-    app.dependency_overrides[get_current_user] = _get_user
+    app.dependency_overrides[get_current_principal] = _get_user
 
 
 def test_monthly_by_category_converts_to_report_currency(client, app):
@@ -168,3 +168,45 @@ def test_reports_missing_rate_returns_422(client, app):
     r2 = client.get("/fin/reports/balance-by-account?year=2025&month=2&report_currency=BRL")
     assert r2.status_code == 422
 
+
+
+def test_report_conversion_memoizes_fx_rates(client, app):
+    from app.modules.finance.application.use_cases.generate_reports import FX_CACHE_HITS, FX_CACHE_MISSES
+
+    _as_user(app, 1, "repconv@example.com")
+    hits0 = FX_CACHE_HITS.labels().value
+    misses0 = FX_CACHE_MISSES.labels().value
+
+    # January already holds several EUR transactions on the same days (rates seeded above)
+    r = client.get("/fin/reports/monthly-by-category?year=2025&month=1&report_currency=BRL")
+    assert r.status_code == 200, r.text
+
+    # One DB lookup per distinct (day, pair); repeats come from the per-report cache
+    assert FX_CACHE_MISSES.labels().value - misses0 <= 2
+    assert FX_CACHE_HITS.labels().value - hits0 >= 2
+
+
+def test_monthly_by_category_totals_per_currency(client, app):
+    _as_user(app, 1, "repconv@example.com")
+    eur = client.post("/fin/accounts", json={"name": "EUR_PC", "currency": "EUR"}).json()["id"]
+    jpy = client.post("/fin/accounts", json={"name": "JPY_PC", "currency": "JPY"}).json()["id"]
+    cat = client.post("/fin/categories", json={"name": "PERCUR", "type": "EXPENSE"}).json()["id"]
+    when = dt.datetime(2025, 3, 3, 12, tzinfo=dt.timezone.utc).isoformat()
+    assert client.post("/fin/transactions", json={"account_id": eur, "category_id": cat, "amount": "12.50", "occurred_at": when}).status_code == 201
+    assert client.post("/fin/transactions", json={"account_id": jpy, "category_id": cat, "amount": "1500", "occurred_at": when}).status_code == 201
+
+    r = client.get("/fin/reports/monthly-by-category?year=2025&month=3")
+    assert r.status_code == 200, r.text
+    rows = {(row["category_name"], row["currency"]): row["total"] for row in r.json()}
+    # Amounts in different currencies are never summed together; each uses its own exponent
+    assert rows[("PERCUR", "EUR")] == "-12.50"
+    assert rows[("PERCUR", "JPY")] == "-1500"
+
+
+def test_reports_reject_unknown_report_currency(client, app):
+    _as_user(app, 1, "repconv@example.com")
+    r1 = client.get("/fin/reports/monthly-by-category?year=2025&month=1&report_currency=ABC")
+    assert r1.status_code == 422
+    assert r1.json()["detail"] == "invalid report_currency"
+    r2 = client.get("/fin/reports/balance-by-account?year=2025&month=1&report_currency=XAU")
+    assert r2.status_code == 422
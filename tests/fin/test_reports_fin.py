@@ -14,7 +14,7 @@ from app.main import create_app
 from app.db.session import get_session as app_get_session
 from app.db.base import Base
 from app.core.auth.persistence.models.user import User
-from app.core.auth.security import get_current_user
+from app.core.auth.security import get_current_principal
 
 
 DB_FILE = Path("./test_fin_reports.db")
@@ -81,7 +81,7 @@ def test_reports_balance_and_monthly_by_category(client, app):
     async def _get_user1():
         return User(id=1, email="rep1@example.com", hashed_password="x")
 
-    app.dependency_overrides[get_current_user] = _get_user1
+    app.dependency_overrides[get_current_principal] = _get_user1
 
     # Create account
     r_acc = client.post("/fin/accounts", json={"name": "Main", "currency": "EUR"})
@@ -133,7 +133,7 @@ def test_reports_exclude_voided_and_include_transfers(client, app):
     # act as user 1
     async def _get_user1():
         return User(id=1, email="rep1@example.com", hashed_password="x")
-    app.dependency_overrides[get_current_user] = _get_user1
+    app.dependency_overrides[get_current_principal] = _get_user1
 
     # Separate accounts for this test
     eur = client.post("/fin/accounts", json={"name": "EUR_ACC", "currency": "EUR"}).json()["id"]
@@ -184,7 +184,7 @@ def test_reports_exclude_voided_and_include_transfers(client, app):
 def test_balance_includes_inactive_categories(client, app):
     async def _get_user1():
         return User(id=1, email="rep1@example.com", hashed_password="x")
-    app.dependency_overrides[get_current_user] = _get_user1
+    app.dependency_overrides[get_current_principal] = _get_user1
 
     # Account in EUR
     eur = client.post("/fin/accounts", json={"name": "EUR_ACC2", "currency": "EUR"}).json()["id"]
@@ -6,7 +6,7 @@ from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine, AsyncSession
 
 from app.main import create_app
-from app.core.auth.security import get_current_user
+from app.core.auth.security import get_current_principal
 from app.db.session import get_session as app_get_session
 from app.db.base import Base
 from app.core.auth.persistence.models.user import User
@@ -45,7 +45,7 @@ def _setup_client_and_user():
         async with async_session() as session:
             yield session
 
-    app.dependency_overrides[get_current_user] = _get_user1
+    app.dependency_overrides[get_current_principal] = _get_user1
     app.dependency_overrides[app_get_session] = override_get_session
 
     return app, client
@@ -11,7 +11,7 @@ from app.main import create_app
 from app.db.session import get_session as app_get_session
 from app.db.base import Base
 from app.core.auth.persistence.models.user import User
-from app.core.auth.security import get_current_user
+from app.core.auth.security import get_current_principal
 
 
 DB_FILE = Path("./test_fin_error_paths.db")
@@ -60,7 +60,7 @@ def setup_db(app):
     async def _as_user():
         return User(id=1, email="err@example.com", hashed_password="x")
 
-    app.dependency_overrides[get_current_user] = _as_user
+    app.dependency_overrides[get_current_principal] = _as_user
 
     yield
 
@@ -185,6 +185,9 @@ def test_transactions_not_found_and_update_amount_error(client):
     # Account validators (invalid currency)
     assert client.post("/fin/accounts", json={"name": "Bad", "currency": "EURO"}).status_code == 422
     assert client.patch(f"/fin/accounts/{acc2}", json={"currency": "EU"}).status_code == 422
+    # 3 letters but not an ISO 4217 code
+    assert client.post("/fin/accounts", json={"name": "Bad", "currency": "ABC"}).status_code == 422
+    assert client.patch(f"/fin/accounts/{acc2}", json={"currency": "XAU"}).status_code == 422
 
     # list_transactions invalid filters
     assert client.get("/fin/transactions", params={"type": "foo"}).status_code == 422
@@ -16,7 +16,7 @@ from app.db.session import get_session as app_get_session
 from app.db.base import Base
 from app.core.auth.persistence.models.user import User
 from app.modules.finance.infrastructure.persistence.models.transaction import Transaction
-from app.core.auth.security import get_current_user
+from app.core.auth.security import get_current_principal
 
 
 DB_FILE = Path("./test_fin_transfers.db")
@@ -83,7 +83,7 @@ def setup_test_db(app):
 def _as_user(app, user_id: int, email: str):
     async def _get_user():
         return User(id=user_id, email=email, hashed_password="x")
-    app.dependency_overrides[get_current_user] = _get_user
+    app.dependency_overrides[get_current_principal] = _get_user
 
 
 def test_transfer_with_dst_amount(client, app):
@@ -202,3 +202,63 @@ def test_transfer_same_account_or_invalid_fx(client, app):
         "fx_rate": "0",
     })
     assert r2.status_code == 422
+
+
+def test_list_transfers_keyset_pagination_and_filters(client, app):
+    _as_user(app, 2, "tr2@example.com")
+    eur = client.post("/fin/accounts", json={"name": "EUR-L", "currency": "EUR"}).json()["id"]
+    brl = client.post("/fin/accounts", json={"name": "BRL-L", "currency": "BRL"}).json()["id"]
+    usd = client.post("/fin/accounts", json={"name": "USD-L", "currency": "USD"}).json()["id"]
+
+    created = []
+    for day, dst in ((1, brl), (2, brl), (3, usd), (3, brl)):
+        when = dt.datetime(2025, 2, day, 9, tzinfo=dt.timezone.utc).isoformat()
+        r = client.post("/fin/transfers", json={
+            "src_account_id": eur,
+            "dst_account_id": dst,
+            "src_amount": "10.00",
+            "fx_rate": "5.00",
+            "occurred_at": when,
+        })
+        assert r.status_code == 201, r.text
+        created.append(r.json()["transfer"]["id"])
+
+    # Newest first, ties on occurred_at broken by id desc
+    r1 = client.get("/fin/transfers", params={"limit": 3})
+    assert r1.status_code == 200, r1.text
+    page1 = r1.json()
+    assert [t["id"] for t in page1["items"]] == [created[3], created[2], created[1]]
+    assert page1["next_cursor"]
+    assert page1["items"][0]["fees_per_unit_2dp"] == "0.00"
+
+    page2 = client.get("/fin/transfers", params={"limit": 3, "cursor": page1["next_cursor"]}).json()
+    assert [t["id"] for t in page2["items"]] == [created[0]]
+    assert page2["next_cursor"] is None
+
+    # Pair filter and date range
+    pair = client.get("/fin/transfers", params={"src_account_id": eur, "dst_account_id": usd}).json()
+    assert [t["id"] for t in pair["items"]] == [created[2]]
+    ranged = client.get("/fin/transfers", params={
+        "from_date": "2025-02-02T00:00:00Z",
+        "to_date": "2025-02-02T23:59:59Z",
+        "account_id": brl,
+    }).json()
+    assert [t["id"] for t in ranged["items"]] == [created[1]]
+
+    # Voided transfers are hidden unless requested
+    assert client.post(f"/fin/transfers/{created[0]}/void").status_code == 200
+    visible = client.get("/fin/transfers").json()["items"]
+    assert created[0] not in [t["id"] for t in visible]
+    everything = client.get("/fin/transfers", params={"include_voided": True}).json()["items"]
+    assert created[0] in [t["id"] for t in everything]
+
+    # Other users never see these transfers
+    _as_user(app, 1, "tr1@example.com")
+    others = client.get("/fin/transfers", params={"account_id": eur}).json()["items"]
+    assert others == []
+
+
+def test_list_transfers_invalid_cursor(client, app):
+    _as_user(app, 1, "tr1@example.com")
+    r = client.get("/fin/transfers", params={"cursor": "not-a-cursor"})
+    assert r.status_code == 422
@@ -0,0 +1,114 @@
+import logging
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.middleware.access_log import AccessLogMiddleware, start_queue_logging, stop_queue_logging
+
+
+LOGGER = "test.access_log"
+
+
+def _app(sample_rate: float = 1.0) -> FastAPI:
+    # Dedicated logger: alembic's fileConfig in other tests disables pre-existing ones
+    logger = logging.getLogger(LOGGER)
+    logger.disabled = False
+    app = FastAPI()
+    app.add_middleware(AccessLogMiddleware, sample_rate=sample_rate, logger=logger)
+
+    @app.get("/ok")
+    async def ok() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def gen():
+            for i in range(3):
+                yield f"chunk{i};".encode()
+
+        return StreamingResponse(gen(), media_type="text/plain")
+
+    @app.get("/boom")
+    async def boom() -> None:
+        raise RuntimeError("boom")
+
+    return app
+
+
+def _access_lines(caplog) -> list[str]:
+    return [r.getMessage() for r in caplog.records if r.getMessage().startswith("access:")]
+
+
+def test_request_id_echoed_or_generated(caplog):
+    caplog.set_level(logging.INFO, logger=LOGGER)
+    client = TestClient(_app())
+
+    r = client.get("/ok", headers={"X-Request-ID": "abc-123"})
+    assert r.status_code == 200
+    assert r.headers["X-Request-ID"] == "abc-123"
+
+    r2 = client.get("/ok")
+    generated = r2.headers["X-Request-ID"]
+    assert len(generated) == 36 and generated.count("-") == 4
+
+    lines = _access_lines(caplog)
+    assert len(lines) == 2
+    assert "method=GET path=/ok status=200" in lines[0]
+    assert lines[0].endswith("request_id=abc-123")
+    assert lines[1].endswith(f"request_id={generated}")
+
+
+def test_streaming_response_passes_through(caplog):
+    caplog.set_level(logging.INFO, logger=LOGGER)
+    client = TestClient(_app())
+    r = client.get("/stream")
+    assert r.status_code == 200
+    assert r.text == "chunk0;chunk1;chunk2;"
+    assert "X-Request-ID" in r.headers
+    assert "path=/stream status=200" in _access_lines(caplog)[0]
+
+
+def test_sampling_skips_success_but_keeps_errors(caplog):
+    caplog.set_level(logging.INFO, logger=LOGGER)
+    client = TestClient(_app(sample_rate=0.0), raise_server_exceptions=False)
+
+    assert client.get("/ok").status_code == 200
+    assert client.get("/missing").status_code == 404
+    assert client.get("/boom").status_code == 500
+
+    lines = _access_lines(caplog)
+    assert len(lines) == 2
+    assert "path=/missing status=404" in lines[0]
+    # Exception escaped before the app sent a response
+    assert "path=/boom status=-" in lines[1]
+
+
+def test_queue_logging_moves_and_restores_handlers():
+    logger = logging.getLogger("test.access_log.queue")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    records: list[logging.LogRecord] = []
+
+    class _Collect(logging.Handler):
+        def emit(self, record: logging.LogRecord) -> None:
+            records.append(record)
+
+    target = _Collect()
+    logger.addHandler(target)
+    try:
+        listener = start_queue_logging(logger)
+        assert listener is not None
+        assert target not in logger.handlers
+
+        logger.info("access: %s", "queued")
+        stop_queue_logging(logger, listener)  # flushes the queue
+
+        assert [r.getMessage() for r in records] == ["access: queued"]
+        assert logger.handlers == [target]
+    finally:
+        logger.removeHandler(target)
+
+
+def test_queue_logging_noop_without_handlers():
+    assert start_queue_logging(logging.getLogger("test.access_log.empty")) is None
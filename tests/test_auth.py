@@ -112,3 +112,245 @@ def test_login_invalid_credentials(client):
 def test_me_without_token(client):
     r = client.get("/me")
     assert r.status_code == 401
+
+
+def test_login_rehashes_when_argon2_params_change(client, app, monkeypatch):
+    from sqlalchemy import select
+    from app.core.auth.persistence.models.user import User
+    from app.core.settings import clear_settings_cache
+
+    payload = {"email": "rehash@example.com", "password": "secret123"}
+    assert client.post("/auth/register", json=payload).status_code == 201
+
+    async def _stored_hash() -> str:
+        async for session in app.dependency_overrides[app_get_session]():
+            return (await session.execute(select(User.hashed_password).where(User.email == payload["email"]))).scalar_one()
+        raise AssertionError("no session")
+
+    before = asyncio.run(_stored_hash())
+    assert "t=3" in before
+
+    monkeypatch.setenv("ARGON2_TIME_COST", "2")
+    monkeypatch.setenv("ARGON2_MEMORY_COST", "8192")
+    clear_settings_cache()
+    r = client.post("/auth/login", json=payload)
+    assert r.status_code == 200, r.text
+    after = asyncio.run(_stored_hash())
+    assert after != before and "m=8192,t=2" in after
+
+    # Already upgraded: the next login keeps the hash; a wrong password still fails
+    assert client.post("/auth/login", json=payload).status_code == 200
+    assert asyncio.run(_stored_hash()) == after
+    assert client.post("/auth/login", json={**payload, "password": "wrong"}).status_code == 401
+
+
+def test_password_hashing_runs_off_the_event_loop(monkeypatch):
+    import threading
+    import app.core.auth.security as security
+
+    seen: list[str] = []
+    real = security._hasher
+
+    def _spy():
+        seen.append(threading.current_thread().name)
+        return real()
+
+    monkeypatch.setattr(security, "_hasher", _spy)
+
+    async def _main() -> bool:
+        h = await security.hash_password_async("pw")
+        return await security.verify_password_async("pw", h)
+
+    assert asyncio.run(_main()) is True
+    # verify_password resolves the hasher inside the worker thread
+    assert any(name.startswith("argon2") for name in seen)
+
+
+def _login(client, email: str) -> dict[str, str]:
+    payload = {"email": email, "password": "secret123"}
+    assert client.post("/auth/register", json=payload).status_code == 201
+    r = client.post("/auth/login", json=payload)
+    assert r.status_code == 200, r.text
+    return {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+
+def test_finance_routes_authenticate_from_token_claims(client, monkeypatch):
+    import jwt
+    import app.core.auth.security as security
+    from app.core.settings import get_settings
+
+    headers = _login(client, "claims@example.com")
+    claims = jwt.decode(headers["Authorization"][7:], options={"verify_signature": False})
+    assert isinstance(claims["uid"], int) and claims["jti"] and claims["iat"]
+
+    async def _no_lookup(*args, **kwargs):
+        raise AssertionError("users table queried")
+
+    monkeypatch.setattr(security, "get_user_by_email", _no_lookup)
+    assert client.get("/fin/accounts", headers=headers).status_code == 200
+    monkeypatch.undo()
+
+    # Tokens issued before the uid claim still resolve through the users table
+    legacy = jwt.encode(
+        {"sub": "claims@example.com", "exp": claims["exp"]},
+        get_settings().secret_key,
+        algorithm=get_settings().algorithm,
+    )
+    r = client.get("/fin/accounts", headers={"Authorization": f"Bearer {legacy}"})
+    assert r.status_code == 200, r.text
+
+
+def test_logout_revokes_access_token(client):
+    from app.core.auth.revocation import revocation_store
+
+    headers = _login(client, "logout@example.com")
+    assert client.post("/auth/logout", headers=headers).status_code == 204
+    try:
+        r = client.get("/fin/accounts", headers=headers)
+        assert r.status_code == 401 and r.json()["detail"] == "Token revoked"
+        assert client.get("/me", headers=headers).status_code == 401
+        # Another worker: no local entry, the revocation comes from the table snapshot
+        revocation_store.clear()
+        assert client.get("/fin/accounts", headers=headers).status_code == 401
+        # A fresh login issues a new jti
+        r2 = client.post("/auth/login", json={"email": "logout@example.com", "password": "secret123"})
+        fresh = {"Authorization": f"Bearer {r2.json()['access_token']}"}
+        assert client.get("/fin/accounts", headers=fresh).status_code == 200
+    finally:
+        revocation_store.clear()
+
+
+def test_revocation_list_forgets_expired_entries(monkeypatch):
+    import app.core.auth.revocation as revocation
+
+    now = [50.0]
+    monkeypatch.setattr(revocation.time, "time", lambda: now[0])
+    revoked = revocation.RevocationList()
+    revoked.revoke("old", expires_at=100.0)
+    revoked.revoke("live", expires_at=200.0)
+    now[0] = 150.0
+    assert not revoked.is_revoked("old") and revoked.is_revoked("live")
+    assert not revoked.is_revoked(None) and len(revoked) == 1
+
+
+def test_token_leeway_is_configurable(monkeypatch):
+    import datetime as dt
+    import jwt
+    from app.core.auth.security import decode_access_token
+    from app.core.settings import clear_settings_cache, get_settings
+
+    s = get_settings()
+    expired = jwt.encode(
+        {"sub": "x@example.com", "uid": 1, "exp": dt.datetime.now(dt.UTC) - dt.timedelta(seconds=5)},
+        s.secret_key,
+        algorithm=s.algorithm,
+    )
+    with pytest.raises(jwt.ExpiredSignatureError):
+        decode_access_token(expired, s)
+
+    monkeypatch.setenv("JWT_LEEWAY_SECONDS", "30")
+    clear_settings_cache()
+    assert decode_access_token(expired, get_settings())["uid"] == 1
+
+
+def test_refresh_rotates_and_detects_reuse(client):
+    payload = {"email": "refresh@example.com", "password": "secret123"}
+    assert client.post("/auth/register", json=payload).status_code == 201
+    first = client.post("/auth/login", json=payload).json()
+    assert first["refresh_token"]
+
+    r = client.post("/auth/refresh", json={"refresh_token": first["refresh_token"]})
+    assert r.status_code == 200, r.text
+    second = r.json()
+    assert second["refresh_token"] != first["refresh_token"]
+    assert client.get("/me", headers={"Authorization": f"Bearer {second['access_token']}"}).status_code == 200
+
+    # Replaying the rotated token revokes the whole family, including `second`
+    r = client.post("/auth/refresh", json={"refresh_token": first["refresh_token"]})
+    assert r.status_code == 401 and r.json()["detail"] == "Refresh token reused"
+    assert client.post("/auth/refresh", json={"refresh_token": second["refresh_token"]}).status_code == 401
+    assert client.post("/auth/refresh", json={"refresh_token": "nope"}).status_code == 401
+
+    # A new login starts a new family
+    third = client.post("/auth/login", json=payload).json()
+    assert client.post("/auth/refresh", json={"refresh_token": third["refresh_token"]}).status_code == 200
+
+
+def test_logout_revokes_refresh_family(client):
+    from app.core.auth.revocation import revocation_store
+
+    payload = {"email": "bye@example.com", "password": "secret123"}
+    assert client.post("/auth/register", json=payload).status_code == 201
+    tokens = client.post("/auth/login", json=payload).json()
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    try:
+        r = client.post("/auth/logout", headers=headers, json={"refresh_token": tokens["refresh_token"]})
+        assert r.status_code == 204
+        assert client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]}).status_code == 401
+    finally:
+        revocation_store.clear()
+
+
+def test_bloom_filter_membership():
+    from app.core.auth.revocation import BloomFilter
+
+    items = [f"jti-{i}" for i in range(1000)]
+    bloom = BloomFilter.from_items(items, error_rate=0.01)
+    assert all(item in bloom for item in items)
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+    assert "anything" not in BloomFilter.from_items([])
+
+
+def test_cold_revocation_snapshot_loads_once(monkeypatch):
+    import app.core.auth.revocation as revocation
+
+    loads = []
+
+    async def slow_jtis(session):
+        loads.append(1)
+        await asyncio.sleep(0.01)
+        return ["gone"]
+
+    async def confirmed(session, jti):
+        return jti == "gone"
+
+    monkeypatch.setattr(revocation, "active_revoked_jtis", slow_jtis)
+    monkeypatch.setattr(revocation, "is_access_token_revoked", confirmed)
+    store = revocation.RevocationStore()
+
+    async def burst() -> list[bool]:
+        return await asyncio.gather(*(store.is_revoked(None, jti, max_age=60) for jti in ["gone", "ok"] * 10))
+
+    results = asyncio.run(burst())
+    assert loads == [1]
+    assert results == [True, False] * 10
+
+
+def test_login_purges_expired_tokens_at_most_once_per_interval(client, monkeypatch):
+    import app.core.auth.interfaces.api.auth as auth_api
+    from app.core.settings import clear_settings_cache
+
+    purges = []
+
+    async def fake_purge(session):
+        purges.append(1)
+
+    monkeypatch.setattr(auth_api, "purge_expired_tokens", fake_purge)
+    monkeypatch.setattr(auth_api, "_next_purge", 0.0)
+    payload = {"email": "purge@example.com", "password": "secret123"}
+    assert client.post("/auth/register", json=payload).status_code == 201
+    for _ in range(3):
+        assert client.post("/auth/login", json=payload).status_code == 200
+    assert purges == [1]
+
+    monkeypatch.setenv("TOKEN_PURGE_INTERVAL_SECONDS", "0")
+    clear_settings_cache()
+    monkeypatch.setattr(auth_api, "_next_purge", 0.0)
+    try:
+        assert client.post("/auth/login", json=payload).status_code == 200
+        assert client.post("/auth/login", json=payload).status_code == 200
+        assert purges == [1, 1, 1]
+    finally:
+        monkeypatch.delenv("TOKEN_PURGE_INTERVAL_SECONDS")
+        clear_settings_cache()
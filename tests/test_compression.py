@@ -0,0 +1,110 @@
+import gzip
+
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse, Response, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.middleware import compression
+from app.middleware.compression import CompressionMiddleware, _negotiate
+
+BIG = b'{"amount":"12.50","currency":"EUR"},' * 200
+
+
+async def small(request):
+    return Response(b'{"ok":true}', media_type="application/json")
+
+
+async def big(request):
+    return Response(BIG, media_type="application/json")
+
+
+async def png(request):
+    return Response(BIG, media_type="image/png")
+
+
+async def stream_small(request):
+    async def gen():
+        for _ in range(3):
+            yield b"abc"
+    return StreamingResponse(gen(), media_type="text/plain")
+
+
+async def stream_big(request):
+    async def gen():
+        for _ in range(10):
+            yield BIG
+    return StreamingResponse(gen(), media_type="application/json")
+
+
+def _client(**kwargs) -> TestClient:
+    app = Starlette(routes=[
+        Route("/small", small), Route("/big", big), Route("/png", png),
+        Route("/stream-small", stream_small), Route("/stream-big", stream_big),
+    ])
+    return TestClient(CompressionMiddleware(app, encodings=("gzip",), **kwargs))
+
+
+def _raw_get(client, path, accept="gzip"):
+    # Read the encoded bytes as sent (httpx would transparently decode them)
+    with client.stream("GET", path, headers={"Accept-Encoding": accept}) as r:
+        return r, b"".join(r.iter_raw())
+
+
+def test_small_bodies_are_not_compressed():
+    r, body = _raw_get(_client(), "/small")
+    assert "content-encoding" not in r.headers
+    assert body == b'{"ok":true}'
+    assert r.headers["vary"] == "Accept-Encoding"
+
+
+def test_large_json_is_gzipped_with_length():
+    r, body = _raw_get(_client(), "/big")
+    assert r.headers["content-encoding"] == "gzip"
+    assert int(r.headers["content-length"]) == len(body) < len(BIG)
+    assert gzip.decompress(body) == BIG
+
+
+def test_skips_incompressible_types_and_unwilling_clients():
+    r, body = _raw_get(_client(), "/png")
+    assert "content-encoding" not in r.headers and body == BIG
+    r, body = _raw_get(_client(), "/big", accept="gzip;q=0, identity")
+    assert "content-encoding" not in r.headers and body == BIG
+
+
+def test_streams_below_threshold_go_out_uncompressed():
+    r, body = _raw_get(_client(), "/stream-small")
+    assert "content-encoding" not in r.headers
+    assert body == b"abcabcabc"
+
+
+def test_large_streams_are_compressed_incrementally():
+    r, body = _raw_get(_client(), "/stream-big")
+    assert r.headers["content-encoding"] == "gzip"
+    assert "content-length" not in r.headers
+    assert gzip.decompress(body) == BIG * 10
+
+
+def test_large_chunks_compress_in_worker_thread(monkeypatch):
+    calls = []
+    real = compression.anyio.to_thread.run_sync
+
+    async def spy(fn, *args):
+        calls.append(len(args[0]))
+        return await real(fn, *args)
+
+    monkeypatch.setattr(compression.anyio.to_thread, "run_sync", spy)
+    r, body = _raw_get(_client(thread_size=len(BIG)), "/big")
+    assert gzip.decompress(body) == BIG
+    assert calls == [len(BIG)]
+    calls.clear()
+    _raw_get(_client(thread_size=len(BIG) + 1), "/big")
+    assert calls == []
+
+
+def test_negotiation_prefers_client_weights_then_server_order():
+    assert _negotiate("gzip, br", ("br", "gzip")) == "br"
+    assert _negotiate("gzip;q=1.0, br;q=0.5", ("br", "gzip")) == "gzip"
+    assert _negotiate("*", ("zstd", "gzip")) == "zstd"
+    assert _negotiate("identity", ("gzip",)) is None
+    assert _negotiate("", ("gzip",)) is None
@@ -0,0 +1,69 @@
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db import instrumentation
+from app.middleware.access_log import AccessLogMiddleware
+
+
+LOGGER = "test.db_instrumentation"
+
+
+def _app(engine) -> FastAPI:
+    logger = logging.getLogger(LOGGER)
+    logger.disabled = False
+    app = FastAPI()
+    app.add_middleware(AccessLogMiddleware, logger=logger, db_stats=True)
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int) -> dict[str, int]:
+        async with engine.connect() as conn:
+            for _ in range(3):
+                await conn.execute(text("SELECT 1"))
+        return {"id": item_id}
+
+    @app.get("/nodb")
+    async def nodb() -> dict[str, str]:
+        return {"status": "ok"}
+
+    return app
+
+
+def test_query_count_in_log_and_server_timing(caplog):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    instrumentation.install(engine)
+    instrumentation.install(engine)  # idempotent: statements are not double counted
+    caplog.set_level(logging.INFO, logger=LOGGER)
+
+    with TestClient(_app(engine)) as client:
+        r = client.get("/items/7")
+        assert r.status_code == 200
+        assert 'desc="3 queries"' in r.headers["Server-Timing"]
+
+        r2 = client.get("/nodb")
+        assert 'desc="0 queries"' in r2.headers["Server-Timing"]
+
+    lines = [rec.getMessage() for rec in caplog.records if rec.name == LOGGER]
+    assert "db_queries=3" in lines[0]
+    assert "db_ms=" in lines[0]
+    assert "db_queries=0" in lines[1]
+    # Nothing leaks outside a request
+    assert instrumentation.current() is None
+
+
+def test_slow_queries_logged_with_route(caplog):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    instrumentation.install(engine, slow_ms=0)
+    caplog.set_level(logging.WARNING, logger="uvicorn")
+    instrumentation.logger.disabled = False
+
+    with TestClient(_app(engine)) as client:
+        assert client.get("/items/1").status_code == 200
+
+    slow = [rec.getMessage() for rec in caplog.records if rec.getMessage().startswith("slow query:")]
+    assert len(slow) == 3
+    assert "route=/items/{item_id}" in slow[0]
+    assert "statement=SELECT 1" in slow[0]
@@ -0,0 +1,90 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.metrics import Counter, Gauge, Histogram, Registry
+from app.core.settings import clear_settings_cache
+from app.main import create_app
+
+
+def test_registry_renders_prometheus_text():
+    reg = Registry()
+    c = reg.register(Counter("jobs_total", "Jobs run", ("kind",)))
+    g = reg.register(Gauge("queue_depth", "Queued items"))
+    h = reg.register(Histogram("job_seconds", "Job time", buckets=(0.1, 1.0)))
+
+    c.labels('a"b').inc()
+    c.labels('a"b').inc(2)
+    g.set(3)
+    for v in (0.05, 0.1, 0.5, 7):
+        h.observe(v)
+
+    text = reg.render()
+    assert "# TYPE jobs_total counter" in text
+    assert 'jobs_total{kind="a\\"b"} 3' in text
+    assert "queue_depth 3" in text
+    assert 'job_seconds_bucket{le="0.1"} 2' in text
+    assert 'job_seconds_bucket{le="1"} 3' in text
+    assert 'job_seconds_bucket{le="+Inf"} 4' in text
+    assert "job_seconds_count 4" in text
+    assert "job_seconds_sum 7.65" in text
+
+    # Re-registering returns the same metric; a different shape is rejected
+    assert reg.register(Counter("jobs_total", "Jobs run", ("kind",))) is c
+    try:
+        reg.register(Gauge("jobs_total", "x"))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError")
+
+
+def test_gauge_function_sampled_at_scrape():
+    reg = Registry()
+    g = reg.register(Gauge("pool_size", "Pool size"))
+    value: list[float | None] = [None]
+    g.set_function(lambda: value[0])
+    assert "pool_size" not in reg.render()
+    value[0] = 5
+    assert "pool_size 5" in reg.render()
+
+
+@pytest.fixture()
+def metrics_token(monkeypatch):
+    monkeypatch.setenv("METRICS_TOKEN", "scrape-me")
+    clear_settings_cache()
+    yield "scrape-me"
+    monkeypatch.delenv("METRICS_TOKEN")
+    clear_settings_cache()
+
+
+def test_metrics_endpoint_exposes_route_latency(metrics_token):
+    client = TestClient(create_app())
+    assert client.get("/health").status_code == 200
+    assert client.get("/does-not-exist").status_code == 404
+
+    r = client.get("/metrics", headers={"Authorization": f"Bearer {metrics_token}"})
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = r.text
+    assert 'http_request_duration_seconds_count{method="GET",route="/health"}' in body
+    assert 'route="unmatched"' in body
+    assert "/does-not-exist" not in body
+    assert "http_requests_in_flight" in body
+
+
+def test_metrics_endpoint_requires_token(metrics_token):
+    client = TestClient(create_app())
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+
+
+def test_metrics_endpoint_hidden_without_token():
+    clear_settings_cache()
+    client = TestClient(create_app())
+    assert client.get("/metrics").status_code == 404
+
+
+def test_metrics_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("METRICS_ENABLED", "0")
+    client = TestClient(create_app())
+    assert client.get("/metrics").status_code == 404
@@ -9,7 +9,7 @@ from app.main import create_app
 from app.db.session import get_session as app_get_session
 from app.db.base import Base
 from app.core.auth.persistence.models.user import User
-from app.core.auth.security import get_current_user
+from app.core.auth.security import get_current_principal
 
 
 DB_FILE = Path("./test_modules_flags.db")
@@ -49,7 +49,7 @@ def build_app_with_db(monkeypatch):
     async def _get_user():
         return User(id=1, email="mod@example.com", hashed_password="x")
 
-    app.dependency_overrides[get_current_user] = _get_user
+    app.dependency_overrides[get_current_principal] = _get_user
     return app, engine
 
 
@@ -89,3 +89,39 @@ def test_finance_guard_allows_when_enabled(monkeypatch):
     finally:
         teardown_db(engine)
 
+def test_disabling_mounted_module_applies_on_settings_reload(monkeypatch):
+    from app.core.settings import clear_settings_cache
+
+    monkeypatch.setenv("ENABLE_FINANCE", "true")
+    app, engine = build_app_with_db(monkeypatch)
+    try:
+        with TestClient(app) as client:
+            assert client.get("/fin/accounts").status_code == 200
+            monkeypatch.setenv("ENABLE_FINANCE", "false")
+            clear_settings_cache()  # as a settings reload would
+            assert client.get("/fin/accounts").status_code == 403
+    finally:
+        teardown_db(engine)
+
+
+def test_disabled_module_is_never_imported():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, app.main\n"
+        "loaded = sorted(m for m in sys.modules if m.startswith('app.modules'))\n"
+        "assert not loaded, loaded\n"
+        "assert any(getattr(r, 'path', '') == '/fin/{path:path}' for r in app.main.app.routes)\n"
+    )
+    env = {**os.environ, "SECRET_KEY": "test-secret-key-modules", "ENABLE_FINANCE": "false"}
+    proc = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_disabled_module_paths_still_require_auth(monkeypatch):
+    monkeypatch.setenv("SECRET_KEY", "test-secret-key-modules")
+    monkeypatch.setenv("ENABLE_FINANCE", "false")
+    client = TestClient(create_app())
+    assert client.get("/fin/accounts").status_code == 401
+    assert "/fin/accounts" not in client.get("/openapi.json").json()["paths"]
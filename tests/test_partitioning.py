@@ -0,0 +1,161 @@
+import asyncio
+import datetime as dt
+import os
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.base import Base
+from app.db.partitioning import (
+    MonthlyRangePartitioning,
+    add_months,
+    create_default_partition_sql,
+    create_partition_sql,
+    ensure_future_partitions,
+    maintain_partitions,
+    month_bounds,
+    months_between,
+    partition_name,
+    partitioned_tables,
+)
+from app.modules.finance.infrastructure.persistence.models import transaction as _transaction  # noqa: F401
+
+
+PG_URL = os.getenv("TEST_POSTGRES_URL")
+
+
+def test_month_arithmetic():
+    assert add_months(dt.date(2025, 11, 20), 1) == dt.date(2025, 12, 1)
+    assert add_months(dt.date(2025, 12, 1), 2) == dt.date(2026, 2, 1)
+    assert add_months(dt.date(2025, 1, 31), -1) == dt.date(2024, 12, 1)
+    assert months_between(dt.date(2024, 11, 15), dt.date(2025, 1, 1)) == [
+        dt.date(2024, 11, 1), dt.date(2024, 12, 1), dt.date(2025, 1, 1)
+    ]
+    start, end = month_bounds(2024, 12)
+    assert start == dt.datetime(2024, 12, 1, tzinfo=dt.timezone.utc)
+    assert end == dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+
+
+def test_partition_ddl():
+    assert partition_name("transactions", dt.date(2025, 3, 9)) == "transactions_y2025m03"
+    assert create_partition_sql("transactions", dt.date(2025, 12, 5), parent="transactions_p") == (
+        "CREATE TABLE IF NOT EXISTS transactions_y2025m12 PARTITION OF transactions_p "
+        "FOR VALUES FROM ('2025-12-01 00:00:00+00') TO ('2026-01-01 00:00:00+00')"
+    )
+    assert create_default_partition_sql("transactions") == (
+        "CREATE TABLE IF NOT EXISTS transactions_default PARTITION OF transactions DEFAULT"
+    )
+
+
+def test_transactions_declared_partitioned():
+    assert partitioned_tables(Base.metadata) == {"transactions": MonthlyRangePartitioning("occurred_at")}
+
+
+def test_maintenance_is_noop_off_postgres(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'p.db'}")
+
+    async def run() -> list[str]:
+        try:
+            return await maintain_partitions(engine, Base.metadata, months_ahead=3)
+        finally:
+            await engine.dispose()
+
+    assert asyncio.run(run()) == []
+
+
+def test_maintenance_repeats_until_cancelled(monkeypatch):
+    from app.db import session as session_mod
+
+    calls: list[int] = []
+
+    async def fake_create(months_ahead: int) -> list[str]:
+        calls.append(months_ahead)
+        if len(calls) == 2:
+            raise RuntimeError("db down")  # logged, the loop keeps going
+        return []
+
+    monkeypatch.setattr(session_mod, "create_future_partitions", fake_create)
+
+    async def run() -> None:
+        task = asyncio.create_task(session_mod.partition_maintenance(4, 0.001))
+        while len(calls) < 3:
+            await asyncio.sleep(0.001)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert calls[:3] == [4, 4, 4]
+
+
+def test_lifespan_runs_partition_maintenance_in_background(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import app.main as main_mod
+
+    monkeypatch.setenv("SECRET_KEY", "test-secret-key-change-me")
+    monkeypatch.setenv("PARTITION_MONTHS_AHEAD", "2")
+    monkeypatch.setenv("PARTITION_MAINTENANCE_SECONDS", "3600")
+    state: dict[str, object] = {}
+
+    async def fake_maintenance(months_ahead: int, interval: float) -> None:
+        state["args"] = (months_ahead, interval)
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            state["cancelled"] = True
+            raise
+
+    monkeypatch.setattr(main_mod, "partition_maintenance", fake_maintenance)
+    with TestClient(main_mod.create_app()) as client:
+        assert client.get("/health").status_code == 200
+    assert state == {"args": (2, 3600.0), "cancelled": True}
+
+
+@pytest.mark.skipif(not PG_URL, reason="TEST_POSTGRES_URL not set")
+def test_rows_in_default_partition_move_to_new_month():
+    assert PG_URL is not None
+    engine = create_async_engine(PG_URL)
+    today = dt.date(2030, 5, 14)
+
+    async def run() -> tuple[list[str], dict[str, int], bool]:
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(text("DROP TABLE IF EXISTS part_probe"))
+                await conn.execute(
+                    text(
+                        "CREATE TABLE part_probe (id int, occurred_at timestamptz NOT NULL) "
+                        "PARTITION BY RANGE (occurred_at)"
+                    )
+                )
+                await conn.execute(text(create_default_partition_sql("part_probe")))
+                # June landed in the default partition before its month existed
+                await conn.execute(
+                    text("INSERT INTO part_probe VALUES (1, '2030-06-02 10:00+00'), (2, '2031-01-01 00:00+00')")
+                )
+            async with engine.begin() as conn:
+                created = await ensure_future_partitions(
+                    conn, "part_probe", column="occurred_at", months_ahead=2, today=today
+                )
+            async with engine.connect() as conn:
+                rows = await conn.execute(text("SELECT tableoid::regclass::text, id FROM part_probe"))
+                placement = {table: row_id for table, row_id in rows}
+                attached = bool(
+                    await conn.scalar(
+                        text(
+                            "SELECT 1 FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                            "WHERE c.relname = 'part_probe_default'"
+                        )
+                    )
+                )
+            return created, placement, attached
+        finally:
+            async with engine.begin() as conn:
+                await conn.execute(text("DROP TABLE IF EXISTS part_probe"))
+            await engine.dispose()
+
+    created, placement, attached = asyncio.run(run())
+    assert created == ["part_probe_y2030m05", "part_probe_y2030m06", "part_probe_y2030m07"]
+    assert placement == {"part_probe_y2030m06": 1, "part_probe_default": 2}
+    assert attached
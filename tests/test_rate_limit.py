@@ -0,0 +1,132 @@
+import asyncio
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+import app.core.rate_limit as rate_limit_mod
+from app.core.auth.security import Principal, get_current_principal
+from app.core.rate_limit import MemoryBackend, parse_rate, rate_limit, rate_limit_by_ip, reset_rate_limits
+from app.core.settings import clear_settings_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_buckets():
+    reset_rate_limits()
+    yield
+    reset_rate_limits()
+
+
+def test_parse_rate():
+    assert parse_rate("30/minute") == (0.5, 30)
+    assert parse_rate("5/s") == (5.0, 5)
+    assert parse_rate(" 3600 / hour ") == (1.0, 3600)
+    for bad in ("0/minute", "10/fortnight", "ten/minute"):
+        with pytest.raises(ValueError):
+            parse_rate(bad)
+
+
+def test_memory_bucket_bursts_then_refills(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(rate_limit_mod.time, "monotonic", lambda: now[0])
+    backend = MemoryBackend()
+
+    async def _take() -> float:
+        return await backend.take("k", rate=0.5, burst=2)
+
+    assert asyncio.run(_take()) == 0 and asyncio.run(_take()) == 0
+    assert asyncio.run(_take()) == pytest.approx(2.0)
+    now[0] += 1.0  # half a token back
+    assert asyncio.run(_take()) == pytest.approx(1.0)
+    now[0] += 1.0
+    assert asyncio.run(_take()) == 0
+
+
+def test_memory_backend_evicts_refilled_buckets(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(rate_limit_mod.time, "monotonic", lambda: now[0])
+    backend = MemoryBackend(max_keys=2)
+    for key in ("a", "b"):
+        asyncio.run(backend.take(key, rate=1.0, burst=1))
+    now[0] = 5.0
+    asyncio.run(backend.take("c", rate=1.0, burst=1))
+    assert set(backend._buckets) == {"c"}
+
+
+def _client(monkeypatch, **env: str) -> TestClient:
+    monkeypatch.setenv("RATE_LIMIT_ENABLED", "1")
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    clear_settings_cache()
+
+    app = FastAPI()
+
+    @app.post("/login", dependencies=[Depends(rate_limit_by_ip("auth"))])
+    async def login() -> dict[str, bool]:
+        return {"ok": True}
+
+    @app.get("/report", dependencies=[Depends(rate_limit("reports"))])
+    async def report() -> dict[str, bool]:
+        return {"ok": True}
+
+    @app.get("/list", dependencies=[Depends(rate_limit())])
+    async def listing() -> dict[str, bool]:
+        return {"ok": True}
+
+    current = {"uid": 1}
+    app.dependency_overrides[get_current_principal] = lambda: Principal(id=current["uid"], email="u@example.com")
+    client = TestClient(app)
+    client.current = current  # type: ignore[attr-defined]
+    return client
+
+
+def test_login_limited_by_client_ip(monkeypatch):
+    client = _client(monkeypatch, RATE_LIMIT_AUTH="2/minute")
+    assert client.post("/login").status_code == 200
+    assert client.post("/login").status_code == 200
+    r = client.post("/login")
+    assert r.status_code == 429
+    assert r.json()["detail"] == "Too many requests"
+    assert 1 <= int(r.headers["Retry-After"]) <= 30
+
+
+def test_reports_limited_per_user_and_class(monkeypatch):
+    client = _client(monkeypatch, RATE_LIMIT_REPORTS="1/minute", RATE_LIMIT_DEFAULT="100/minute")
+    assert client.get("/report").status_code == 200
+    assert client.get("/report").status_code == 429
+    # Other route classes and other users keep their own buckets
+    assert client.get("/list").status_code == 200
+    client.current["uid"] = 2  # type: ignore[attr-defined]
+    assert client.get("/report").status_code == 200
+
+
+def test_disabled_by_default(monkeypatch):
+    client = _client(monkeypatch, RATE_LIMIT_AUTH="1/minute")
+    monkeypatch.delenv("RATE_LIMIT_ENABLED")
+    clear_settings_cache()
+    for _ in range(3):
+        assert client.post("/login").status_code == 200
+
+
+def test_memory_eviction_uses_each_buckets_own_refill(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(rate_limit_mod.time, "monotonic", lambda: now[0])
+    backend = MemoryBackend(max_keys=2)
+    login, fast = parse_rate("1/minute"), parse_rate("100/second")
+    assert asyncio.run(backend.take("auth:1.2.3.4", *login)) == 0
+    asyncio.run(backend.take("default:1", *fast))
+    now[0] = 5.0
+    # Over capacity: the refilled fast bucket goes, the empty login bucket stays
+    asyncio.run(backend.take("default:2", *fast))
+    assert set(backend._buckets) == {"auth:1.2.3.4", "default:2"}
+    assert asyncio.run(backend.take("auth:1.2.3.4", *login)) == pytest.approx(55.0)
+
+
+def test_memory_backend_caps_live_buckets_lru(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(rate_limit_mod.time, "monotonic", lambda: now[0])
+    backend = MemoryBackend(max_keys=2)
+    slow = parse_rate("1/hour")
+    for key in ("a", "b", "a", "c"):
+        asyncio.run(backend.take(key, *slow))
+    assert list(backend._buckets) == ["a", "c"]
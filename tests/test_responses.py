@@ -0,0 +1,52 @@
+import datetime as dt
+from decimal import Decimal
+
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.core.responses import ModelResponse, dump_json
+
+
+class _Item(BaseModel):
+    id: int
+    amount: Decimal
+    occurred_at: dt.datetime
+    note: str | None = None
+
+
+_ITEMS = [
+    _Item(id=i, amount=Decimal("12.50") * i, occurred_at=dt.datetime(2025, 1, i, 12, tzinfo=dt.timezone.utc))
+    for i in range(1, 4)
+]
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+
+    @app.get("/default", response_model=list[_Item])
+    async def default() -> list[_Item]:
+        return _ITEMS
+
+    @app.get("/fast", response_model=list[_Item], response_class=ModelResponse)
+    async def fast() -> Response:
+        return ModelResponse(_ITEMS, headers={"ETag": 'W/"x"'})
+
+    return TestClient(app)
+
+
+def test_model_response_matches_default_serialization():
+    client = _client()
+    default = client.get("/default")
+    fast = client.get("/fast")
+    assert fast.status_code == 200
+    assert fast.headers["content-type"] == "application/json"
+    assert fast.headers["etag"] == 'W/"x"'
+    assert fast.json() == default.json()
+    assert fast.json()[0]["amount"] == "12.50"
+
+
+def test_dump_json_handles_models_and_empty_lists():
+    assert dump_json([]) == b"[]"
+    assert dump_json(_ITEMS[0]).startswith(b'{"id":1,"amount":"12.50"')
+    assert dump_json({"n": 1}) == b'{"n":1}'
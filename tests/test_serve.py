@@ -0,0 +1,55 @@
+import asyncio
+import os
+
+from app import serve
+
+
+def test_defaults_follow_cpu_count_and_env(monkeypatch):
+    monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+    monkeypatch.setattr(serve, "default_workers", lambda: 6)
+    # argparse defaults are evaluated at parse time
+    monkeypatch.setenv("KEEPALIVE_TIMEOUT", "120")
+    args = serve.parse_args([])
+    assert args.keep_alive == 120 and args.backlog == 2048
+
+    monkeypatch.setenv("WEB_CONCURRENCY", "3")
+    assert serve.parse_args([]).workers == 3
+    assert serve.parse_args(["--workers", "0"]).workers == 0
+    assert serve.build_config(serve.parse_args(["--workers", "0"]))["workers"] == 1
+
+
+def test_build_config_prefers_fast_loop_and_parser(monkeypatch):
+    monkeypatch.setattr(serve, "_has", lambda module: True)
+    cfg = serve.build_config(serve.parse_args(["--port", "9000", "--graceful-timeout", "10"]))
+    assert cfg["loop"] == "uvloop" and cfg["http"] == "httptools"
+    assert cfg["port"] == 9000 and cfg["timeout_graceful_shutdown"] == 10
+    assert cfg["proxy_headers"] is True and cfg["limit_concurrency"] is None
+
+    monkeypatch.setattr(serve, "_has", lambda module: False)
+    cfg = serve.build_config(serve.parse_args([]))
+    assert cfg["loop"] == "asyncio" and cfg["http"] == "h11"
+
+
+def test_main_preloads_app_and_exports_warmup(monkeypatch):
+    calls = {}
+    monkeypatch.setattr(serve.uvicorn, "run", lambda app, **kw: calls.update(app=app, **kw))
+    monkeypatch.delenv("DB_POOL_WARMUP", raising=False)
+    monkeypatch.delenv("PARTITION_MONTHS_AHEAD", raising=False)
+    serve.main(["--workers", "2", "--db-warmup", "4", "--partition-months", "6"])
+    assert calls["app"] == "app.main:app" and calls["workers"] == 2
+    assert os.environ.pop("DB_POOL_WARMUP") == "4"
+    assert os.environ.pop("PARTITION_MONTHS_AHEAD") == "6"
+
+
+def test_warm_pool_opens_connections(monkeypatch, tmp_path):
+    from app.db import session as session_mod
+
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / 'warm.db'}")
+    monkeypatch.setattr(session_mod, "_engine", None)
+    monkeypatch.setattr(session_mod, "_SessionLocal", None)
+    try:
+        assert asyncio.run(session_mod.warm_pool(3)) == 3
+    finally:
+        engine = session_mod._engine
+        if engine is not None:
+            asyncio.run(engine.dispose())
@@ -0,0 +1,43 @@
+import asyncio
+import os
+import signal
+
+import pytest
+
+from app.core.settings import get_settings, install_reload_signal, reload_settings, remove_reload_signal
+
+
+def test_settings_are_cached_until_reloaded(monkeypatch):
+    first = get_settings()
+    assert get_settings() is first
+    monkeypatch.setenv("ACCESS_TOKEN_EXPIRE_MINUTES", "5")
+    assert get_settings().access_token_expire_minutes == first.access_token_expire_minutes
+    reloaded = reload_settings()
+    assert reloaded.access_token_expire_minutes == 5
+    assert get_settings() is reloaded
+
+    # An invalid environment keeps the previous settings in place
+    monkeypatch.setenv("ACCESS_TOKEN_EXPIRE_MINUTES", "not-a-number")
+    with pytest.raises(Exception):
+        reload_settings()
+    assert get_settings() is reloaded
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGHUP"), reason="SIGHUP is POSIX-only")
+def test_sighup_reloads_settings(monkeypatch):
+    before = get_settings()
+    monkeypatch.setenv("ACCESS_TOKEN_EXPIRE_MINUTES", "7")
+
+    async def _main() -> None:
+        assert install_reload_signal() is True
+        try:
+            os.kill(os.getpid(), signal.SIGHUP)
+            for _ in range(50):
+                if get_settings() is not before:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            remove_reload_signal()
+
+    asyncio.run(_main())
+    assert get_settings().access_token_expire_minutes == 7
@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from app.core.singleflight import SingleFlight
+
+
+def test_concurrent_identical_calls_share_one_computation():
+    flights: SingleFlight[int] = SingleFlight("test")
+    calls = 0
+
+    async def work() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    async def main() -> list[int]:
+        results = await asyncio.gather(*(flights.do("k", work) for _ in range(5)), flights.do("other", work))
+        # Nothing is cached once the flight lands
+        results.append(await flights.do("k", work))
+        return results
+
+    assert asyncio.run(main()) == [42] * 7
+    assert calls == 3 and len(flights) == 0
+
+
+def test_errors_reach_every_waiter():
+    flights: SingleFlight[int] = SingleFlight("test")
+
+    async def fail() -> int:
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def main() -> list[BaseException | int]:
+        return await asyncio.gather(*(flights.do("k", fail) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+def test_follower_takes_over_when_leader_is_cancelled():
+    flights: SingleFlight[str] = SingleFlight("test")
+    calls = 0
+
+    async def work() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def main() -> str:
+        leader = asyncio.create_task(flights.do("k", work))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flights.do("k", work))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(main()) == "done"
+    assert calls == 2
+
+
+def test_report_use_case_coalesces_identical_requests(monkeypatch):
+    from app.modules.finance.application.use_cases import generate_reports as gr
+
+    calls: list[gr.GenerateBalanceByAccountRequest] = []
+
+    async def fake_balance(self, request):
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        return [gr.BalanceByAccountItem(account_id=1, currency="BRL", balance=0)]
+
+    monkeypatch.setattr(gr.GenerateReportsUseCase, "_balance_by_account", fake_balance)
+
+    async def main() -> None:
+        same = [gr.GenerateBalanceByAccountRequest(user_id=1, year=2025, month=1) for _ in range(3)]
+        other = gr.GenerateBalanceByAccountRequest(user_id=2, year=2025, month=1)
+        await asyncio.gather(
+            *(gr.GenerateReportsUseCase(None).generate_balance_by_account(r) for r in [*same, other])
+        )
+
+    asyncio.run(main())
+    assert sorted(r.user_id for r in calls) == [1, 2]